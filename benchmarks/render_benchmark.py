@@ -0,0 +1,262 @@
+"""
+Reproducible render benchmarks.
+
+Renders the bundled models and synthetic spheres from fixed camera positions
+and reports frame times and triangles per second as JSON, so results can be
+compared across versions and between the scalar and the vectorized paths.
+
+Run from the repository root:
+
+    python -m benchmarks.render_benchmark --output results.json
+"""
+import argparse
+import json
+import platform
+import sys
+import time
+
+import numpy as np
+
+from benchmarks.synthetic import uv_sphere
+from math_3d.vec3 import Vec3
+from pipeline.backends.headless import HeadlessBackend
+from pipeline.helpers.model_reader import ModelReader
+from pipeline.rasterizer import make_tiled_rasterizer
+from pipeline.renderer import Renderer
+
+
+MODELS = {
+    "axis": r"models/axis.obj",
+    "ship": r"models/ship.obj",
+    "teapot": r"models/teapot.obj",
+}
+
+SYNTHETIC_SIZES = {
+    "sphere_1k": 1000,
+    "sphere_10k": 10000,
+    "sphere_100k": 100000,
+    "sphere_1m": 1000000,
+}
+
+# Fixed camera positions as (x, y, z, yaw)
+CAMERA_POSITIONS = [
+    (0.0, 0.0, -10.0, 0.0),
+    (0.0, 0.0, -6.0, 0.3),
+    (2.0, 1.0, -12.0, -0.4),
+]
+
+# Ways of rendering a frame:
+#   geometry - Renderer.build_frame only, no output backend
+#   headless - Renderer.render_frame into a HeadlessBackend framebuffer
+#   tiled    - the same, tiles of the framebuffer rasterized by worker processes
+#   canvas   - Renderer.render_frame onto a Tk Canvas, reusing polygons
+#              between frames, needs a display
+#   canvas_immediate - the same, creating new polygons every frame
+MODES = ["geometry", "headless", "tiled", "canvas", "canvas_immediate"]
+
+SCREEN_SIZE = 600
+
+
+def load_mesh(name: str, cache: bool = True):
+    if name in MODELS:
+        return ModelReader.read_obj_model(MODELS[name], cache=cache)
+
+    return uv_sphere(SYNTHETIC_SIZES[name])
+
+
+def _make_canvas():
+    from tkinter import Canvas, Tk
+
+    top = Tk()
+    window = Canvas(top, bg="black", width=SCREEN_SIZE, height=SCREEN_SIZE)
+    window.pack()
+
+    return window
+
+
+def run_case(
+        mesh_name: str,
+        mesh,
+        mode: str,
+        vectorized: bool,
+        frames: int,
+        warmup: int,
+        window=None,
+        rasterizer=None
+) -> dict:
+    """
+    Render one mesh from every camera position and time each frame
+
+    :return: dict with the summary of frame times
+    """
+    backend = None
+
+    if mode == "headless":
+        backend = HeadlessBackend(SCREEN_SIZE, SCREEN_SIZE)
+    elif mode == "tiled":
+        backend = HeadlessBackend(SCREEN_SIZE, SCREEN_SIZE, rasterizer=rasterizer)
+    elif mode == "canvas_immediate":
+        from pipeline.backends.canvas import CanvasBackend
+
+        backend = CanvasBackend()
+    renderer = Renderer(
+        near=0.1,
+        far=100.,
+        fov=90.,
+        screen_height=SCREEN_SIZE,
+        screen_width=SCREEN_SIZE,
+        vectorized=vectorized,
+        backend=backend,
+        objects=[mesh],
+    )
+
+    if window is not None:
+        window.delete("all")  # Items left by the previous case
+
+    frame_times = []
+    drawn = []
+
+    for x, y, z, yaw in CAMERA_POSITIONS:
+        renderer.camera.position = Vec3(x, y, z)
+        renderer.camera.yaw = yaw
+
+        for frame in range(warmup + frames):
+            renderer.invalidate()  # The camera doesn't move, time whole frames anyway
+            start = time.perf_counter()
+
+            if mode == "geometry":
+                triangles, _ = renderer.build_frame(0.0)
+            else:
+                renderer.render_frame(window, 0.0)
+                if window is not None:
+                    window.update_idletasks()
+
+            elapsed = time.perf_counter() - start
+
+            if frame >= warmup:
+                frame_times.append(elapsed)
+                if mode == "geometry":
+                    drawn.append(len(triangles))
+
+    frame_times = np.array(frame_times)
+
+    return {
+        "mesh": mesh_name,
+        "mode": mode,
+        "path": "vectorized" if vectorized else "scalar",
+        "triangles": len(mesh),
+        "vertices": mesh.vertex_count,
+        "frames": len(frame_times),
+        "mean_ms": float(frame_times.mean() * 1000),
+        "p50_ms": float(np.percentile(frame_times, 50) * 1000),
+        "p90_ms": float(np.percentile(frame_times, 90) * 1000),
+        "p99_ms": float(np.percentile(frame_times, 99) * 1000),
+        "min_ms": float(frame_times.min() * 1000),
+        "max_ms": float(frame_times.max() * 1000),
+        "triangles_per_second": float(len(mesh) / frame_times.mean()),
+        "mean_drawn": float(np.mean(drawn)) if drawn else None,
+    }
+
+
+def run_benchmarks(
+        meshes: [str],
+        modes: [str],
+        paths: [str],
+        frames: int,
+        warmup: int,
+        scalar_limit: int,
+        raster_limit: int,
+        workers: int = None,
+        cache: bool = True
+) -> dict:
+    """
+    Run every combination of mesh, mode and path
+
+    :param meshes: Names of meshes from MODELS and SYNTHETIC_SIZES
+    :param modes: Names of modes from MODES
+    :param paths: "vectorized" and/or "scalar"
+    :param frames: Number of timed frames per camera position
+    :param warmup: Number of frames rendered before timing
+    :param scalar_limit: Biggest mesh, in triangles, run on the scalar path
+    :param raster_limit: Biggest mesh, in triangles, run in drawing modes
+    :param workers: Processes of the tiled mode, number of CPUs when None
+    :param cache: bool, read models through the binary mesh cache
+    :return: dict ready to be dumped as JSON
+    """
+    window = _make_canvas() if {"canvas", "canvas_immediate"} & set(modes) else None
+    rasterizer = make_tiled_rasterizer(SCREEN_SIZE, SCREEN_SIZE, workers) if "tiled" in modes else None
+    results = []
+    skipped = []
+
+    for mesh_name in meshes:
+        mesh = load_mesh(mesh_name, cache)
+
+        for mode in modes:
+            for path in paths:
+                case = {"mesh": mesh_name, "mode": mode, "path": path}
+
+                if path == "scalar" and len(mesh) > scalar_limit:
+                    skipped.append(dict(case, reason=f"more than {scalar_limit} triangles for scalar path"))
+                    continue
+
+                if mode != "geometry" and len(mesh) > raster_limit:
+                    skipped.append(dict(case, reason=f"more than {raster_limit} triangles for drawing"))
+                    continue
+
+                result = run_case(
+                    mesh_name, mesh, mode, path == "vectorized", frames, warmup,
+                    window if mode.startswith("canvas") else None, rasterizer,
+                )
+                results.append(result)
+                print(
+                    f"{mesh_name:>12} {mode:>9} {path:>10}: "
+                    f"{result['mean_ms']:10.2f} ms/frame {result['triangles_per_second']:14.0f} tri/s",
+                    file=sys.stderr,
+                )
+
+    if rasterizer is not None:
+        rasterizer.close()
+
+    return {
+        "meta": {
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "python": platform.python_version(),
+            "numpy": np.__version__,
+            "platform": platform.platform(),
+            "screen_size": SCREEN_SIZE,
+            "camera_positions": CAMERA_POSITIONS,
+            "frames": frames,
+            "warmup": warmup,
+            "workers": rasterizer.workers if rasterizer is not None else None,
+        },
+        "results": results,
+        "skipped": skipped,
+    }
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark rendering of bundled and synthetic meshes")
+    parser.add_argument(
+        "--meshes", nargs="+", default=list(MODELS) + list(SYNTHETIC_SIZES),
+        choices=list(MODELS) + list(SYNTHETIC_SIZES),
+    )
+    parser.add_argument("--modes", nargs="+", default=["geometry", "headless"], choices=MODES)
+    parser.add_argument("--paths", nargs="+", default=["vectorized", "scalar"], choices=["vectorized", "scalar"])
+    parser.add_argument("--frames", type=int, default=10, help="timed frames per camera position")
+    parser.add_argument("--warmup", type=int, default=2, help="untimed frames per camera position")
+    parser.add_argument("--scalar-limit", type=int, default=20000, help="biggest mesh for the scalar path")
+    parser.add_argument("--raster-limit", type=int, default=200000, help="biggest mesh for drawing modes")
+    parser.add_argument("--workers", type=int, help="processes of the tiled mode, number of CPUs by default")
+    parser.add_argument("--output", help="JSON file for results, stdout by default")
+    args = parser.parse_args()
+
+    report = run_benchmarks(
+        args.meshes, args.modes, args.paths, args.frames, args.warmup, args.scalar_limit, args.raster_limit,
+        args.workers,
+    )
+
+    if args.output:
+        with open(args.output, "w") as file:
+            json.dump(report, file, indent=2)
+    else:
+        json.dump(report, sys.stdout, indent=2)
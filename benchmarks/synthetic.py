@@ -0,0 +1,53 @@
+"""
+Synthetic meshes of a chosen size for benchmarks.
+"""
+from math import ceil, sqrt
+
+import numpy as np
+
+from pipeline.helpers.mesh import Mesh
+
+
+def uv_sphere(triangle_count: int, radius: float = 3.0) -> Mesh:
+    """
+    Closed sphere made of rings and segments, with about `triangle_count` faces
+
+    :param triangle_count: Number of triangles wanted
+    :param radius: Radius of the sphere
+    :return: Mesh with at least `triangle_count` triangles
+    """
+    # A sphere of n rings and 2n segments has 2 * n * 2n - 2 * 2n triangles
+    rings = max(2, ceil(sqrt((triangle_count + 1) / 4.0)) + 1)
+    segments = 2 * rings
+
+    theta = np.linspace(0.0, np.pi, rings + 1)[1:-1]
+    phi = np.linspace(0.0, 2.0 * np.pi, segments, endpoint=False)
+
+    sin_theta = np.sin(theta)[:, None]
+    ring_vertices = np.stack([
+        radius * sin_theta * np.cos(phi),
+        radius * np.repeat(np.cos(theta)[:, None], segments, axis=1),
+        radius * sin_theta * np.sin(phi),
+    ], axis=-1).reshape(-1, 3)
+
+    vertices = np.concatenate([[[0.0, radius, 0.0]], ring_vertices, [[0.0, -radius, 0.0]]])
+    top, bottom = 0, len(vertices) - 1
+
+    def ring_index(ring, segment):
+        return 1 + ring * segments + segment % segments
+
+    segment = np.arange(segments)
+    faces = [np.stack([np.full(segments, top), ring_index(0, segment + 1), ring_index(0, segment)], axis=1)]
+
+    for ring in range(rings - 2):
+        a = ring_index(ring, segment)
+        b = ring_index(ring, segment + 1)
+        c = ring_index(ring + 1, segment)
+        d = ring_index(ring + 1, segment + 1)
+        faces.append(np.stack([a, b, d], axis=1))
+        faces.append(np.stack([a, d, c], axis=1))
+
+    last = rings - 2
+    faces.append(np.stack([np.full(segments, bottom), ring_index(last, segment), ring_index(last, segment + 1)], axis=1))
+
+    return Mesh(vertices, np.concatenate(faces))
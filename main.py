@@ -3,11 +3,16 @@ from tkinter import (
     Tk,
     NW,
 )
-import time
-import math
+import argparse
 
 from input.CameraMovement import CameraMovement
 from helpers.loggers import get_a_logger
+from pipeline.backends.canvas import CanvasBackend
+from pipeline.backends.framebuffer import FramebufferBackend
+from pipeline.backends.retained_canvas import RetainedCanvasBackend
+from pipeline.frame_loop import FrameLoop
+from pipeline.frame_worker import FrameWorker
+from pipeline.rasterizer import make_tiled_rasterizer
 from pipeline.renderer import Renderer
 
 
@@ -15,6 +20,24 @@ _LOGGER = get_a_logger(__name__)
 
 
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="3D engine written in Python3.6")
+    parser.add_argument(
+        "--backend",
+        choices=["retained", "canvas", "framebuffer", "tiled"],
+        default="retained",
+        help="draw triangles as Canvas polygons reused between frames, as new Canvas polygons every frame, "
+             "rasterize them into a depth-buffered image or rasterize tiles of the image in worker processes",
+    )
+    parser.add_argument("--workers", type=int, help="processes of the tiled backend, number of CPUs by default")
+    parser.add_argument("--stats", action="store_true", help="time every stage of the pipeline and show it")
+    parser.add_argument("--fps", type=float, default=60.0, help="most frames per second, 0 for no limit")
+    parser.add_argument(
+        "--threaded",
+        action="store_true",
+        help="build frames on a worker thread, the window only draws the latest finished frame",
+    )
+    args = parser.parse_args()
+
     print("3D engine written in Python3.6")
     ren = Renderer(
         near=0.1,
@@ -22,6 +45,13 @@ if __name__ == "__main__":
         fov=90.,
         screen_height=600,
         screen_width=600,
+        backend={
+            "retained": RetainedCanvasBackend,
+            "canvas": CanvasBackend,
+            "framebuffer": lambda: FramebufferBackend(600, 600),
+            "tiled": lambda: FramebufferBackend(600, 600, rasterizer=make_tiled_rasterizer(600, 600, args.workers)),
+        }[args.backend](),
+        instrument=args.stats,
     )
 
     top = Tk()
@@ -29,30 +59,31 @@ if __name__ == "__main__":
     window = Canvas(top, bg="black", width=600, height=600)
     window.pack()
 
-    time_1 = time.time()
-    time_2 = time.time()
-    time_diff = 1
-
     # Pack event handler
     camera_movement_handler = CameraMovement(ren.camera)
     top.bind("<KeyPress>", camera_movement_handler.handle_input)
     top.bind("<KeyRelease>", camera_movement_handler.clear_movement)
 
+    if args.threaded:
+        worker = FrameWorker(ren)
+        worker.start()
+        step = worker.advance
+        show_frame = worker.present
+    else:
+        step = ren.advance
+        show_frame = lambda canvas: ren.render_frame(canvas, 0.0)
+
+    def present():
+        # Render frame and show FPS, the camera was already moved by the loop
+        show_frame(window)
+        top.title(f"Python Engine 3D - FPS: {loop.fps:.0f}")
+
     # Main loop
-    while True:
-        # Set FPS
-        try:
-            top.title(f"Python Engine 3D - FPS: {round(1 / time_diff):.0f}")
-        except Exception:
-            pass
-
-        # Render frame, display it and get update from GUI
-        rendered_frame = ren.render_frame(window, time_diff)
-
-        rendered_frame.update_idletasks()
-        rendered_frame.update()
-
-        # Calculate time difference used for keeping stuff in sync
-        time_2 = time.time()
-        time_diff = time_2 - time_1
-        time_1 = time_2
+    loop = FrameLoop(step, present, max_fps=args.fps or None)
+    loop.run(top)
+
+    if args.threaded:
+        worker.stop()
+
+    if args.backend == "tiled":
+        ren.backend.rasterizer.close()
@@ -1,6 +1,8 @@
 from typing import TypeVar, Union
 from math import cos, sin
 
+import numpy as np
+
 from math_3d.vec3 import Vec3
 from helpers.loggers import get_a_logger
 
@@ -8,20 +10,108 @@ from helpers.loggers import get_a_logger
 _LOGGER = get_a_logger(__name__)
 
 
+class _Row:
+    """
+    One row of a Mat4x4, reading and writing the matrix values in place
+    """
+    __slots__ = ("_values", "_start")
+
+    def __init__(self, values: list, start: int):
+        self._values = values
+        self._start = start
+
+    def __getitem__(self, column: int) -> float:
+        return self._values[self._start + range(4)[column]]
+
+    def __setitem__(self, column: int, value: float) -> None:
+        self._values[self._start + range(4)[column]] = value
+
+    def __len__(self) -> int:
+        return 4
+
+    def __iter__(self):
+        return iter(self._values[self._start:self._start + 4])
+
+    def __eq__(self, other) -> bool:
+        return list(self) == list(other)
+
+    __hash__ = None
+
+    def __repr__(self) -> str:
+        return repr(list(self))
+
+
+class _Rows:
+    """
+    Rows of a Mat4x4, so code indexing m[row][column] keeps working
+    """
+    __slots__ = ("_values",)
+
+    def __init__(self, values: list):
+        self._values = values
+
+    def __getitem__(self, row: int) -> _Row:
+        return _Row(self._values, 4 * range(4)[row])
+
+    def __setitem__(self, row: int, values) -> None:
+        start = 4 * range(4)[row]
+        values = list(values)
+
+        if len(values) != 4:
+            raise ValueError("A row of a matrix has 4 values")
+
+        self._values[start:start + 4] = values
+
+    def __len__(self) -> int:
+        return 4
+
+    def __iter__(self):
+        return (self[row] for row in range(4))
+
+    def __eq__(self, other) -> bool:
+        return [list(row) for row in self] == [list(row) for row in other]
+
+    __hash__ = None
+
+
 class Mat4x4:
     """
     Mat4x4 - Matrix with 4 rows and 4 columns.
 
+    Values are kept in a flat list, row by row. Points are row vectors
+    multiplied from the left, so `a @ b` applies `a` first and then `b`.
+
     Supported operations on a matrix:
         TODO Addition (+) \n
         Matrix-Vector or Matrix-Matrix Multiplication (*) \n
+        Composition (@) \n
         TODO Scalar (**) \n
-        TODO Transposition (//) \n
+        Transposition, Inversion \n
     """
     Mat4x4 = TypeVar("Mat4x4")
 
-    def __init__(self):
-        self.m = [[0] * 4 for _ in range(4)]
+    __slots__ = ("_values",)
+
+    def __init__(self, values=None):
+        """
+        :param values: Iterable of 16 values row by row, zeros when None
+        """
+        if values is None:
+            self._values = [0.0] * 16
+        else:
+            self._values = [float(value) for value in values]
+
+            if len(self._values) != 16:
+                raise ValueError("There have to be 16 values for a matrix")
+
+    @property
+    def m(self) -> _Rows:
+        """ Rows of the matrix, m[row][column] reads and writes values in place """
+        return _Rows(self._values)
+
+    @m.setter
+    def m(self, rows) -> None:
+        self._values = [float(value) for row in rows for value in row]
 
     def __mul__(self, other: Union[Vec3, Mat4x4]) -> Union[Vec3, Mat4x4]:
         """
@@ -31,89 +121,267 @@ class Mat4x4:
         """
 
         if isinstance(other, Vec3):
-            x = other.x * self.m[0][0] + other.y * self.m[1][0] + other.z * self.m[2][0] + self.m[3][0]
-            y = other.x * self.m[0][1] + other.y * self.m[1][1] + other.z * self.m[2][1] + self.m[3][1]
-            z = other.x * self.m[0][2] + other.y * self.m[1][2] + other.z * self.m[2][2] + self.m[3][2]
-            w = other.x * self.m[0][3] + other.y * self.m[1][3] + other.z * self.m[2][3] + self.m[3][3]
-
-            if w != 0.:
-                x /= w
-                y /= w
-                z /= w
-
-            return Vec3(x, y, z)
+            return self.transform(other)
         elif isinstance(other, Mat4x4):
             _LOGGER.warning("DEPRECATED METHOD. DON'T USE IT")
             return Mat4x4.multiply_matrix(self, other)
 
+    def __matmul__(self, other: Mat4x4) -> Mat4x4:
+        """ Composition, see compose """
+        return self.compose(other)
+
+    def transform(self, vector: Vec3) -> Vec3:
+        """
+        Transform a point, dividing by w when it isn't 0
+
+        :param vector: Vec3
+        :return: New Vec3
+        """
+        x, y, z, w = self.transform_homogeneous(vector)
+
+        if w != 0.:
+            x /= w
+            y /= w
+            z /= w
+
+        return Vec3(x, y, z)
+
+    def transform_homogeneous(self, vector: Vec3) -> (float, float, float, float):
+        """
+        Transform a point without dividing by w
+
+        :param vector: Vec3
+        :return: Tuple of x, y, z, w
+        """
+        m = self._values
+        x, y, z = vector.x, vector.y, vector.z
+
+        return (
+            x * m[0] + y * m[4] + z * m[8] + m[12],
+            x * m[1] + y * m[5] + z * m[9] + m[13],
+            x * m[2] + y * m[6] + z * m[10] + m[14],
+            x * m[3] + y * m[7] + z * m[11] + m[15],
+        )
+
+    def transform_points(
+            self,
+            points,
+            out: np.ndarray = None,
+            projective: bool = True,
+            divide: bool = True
+    ) -> np.ndarray:
+        """
+        Transform many points at once, the batched form of transform
+
+        :param points: Sequence of Vec3 or array-like of shape (N, 3), or of
+                       shape (N, 4) with w of every point
+        :param out: Array to write results to, new array when None
+        :param projective: bool, False to skip w for affine matrices, points
+                           are then only rotated, scaled and translated
+        :param divide: bool, divide by w where it isn't 0. False keeps w and
+                       gives points of shape (N, 4), e.g. in Clip Space
+        :return: Array of shape (N, 3), or (N, 4) when w is kept
+        """
+        points = self._point_array(points)
+        matrix = self.as_array()
+        keep_w = projective and not divide
+
+        if out is None:
+            out = np.empty((len(points), 4 if keep_w else 3), dtype=np.float64)
+        elif out.shape != (len(points), 4 if keep_w else 3):
+            raise ValueError(f"Output of shape {out.shape} can't hold {len(points)} transformed points")
+
+        rows = matrix[:points.shape[1]]
+        columns = slice(None) if keep_w else slice(3)
+
+        np.matmul(points, rows[:, columns], out=out)
+        if points.shape[1] == 3:
+            out += matrix[3, columns]
+
+        if projective and divide:
+            w = points @ rows[:, 3]
+            if points.shape[1] == 3:
+                w += matrix[3, 3]
+
+            w = w[:, None]
+            np.divide(out, w, out=out, where=w != 0.)
+
+        return out
+
+    @staticmethod
+    def _point_array(points) -> np.ndarray:
+        """ Points as an array of shape (N, 3) or (N, 4) """
+        if isinstance(points, np.ndarray):
+            array = points
+        else:
+            points = list(points)
+            if points and isinstance(points[0], Vec3):
+                points = [(point.x, point.y, point.z) for point in points]
+
+            array = np.array(points, dtype=np.float64).reshape(len(points), -1) if points else np.empty((0, 3))
+
+        if array.ndim != 2 or array.shape[1] not in (3, 4):
+            raise ValueError(f"Points have to be of shape (N, 3) or (N, 4), not {array.shape}")
+
+        return array
+
+    def compose(self, other: Mat4x4) -> Mat4x4:
+        """
+        Matrix product self x other, transforming by self and then by other
+
+        :param other: Mat4x4
+        :return: New Mat4x4
+        """
+        a = self._values
+        b = other._values
+
+        return Mat4x4([
+            a[row] * b[column] + a[row + 1] * b[column + 4] + a[row + 2] * b[column + 8] + a[row + 3] * b[column + 12]
+            for row in (0, 4, 8, 12)
+            for column in range(4)
+        ])
+
+    def transpose(self) -> Mat4x4:
+        """
+        Transposed matrix
+
+        :return: New Mat4x4
+        """
+        m = self._values
+
+        return Mat4x4([m[row + column] for column in range(4) for row in (0, 4, 8, 12)])
+
+    def inverse(self) -> Mat4x4:
+        """
+        Inverse of any invertible matrix, by cofactors
+
+        :return: New Mat4x4
+        """
+        m = self._values
+
+        # Determinants of 2x2 blocks of the upper and lower two rows
+        s0 = m[0] * m[5] - m[4] * m[1]
+        s1 = m[0] * m[6] - m[4] * m[2]
+        s2 = m[0] * m[7] - m[4] * m[3]
+        s3 = m[1] * m[6] - m[5] * m[2]
+        s4 = m[1] * m[7] - m[5] * m[3]
+        s5 = m[2] * m[7] - m[6] * m[3]
+
+        c5 = m[10] * m[15] - m[14] * m[11]
+        c4 = m[9] * m[15] - m[13] * m[11]
+        c3 = m[9] * m[14] - m[13] * m[10]
+        c2 = m[8] * m[15] - m[12] * m[11]
+        c1 = m[8] * m[14] - m[12] * m[10]
+        c0 = m[8] * m[13] - m[12] * m[9]
+
+        determinant = s0 * c5 - s1 * c4 + s2 * c3 + s3 * c2 - s4 * c1 + s5 * c0
+
+        if determinant == 0.:
+            raise ValueError("Matrix can't be inverted, its determinant is 0")
+
+        inverse_determinant = 1.0 / determinant
+
+        return Mat4x4([value * inverse_determinant for value in (
+            m[5] * c5 - m[6] * c4 + m[7] * c3,
+            -m[1] * c5 + m[2] * c4 - m[3] * c3,
+            m[13] * s5 - m[14] * s4 + m[15] * s3,
+            -m[9] * s5 + m[10] * s4 - m[11] * s3,
+
+            -m[4] * c5 + m[6] * c2 - m[7] * c1,
+            m[0] * c5 - m[2] * c2 + m[3] * c1,
+            -m[12] * s5 + m[14] * s2 - m[15] * s1,
+            m[8] * s5 - m[10] * s2 + m[11] * s1,
+
+            m[4] * c4 - m[5] * c2 + m[7] * c0,
+            -m[0] * c4 + m[1] * c2 - m[3] * c0,
+            m[12] * s4 - m[13] * s2 + m[15] * s0,
+            -m[8] * s4 + m[9] * s2 - m[11] * s0,
+
+            -m[4] * c3 + m[5] * c1 - m[6] * c0,
+            m[0] * c3 - m[1] * c1 + m[2] * c0,
+            -m[12] * s3 + m[13] * s1 - m[14] * s0,
+            m[8] * s3 - m[9] * s1 + m[10] * s0,
+        )])
+
+    def copy(self) -> Mat4x4:
+        return Mat4x4(self._values)
+
     @staticmethod
     def x_rotation_matrix(radians: float):
-        matrix = Mat4x4()
-        matrix.m[0][0] = 1.0
-        matrix.m[1][1] = cos(radians)
-        matrix.m[1][2] = sin(radians)
-        matrix.m[2][1] = -sin(radians)
-        matrix.m[2][2] = cos(radians)
-        matrix.m[3][3] = 1.0
+        cosine, sine = cos(radians), sin(radians)
 
-        return matrix
+        return Mat4x4((
+            1.0, 0.0, 0.0, 0.0,
+            0.0, cosine, sine, 0.0,
+            0.0, -sine, cosine, 0.0,
+            0.0, 0.0, 0.0, 1.0,
+        ))
 
     @staticmethod
     def y_rotation_matrix(radians: float):
-        matrix = Mat4x4()
-        matrix.m[0][0] = cos(radians)
-        matrix.m[0][2] = sin(radians)
-        matrix.m[2][0] = -sin(radians)
-        matrix.m[1][1] = 1.0
-        matrix.m[2][2] = cos(radians)
-        matrix.m[3][3] = 1.0
+        cosine, sine = cos(radians), sin(radians)
 
-        return matrix
+        return Mat4x4((
+            cosine, 0.0, sine, 0.0,
+            0.0, 1.0, 0.0, 0.0,
+            -sine, 0.0, cosine, 0.0,
+            0.0, 0.0, 0.0, 1.0,
+        ))
 
     @staticmethod
     def z_rotation_matrix(radians: float):
-        matrix = Mat4x4()
-        matrix.m[0][0] = cos(radians)
-        matrix.m[0][1] = sin(radians)
-        matrix.m[1][0] = -sin(radians)
-        matrix.m[1][1] = cos(radians)
-        matrix.m[2][2] = 1.0
-        matrix.m[3][3] = 1.0
+        cosine, sine = cos(radians), sin(radians)
 
-        return matrix
+        return Mat4x4((
+            cosine, sine, 0.0, 0.0,
+            -sine, cosine, 0.0, 0.0,
+            0.0, 0.0, 1.0, 0.0,
+            0.0, 0.0, 0.0, 1.0,
+        ))
 
     @staticmethod
     def translation_matrix(x: float, y: float, z: float):
-        matrix = Mat4x4()
-        matrix.m[0][0] = 1.0
-        matrix.m[1][1] = 1.0
-        matrix.m[2][2] = 1.0
-        matrix.m[3][3] = 1.0
-        matrix.m[3][0] = x
-        matrix.m[3][1] = y
-        matrix.m[3][2] = z
-
-        return matrix
+        return Mat4x4((
+            1.0, 0.0, 0.0, 0.0,
+            0.0, 1.0, 0.0, 0.0,
+            0.0, 0.0, 1.0, 0.0,
+            x, y, z, 1.0,
+        ))
 
     @staticmethod
     def multiply_matrix(matrix_1: Mat4x4, matrix_2: Mat4x4):
-        matrix = Mat4x4()
-
-        for i in range(0, 4):
-            for j in range(0, 4):
-                matrix.m[i][j] = matrix_1.m[j][0] * matrix_2.m[0][i] + matrix_1.m[j][1] * matrix_2.m[1][i]\
-                                 + matrix_1.m[j][2] * matrix_2.m[2][i] + matrix_1.m[j][3] * matrix_2.m[3][i]
-        return matrix
+        """
+        Transposed product of the matrices, kept for existing callers.
+        Use compose or @ for the plain product.
+        """
+        return matrix_1.compose(matrix_2).transpose()
 
     @staticmethod
     def identity_matrix():
-        matrix = Mat4x4()
-        matrix.m[0][0] = 1.0
-        matrix.m[1][1] = 1.0
-        matrix.m[2][2] = 1.0
-        matrix.m[3][3] = 1.0
+        return Mat4x4((
+            1.0, 0.0, 0.0, 0.0,
+            0.0, 1.0, 0.0, 0.0,
+            0.0, 0.0, 1.0, 0.0,
+            0.0, 0.0, 0.0, 1.0,
+        ))
+
+    @staticmethod
+    def from_array(array: np.ndarray) -> Mat4x4:
+        """
+        Matrix with values of a 4x4 NumPy array
+        :return: Mat4x4
+        """
+        return Mat4x4(np.asarray(array, dtype=np.float64).reshape(16).tolist())
+
+    def as_array(self) -> np.ndarray:
+        """
+        Matrix as a 4x4 NumPy array, for transforming many points at once
+        :return: np.ndarray of shape (4, 4)
+        """
+        return np.array(self._values, dtype=np.float64).reshape(4, 4)
 
-        return matrix
+    def __repr__(self) -> str:
+        return f"Mat4x4({self._values})"
 
     def print_matrix(self):
         """
@@ -16,15 +16,35 @@ class Vec3:
         Dot-product (*) \n
         Cross-product (//) \n
 
+    Addition, subtraction and scalar multiplication also work in place
+    (+=, -=, *=), the *_into methods write results into a given vector.
+
     Can also compare if vectors are equal
     """
     Vec3 = TypeVar("Vec3")
 
+    __slots__ = ("x", "y", "z")
+
     def __init__(self, x: float, y: float, z: float):
         self.x = x
         self.y = y
         self.z = z
 
+    def set(self, x: float, y: float, z: float) -> Vec3:
+        """
+        Overwrite all coordinates
+
+        :return: self
+        """
+        self.x = x
+        self.y = y
+        self.z = z
+
+        return self
+
+    def copy(self) -> Vec3:
+        return Vec3(self.x, self.y, self.z)
+
     def __add__(self, other: Vec3):
         """
         Addition of vectors results to a new vector
@@ -38,6 +58,19 @@ class Vec3:
             z=self.z + other.z
         )
 
+    def __iadd__(self, other: Vec3) -> Vec3:
+        """
+        Add a vector in place
+
+        :param other: Vec3
+        :return: self
+        """
+        self.x += other.x
+        self.y += other.y
+        self.z += other.z
+
+        return self
+
     def __sub__(self, other: Vec3) -> Vec3:
         """
         Subtraction of 2 vectors results to a new vector.
@@ -52,6 +85,19 @@ class Vec3:
             z=self.z - other.z
         )
 
+    def __isub__(self, other: Vec3) -> Vec3:
+        """
+        Subtract a vector in place
+
+        :param other: Vec3
+        :return: self
+        """
+        self.x -= other.x
+        self.y -= other.y
+        self.z -= other.z
+
+        return self
+
     def __mul__(self, other: Union[float, Vec3]) -> Union[float, Vec3]:
         """
         Dot-product of 2 vectors results to a float.
@@ -73,6 +119,23 @@ class Vec3:
                 z=self.z * other
             )
 
+    def __imul__(self, other: float) -> Vec3:
+        """
+        Scalar multiplication in place. Dot-product can't be done in place,
+        so *= with a vector results to a float like *
+
+        :param other: Number
+        :return: self
+        """
+        if isinstance(other, Vec3):
+            return NotImplemented
+
+        self.x *= other
+        self.y *= other
+        self.z *= other
+
+        return self
+
     def __rmul__(self, other: Union[float, Vec3]):
         """
         Returns the exact same values as __mul__
@@ -101,6 +164,50 @@ class Vec3:
             z=c_z
         )
 
+    def add_into(self, other: Vec3, out: Vec3) -> Vec3:
+        """
+        Write sum of vectors into out, which can be one of them
+
+        :param other: Vec3
+        :param out: Vec3
+        :return: out
+        """
+        return out.set(self.x + other.x, self.y + other.y, self.z + other.z)
+
+    def sub_into(self, other: Vec3, out: Vec3) -> Vec3:
+        """
+        Write difference of vectors into out, which can be one of them
+
+        :param other: Vec3
+        :param out: Vec3
+        :return: out
+        """
+        return out.set(self.x - other.x, self.y - other.y, self.z - other.z)
+
+    def scale_into(self, scalar: float, out: Vec3) -> Vec3:
+        """
+        Write vector multiplied by a number into out, which can be self
+
+        :param scalar: Number
+        :param out: Vec3
+        :return: out
+        """
+        return out.set(self.x * scalar, self.y * scalar, self.z * scalar)
+
+    def cross_into(self, other: Vec3, out: Vec3) -> Vec3:
+        """
+        Write cross-product of vectors into out, which can be one of them
+
+        :param other: Vec3
+        :param out: Vec3
+        :return: out
+        """
+        return out.set(
+            self.y*other.z - self.z*other.y,
+            self.z*other.x - self.x*other.z,
+            self.x*other.y - self.y*other.x
+        )
+
     def __eq__(self, other: Vec3) -> bool:
         """
         Comparing if 2 vectors are the same.
@@ -124,7 +231,7 @@ class Vec3:
         """
         Normalize a vector to the unit vector
 
-        :return: None
+        :return: self
         """
 
         length = sqrt(self.x * self.x + self.y * self.y + self.z * self.z)
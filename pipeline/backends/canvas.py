@@ -0,0 +1,84 @@
+"""
+Output backend drawing every triangle as a Canvas polygon.
+"""
+from tkinter import Canvas, NW
+
+import numpy as np
+
+from pipeline.helpers.frame_stats import FrameStats
+from pipeline.helpers.shading import ShadeCache
+
+
+class CanvasBackend:
+    """
+    CanvasBackend - Draw triangles back to front with the painter's algorithm
+    """
+
+    def __init__(self, shades: ShadeCache = None):
+        """
+        :param shades: ShadeCache giving fill colors of triangles
+        """
+        self.shades = shades if shades is not None else ShadeCache()
+
+    def draw_frame(
+            self,
+            window: Canvas,
+            triangles: np.ndarray,
+            angles_to_light: np.ndarray,
+            stats: FrameStats = None
+    ) -> None:
+        """
+        Clear the window and draw triangles on it
+
+        :param window: Canvas to draw on
+        :param triangles: Array of shape (K, 3, 3) with screen-space triangles
+        :param angles_to_light: Array of shape (K,) with intensity of light
+        :param stats: FrameStats to time stages with, None to skip timing
+        """
+        # Clear screen
+        window.delete("all")
+
+        # Sort the triangles using *z-buffer*
+        order = np.argsort(-triangles[:, :, 2].mean(axis=1), kind="stable")
+
+        if stats is not None:
+            stats.lap("depth_sort")
+
+        fills = self.shades.hex_colors(angles_to_light[order])
+
+        if stats is not None:
+            stats.lap("shading")
+
+        # Draw triangles to screen
+        for index, fill in zip(order, fills):
+            self._draw_triangle(triangles[index], fill, window)
+
+        if stats is not None:
+            stats.lap("create_polygon")
+
+    @staticmethod
+    def _draw_triangle(points: np.ndarray, fill: str, window: Canvas) -> None:
+        """
+        Draw triangle to screen
+
+        :param points: Array of shape (3, 3) with screen-space corners
+        :param fill: Color of the triangle like "#00ff00"
+        """
+        points = points[:, :2].ravel().tolist()
+
+        # With wireframe
+        # window.create_polygon(points, outline="red", fill=fill)
+
+        window.create_polygon(points, fill=fill)
+
+    @staticmethod
+    def draw_text(window: Canvas, x: int, y: int, text: str) -> None:
+        """
+        Draw debug text on top of the frame
+
+        :param window: Canvas to draw on
+        :param x: int representing left edge of the text
+        :param y: int representing top edge of the text
+        :param text: Text to be drawn
+        """
+        window.create_text(x, y, anchor=NW, text=text, fill="red")
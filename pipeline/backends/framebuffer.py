@@ -0,0 +1,78 @@
+"""
+Output backend rasterizing triangles into a framebuffer with a depth buffer.
+
+The finished frame is shown on the Canvas as a single image, so the cost of a
+frame depends on the pixels covered and not on the number of Canvas items.
+"""
+from tkinter import Canvas, PhotoImage, NW
+
+import numpy as np
+
+from pipeline.backends.headless import HeadlessBackend
+from pipeline.helpers.frame_stats import FrameStats
+from pipeline.helpers.shading import ShadeCache
+from pipeline.rasterizer import Rasterizer
+
+
+class FramebufferBackend(HeadlessBackend):
+    """
+    FramebufferBackend - Rasterize triangles and show the frame in Tk
+    """
+
+    def __init__(self, width: int, height: int, shades: ShadeCache = None, rasterizer: Rasterizer = None):
+        """
+        :param width: int representing width of the screen
+        :param height: int representing height of the screen
+        :param shades: ShadeCache giving colors of triangles
+        :param rasterizer: Rasterizer or TiledRasterizer of the screen size,
+                           a new Rasterizer when None
+        """
+        super().__init__(width, height, shades, rasterizer)
+        self._image = None
+
+    def draw_frame(
+            self,
+            window: Canvas,
+            triangles: np.ndarray,
+            angles_to_light: np.ndarray,
+            stats: FrameStats = None
+    ) -> None:
+        """
+        Rasterize triangles and show the frame on the window
+
+        :param window: Canvas to draw on
+        :param triangles: Array of shape (K, 3, 3) with screen-space triangles
+        :param angles_to_light: Array of shape (K,) with intensity of light
+        :param stats: FrameStats to time stages with, None to skip timing
+        """
+        self.rasterize(triangles, angles_to_light, stats)
+        self.blit(window, self.rasterizer.to_ppm())
+
+        if stats is not None:
+            stats.lap("blit")
+
+    def draw_text(self, window: Canvas, x: int, y: int, text: str) -> None:
+        """
+        Draw debug text on top of the frame
+
+        :param window: Canvas to draw on
+        :param x: int representing left edge of the text
+        :param y: int representing top edge of the text
+        :param text: Text to be drawn
+        """
+        window.create_text(x, y, anchor=NW, text=text, fill="red")
+
+    def blit(self, window: Canvas, data: bytes) -> None:
+        """
+        Push a frame to the window as one image
+
+        :param window: Canvas to draw on
+        :param data: Frame encoded as PPM, e.g. by Rasterizer.to_ppm
+        """
+        if self._image is None:
+            self._image = PhotoImage(master=window, width=self.rasterizer.width, height=self.rasterizer.height)
+
+        self._image.configure(data=data, format="PPM")
+
+        window.delete("all")
+        window.create_image(0, 0, anchor=NW, image=self._image)
@@ -0,0 +1,68 @@
+"""
+Output backend rasterizing triangles into an in-memory framebuffer.
+
+It doesn't need Tk or a display, frames can be read from the Rasterizer and
+written to image files.
+"""
+import numpy as np
+
+from pipeline.helpers.frame_stats import FrameStats
+from pipeline.helpers.shading import ShadeCache
+from pipeline.rasterizer import Rasterizer
+
+
+class HeadlessBackend:
+    """
+    HeadlessBackend - Draw triangles with the software Rasterizer
+    """
+
+    def __init__(self, width: int, height: int, shades: ShadeCache = None, rasterizer: Rasterizer = None):
+        """
+        :param width: int representing width of the screen
+        :param height: int representing height of the screen
+        :param shades: ShadeCache giving colors of triangles
+        :param rasterizer: Rasterizer or TiledRasterizer of the screen size,
+                           a new Rasterizer when None
+        """
+        self.rasterizer = rasterizer if rasterizer is not None else Rasterizer(width, height)
+        self.shades = shades if shades is not None else ShadeCache()
+
+    def draw_frame(
+            self,
+            window,
+            triangles: np.ndarray,
+            angles_to_light: np.ndarray,
+            stats: FrameStats = None
+    ) -> None:
+        """
+        Rasterize triangles into the framebuffer
+
+        :param window: Not used, there's no window to draw on
+        :param triangles: Array of shape (K, 3, 3) with screen-space triangles
+        :param angles_to_light: Array of shape (K,) with intensity of light
+        :param stats: FrameStats to time stages with, None to skip timing
+        """
+        self.rasterize(triangles, angles_to_light, stats)
+
+    def rasterize(self, triangles: np.ndarray, angles_to_light: np.ndarray, stats: FrameStats = None) -> None:
+        """
+        Draw triangles into the framebuffer
+
+        :param triangles: Array of shape (K, 3, 3) with screen-space triangles
+        :param angles_to_light: Array of shape (K,) with intensity of light
+        :param stats: FrameStats to time stages with, None to skip timing
+        """
+        colors = self.shades.rgb_colors(angles_to_light)
+
+        if stats is not None:
+            stats.lap("shading")
+
+        self.rasterizer.clear()
+        self.rasterizer.draw_triangles(triangles, colors)
+
+        if stats is not None:
+            stats.lap("rasterize")
+
+    def draw_text(self, window, x: int, y: int, text: str) -> None:
+        """ Debug text is not drawn into the framebuffer """
+        pass
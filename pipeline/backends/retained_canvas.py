@@ -0,0 +1,156 @@
+"""
+Output backend keeping Canvas polygons from one frame to the next.
+
+Creating Canvas items is the most expensive part of drawing with Tk. Instead
+of deleting and creating them every frame, this backend keeps a pool of
+polygon items and moves them onto the triangles of the new frame.
+
+Triangles are given to items in depth order: the farthest triangle goes to
+the first item, the next one to the second item and so on. Tk stacks every
+item above the ones created before it, so items are never raised or lowered
+to follow the depth order. All changes of a frame are sent to Tcl as one
+script, items are only created when a frame has more triangles than any
+before it and hidden when it has fewer.
+"""
+from tkinter import Canvas, NW
+
+import numpy as np
+
+from pipeline.helpers.frame_stats import FrameStats
+from pipeline.helpers.shading import ShadeCache
+
+
+class RetainedCanvasBackend:
+    """
+    RetainedCanvasBackend - Draw triangles back to front with reused Canvas polygons
+    """
+
+    # Tag of debug text items, kept above all polygons
+    text_tag = "debug_text"
+
+    def __init__(self, shades: ShadeCache = None):
+        """
+        :param shades: ShadeCache giving fill colors of triangles
+        """
+        self.shades = shades if shades is not None else ShadeCache()
+
+        self._window = None
+        self._items = []  # Polygon items, back to front
+        self._fills = []  # Fill of every polygon item
+        self._shown = 0  # Number of polygon items which are not hidden
+        self._texts = {}  # Text items by their position
+
+    def _use_window(self, window: Canvas) -> None:
+        """ Forget items of the previous window when drawing on another one """
+        if window is not self._window:
+            self._window = window
+            self._items = []
+            self._fills = []
+            self._shown = 0
+            self._texts = {}
+
+    def draw_frame(
+            self,
+            window: Canvas,
+            triangles: np.ndarray,
+            angles_to_light: np.ndarray,
+            stats: FrameStats = None
+    ) -> None:
+        """
+        Move polygons of the window onto triangles of the frame
+
+        :param window: Canvas to draw on, its items are owned by the backend
+        :param triangles: Array of shape (K, 3, 3) with screen-space triangles
+        :param angles_to_light: Array of shape (K,) with intensity of light
+        :param stats: FrameStats to time stages with, None to skip timing
+        """
+        self._use_window(window)
+
+        # Sort the triangles using *z-buffer*
+        order = np.argsort(-triangles[:, :, 2].mean(axis=1), kind="stable")
+
+        if stats is not None:
+            stats.lap("depth_sort")
+
+        fills = self.shades.hex_colors(angles_to_light[order])
+
+        if stats is not None:
+            stats.lap("shading")
+
+        count = len(order)
+        self._create_items(window, count)
+
+        script = self._update_script(str(window), triangles[order, :, :2].reshape(count, 6).tolist(), fills)
+        if script:
+            window.tk.eval(script)
+
+        if stats is not None:
+            stats.lap("update_items")
+
+    def _create_items(self, window: Canvas, count: int) -> None:
+        """
+        Make sure there are at least `count` polygon items
+
+        :param window: Canvas to create items on
+        :param count: Number of triangles in the frame
+        """
+        if count <= len(self._items):
+            return
+
+        for _ in range(count - len(self._items)):
+            self._items.append(window.create_polygon(0, 0, 0, 0, 0, 0, state="hidden"))
+            self._fills.append(None)
+
+        # New items are on top of everything
+        if self._texts:
+            window.tag_raise(self.text_tag)
+
+    def _update_script(self, path: str, points: [[float]], fills: [str]) -> str:
+        """
+        Tcl commands moving, coloring, showing and hiding polygon items
+
+        :param path: Tcl name of the Canvas
+        :param points: List of x and y of the corners of every triangle
+        :param fills: Color of every triangle
+        :return: Commands separated by new lines
+        """
+        items = self._items
+        item_fills = self._fills
+        commands = []
+
+        for index, (corners, fill) in enumerate(zip(points, fills)):
+            item = items[index]
+            commands.append("%s coords %d %.2f %.2f %.2f %.2f %.2f %.2f" % (path, item, *corners))
+
+            if item_fills[index] != fill:
+                commands.append(f"{path} itemconfigure {item} -fill {fill}")
+                item_fills[index] = fill
+
+        count = len(points)
+
+        for item in items[self._shown:count]:
+            commands.append(f"{path} itemconfigure {item} -state normal")
+        for item in items[count:self._shown]:
+            commands.append(f"{path} itemconfigure {item} -state hidden")
+
+        self._shown = count
+
+        return "\n".join(commands)
+
+    def draw_text(self, window: Canvas, x: int, y: int, text: str) -> None:
+        """
+        Draw debug text on top of the frame, reusing the text item at the same position
+
+        :param window: Canvas to draw on
+        :param x: int representing left edge of the text
+        :param y: int representing top edge of the text
+        :param text: Text to be drawn
+        """
+        self._use_window(window)
+
+        item = self._texts.get((x, y))
+
+        if item is None:
+            self._texts[(x, y)] = window.create_text(x, y, anchor=NW, text=text, fill="red", tags=self.text_tag)
+        else:
+            window.itemconfigure(item, text=text)
@@ -0,0 +1,69 @@
+"""
+Render frames without Tk, for offline batch jobs and benchmarks.
+
+Frames go through the same pipeline as the window, into the in-memory
+framebuffer of a HeadlessBackend.
+"""
+import sys
+from typing import BinaryIO, Iterator
+
+import numpy as np
+
+from pipeline.backends.headless import HeadlessBackend
+from pipeline.helpers.image_writer import write_image
+from pipeline.renderer import Renderer
+
+
+def render_frames(renderer: Renderer, frame_count: int, time_step: float) -> Iterator[np.ndarray]:
+    """
+    Render frames one after another
+
+    :param renderer: Renderer using a HeadlessBackend
+    :param frame_count: Number of frames to render
+    :param time_step: Time between frames in seconds, moves the camera
+    :return: Iterator of framebuffers of shape (H, W, 3). The same array is
+             reused for every frame, copy it to keep a frame.
+    """
+    if not isinstance(renderer.backend, HeadlessBackend):
+        raise ValueError("Batch rendering needs a Renderer with a HeadlessBackend")
+
+    for _ in range(frame_count):
+        renderer.render_frame(None, time_step)
+
+        yield renderer.backend.rasterizer.color
+
+
+def write_frames(frames: Iterator[np.ndarray], pattern: str) -> int:
+    """
+    Write every frame to its own image file
+
+    :param frames: Iterator of framebuffers
+    :param pattern: Path of a file with a format field for the frame number,
+                    e.g. "frames/frame_{:04d}.png"
+    :return: Number of frames written
+    """
+    count = 0
+
+    for count, frame in enumerate(frames, start=1):
+        write_image(pattern.format(count - 1), frame)
+
+    return count
+
+
+def write_raw_stream(frames: Iterator[np.ndarray], stream: BinaryIO = None) -> int:
+    """
+    Write frames one after another as raw RGB24 bytes
+
+    :param frames: Iterator of framebuffers
+    :param stream: Binary stream to write to, stdout by default
+    :return: Number of frames written
+    """
+    stream = stream if stream is not None else sys.stdout.buffer
+    count = 0
+
+    for count, frame in enumerate(frames, start=1):
+        stream.write(frame.tobytes())
+
+    stream.flush()
+
+    return count
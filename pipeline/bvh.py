@@ -0,0 +1,192 @@
+"""
+Bounding volume hierarchy over objects of a scene.
+
+Every object is represented by its World Space bounding sphere. The tree
+groups nearby spheres into boxes, so a frustum query skips whole groups of
+objects outside of the view and accepts whole groups inside of it without
+testing their objects one by one. Cost of a query grows with the number of
+visible objects rather than with the size of the scene.
+
+Moving objects are handled by refitting boxes on the path from their leaf to
+the root. Refitting keeps queries correct but lets boxes grow loose when
+objects travel far, `rebuild` restores a tight tree.
+"""
+import numpy as np
+
+
+class BVH:
+    """
+    BVH - Tree of axis-aligned boxes over bounding spheres
+    """
+
+    def __init__(self, centers: np.ndarray, radii: np.ndarray, leaf_size: int = 8):
+        """
+        :param centers: Array of shape (K, 3) with centers of spheres
+        :param radii: Array of shape (K,) with radii of spheres
+        :param leaf_size: Most items kept in a single leaf
+        """
+        self.leaf_size = max(1, leaf_size)
+        self.centers = np.array(centers, dtype=np.float64).reshape(-1, 3)
+        self.radii = np.array(radii, dtype=np.float64).reshape(-1)
+
+        self.rebuild()
+
+    def __len__(self) -> int:
+        """ Number of items in the tree """
+        return len(self.radii)
+
+    def rebuild(self) -> None:
+        """ Build the tree from scratch for the current spheres """
+        self.order = np.arange(len(self), dtype=np.intp)  # Items sorted so every node covers a range
+        self._lower = []
+        self._upper = []
+        self._children = []
+        self._ranges = []
+        self._parents = []
+
+        if len(self):
+            self._build(0, len(self), -1)
+
+        self.lower = np.array(self._lower, dtype=np.float64).reshape(-1, 3)
+        self.upper = np.array(self._upper, dtype=np.float64).reshape(-1, 3)
+        self.children = np.array(self._children, dtype=np.intp).reshape(-1, 2)
+        self.ranges = np.array(self._ranges, dtype=np.intp).reshape(-1, 2)
+        self.parents = np.array(self._parents, dtype=np.intp)
+
+        # Leaf holding every item
+        self.leaf_of = np.empty(len(self), dtype=np.intp)
+        for node in np.flatnonzero(self.children[:, 0] < 0):
+            start, end = self.ranges[node]
+            self.leaf_of[self.order[start:end]] = node
+
+        # Plain lists of nodes for queries, which visit few nodes each and are
+        # faster on floats than on small arrays
+        self._boxes = np.concatenate([self.lower, self.upper], axis=1).tolist()
+        self._child_list = self.children.tolist()
+        self._range_list = self.ranges.tolist()
+
+        del self._lower, self._upper, self._children, self._ranges, self._parents
+
+    def _build(self, start: int, end: int, parent: int) -> int:
+        """
+        Add a node over items order[start:end] and its subtree
+
+        :return: Index of the node
+        """
+        items = self.order[start:end]
+        node = len(self._ranges)
+
+        self._lower.append((self.centers[items] - self.radii[items, None]).min(axis=0))
+        self._upper.append((self.centers[items] + self.radii[items, None]).max(axis=0))
+        self._children.append((-1, -1))
+        self._ranges.append((start, end))
+        self._parents.append(parent)
+
+        if end - start <= self.leaf_size:
+            return node
+
+        # Split at the median center along the longest axis
+        centers = self.centers[items]
+        axis = int(np.argmax(centers.max(axis=0) - centers.min(axis=0)))
+        middle = (end - start) // 2
+        self.order[start:end] = items[np.argpartition(centers[:, axis], middle)]
+
+        left = self._build(start, start + middle, node)
+        right = self._build(start + middle, end, node)
+        self._children[node] = (left, right)
+
+        return node
+
+    def update(self, item: int, center: np.ndarray, radius: float) -> None:
+        """
+        Move the sphere of an item and refit boxes above it
+
+        :param item: Index of the item
+        :param center: Array of shape (3,) with the new center
+        :param radius: The new radius
+        """
+        self.centers[item] = center
+        self.radii[item] = radius
+
+        node = self.leaf_of[item]
+        while node >= 0:
+            left, right = self.children[node]
+
+            if left < 0:
+                start, end = self.ranges[node]
+                items = self.order[start:end]
+                lower = (self.centers[items] - self.radii[items, None]).min(axis=0)
+                upper = (self.centers[items] + self.radii[items, None]).max(axis=0)
+            else:
+                lower = np.minimum(self.lower[left], self.lower[right])
+                upper = np.maximum(self.upper[left], self.upper[right])
+
+            if np.array_equal(lower, self.lower[node]) and np.array_equal(upper, self.upper[node]):
+                break  # Nodes above already fit
+
+            self.lower[node] = lower
+            self.upper[node] = upper
+            self._boxes[node] = lower.tolist() + upper.tolist()
+            node = self.parents[node]
+
+    def query(self, planes: np.ndarray) -> np.ndarray:
+        """
+        Find items whose spheres are at least partly inside of all planes
+
+        :param planes: Array of shape (P, 4) with normalized planes n.p + d >= 0
+        :return: Sorted array of indices of items
+        """
+        if not len(self):
+            return np.empty(0, dtype=np.intp)
+
+        boxes = self._boxes
+        children = self._child_list
+        ranges = self._range_list
+
+        # Per plane, positions in a box of the corners furthest along and against the normal
+        tests = []
+        for nx, ny, nz, d in planes.tolist():
+            far_corner = (3 if nx > 0 else 0, 4 if ny > 0 else 1, 5 if nz > 0 else 2)
+            near_corner = (0 if nx > 0 else 3, 1 if ny > 0 else 4, 2 if nz > 0 else 5)
+            tests.append((nx, ny, nz, d, far_corner, near_corner))
+
+        found = []  # Items inside of all planes
+        candidates = []  # Items of leaves straddling some plane, tested at the end
+
+        # Nodes to visit with the planes their parents were not fully inside of
+        stack = [(0, tests)]
+
+        while stack:
+            node, active = stack.pop()
+            box = boxes[node]
+            straddled = []
+
+            for test in active:
+                nx, ny, nz, d, (fx, fy, fz), (ix, iy, iz) = test
+
+                if nx * box[fx] + ny * box[fy] + nz * box[fz] + d < 0.0:
+                    break  # Box is outside of a plane
+
+                if nx * box[ix] + ny * box[iy] + nz * box[iz] + d < 0.0:
+                    straddled.append(test)
+            else:
+                start, end = ranges[node]
+                left, right = children[node]
+
+                if not straddled:
+                    found.append(self.order[start:end])
+                elif left < 0:
+                    candidates.append(self.order[start:end])
+                else:
+                    stack.append((right, straddled))
+                    stack.append((left, straddled))
+
+        if candidates:
+            items = np.concatenate(candidates)
+            distance = self.centers[items] @ planes[:, :3].T + planes[:, 3]
+            found.append(items[np.all(distance >= -self.radii[items, None], axis=1)])
+
+        if not found:
+            return np.empty(0, dtype=np.intp)
+
+        return np.sort(np.concatenate(found))
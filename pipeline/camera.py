@@ -12,3 +12,23 @@ class Camera:
         self.look_direction = Vec3(0, 0, 1)
         self.yaw = 0
         self.move_direction = None
+
+        self._version = 0
+        self._state = None
+
+    @property
+    def version(self) -> int:
+        """
+        Number which changes whenever position or yaw changed since it was
+        last read. Position can be changed in place, so the state is compared
+        instead of tracking assignments.
+
+        :return: int
+        """
+        state = (self.position.x, self.position.y, self.position.z, self.yaw)
+
+        if state != self._state:
+            self._state = state
+            self._version += 1
+
+        return self._version
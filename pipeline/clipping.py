@@ -0,0 +1,87 @@
+"""
+Clipping of triangles against planes.
+
+A triangle crossing a plane is cut into one or two triangles lying on the
+inner side of it, a triangle fully outside is dropped. All triangles are
+clipped at once, the common case of nothing crossing the plane returns the
+input arrays untouched.
+"""
+import numpy as np
+
+
+def _rotate_corners(triangles: np.ndarray, distance: np.ndarray, first: np.ndarray) -> (np.ndarray, np.ndarray):
+    """
+    Rotate corners of every triangle so corner `first` comes first, keeping
+    the winding order
+
+    :param triangles: Array of shape (K, 3, C)
+    :param distance: Array of shape (K, 3) with distances of corners to plane
+    :param first: Array of shape (K,) with index of the new first corner
+    :return: Rotated triangles and distances
+    """
+    rows = np.arange(len(triangles))[:, None]
+    corners = (first[:, None] + np.arange(3)) % 3
+
+    return triangles[rows, corners], distance[rows, corners]
+
+
+def _intersect(a: np.ndarray, b: np.ndarray, distance_a: np.ndarray, distance_b: np.ndarray) -> np.ndarray:
+    """ Points where edges from a to b cross the plane """
+    t = distance_a / (distance_a - distance_b)
+
+    return a + (b - a) * t[:, None]
+
+
+def clip_triangles(
+        triangles: np.ndarray,
+        light: np.ndarray,
+        normal: np.ndarray,
+        offset: float
+) -> (np.ndarray, np.ndarray):
+    """
+    Clip triangles against plane normal.p + offset >= 0, keeping the inside
+
+    :param triangles: Array of shape (K, 3, C), C is 3 or 4 for homogeneous points
+    :param light: Array of shape (K,) with intensity of light of triangles
+    :param normal: Array of shape (C,) with normal of the plane
+    :param offset: Offset of the plane
+    :return: Clipped triangles of shape (L, 3, C) and their light of shape (L,)
+    """
+    distance = triangles @ normal + offset
+    inside = distance >= 0.
+    inside_count = inside.sum(axis=1)
+
+    if inside_count.min(initial=3) == 3:
+        return triangles, light
+
+    whole = inside_count == 3
+    parts = [triangles[whole]]
+    parts_light = [light[whole]]
+
+    # One corner inside, it's kept with points on both of its edges
+    one = inside_count == 1
+    if one.any():
+        tri, dist = _rotate_corners(triangles[one], distance[one], np.argmax(inside[one], axis=1))
+        a, b, c = tri[:, 0], tri[:, 1], tri[:, 2]
+
+        ab = _intersect(a, b, dist[:, 0], dist[:, 1])
+        ac = _intersect(a, c, dist[:, 0], dist[:, 2])
+
+        parts.append(np.stack([a, ab, ac], axis=1))
+        parts_light.append(light[one])
+
+    # Two corners inside, the quad left after the cut is split in two
+    two = inside_count == 2
+    if two.any():
+        tri, dist = _rotate_corners(triangles[two], distance[two], (np.argmin(inside[two], axis=1) + 1) % 3)
+        a, b, c = tri[:, 0], tri[:, 1], tri[:, 2]
+
+        ac = _intersect(a, c, dist[:, 0], dist[:, 2])
+        bc = _intersect(b, c, dist[:, 1], dist[:, 2])
+
+        parts.append(np.stack([a, b, bc], axis=1))
+        parts.append(np.stack([a, bc, ac], axis=1))
+        parts_light.append(light[two])
+        parts_light.append(light[two])
+
+    return np.concatenate(parts), np.concatenate(parts_light)
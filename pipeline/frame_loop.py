@@ -0,0 +1,132 @@
+"""
+Main loop pacing frames with a fixed timestep.
+
+Everything that moves is advanced in steps of a fixed size, as many as fit
+in the time since the previous frame, so motion doesn't depend on how long
+frames take. One frame is rendered after the steps. Time is read from a
+monotonic clock. With a cap of frames per second the next frame is scheduled
+with Tk `after`, so the loop waits in the Tk event loop instead of spinning.
+"""
+import time
+from typing import Callable
+
+
+class FrameLoop:
+    """
+    FrameLoop - Fixed-timestep updates and paced rendering
+    """
+
+    def __init__(
+            self,
+            step: Callable[[float], None],
+            render: Callable[[], None],
+            *,
+            time_step: float = 1.0 / 120.0,
+            max_fps: float = None,
+            max_steps: int = 8,
+            clock: Callable[[], float] = time.monotonic
+    ):
+        """
+        :param step: Called with time_step to advance the scene by one step
+        :param render: Called once per frame to draw the scene
+        :param time_step: Seconds the scene is advanced by in every step
+        :param max_fps: Most frames per second, None for no limit
+        :param max_steps: Most steps before a frame, time beyond them is
+                          dropped so a slow frame doesn't make the next one
+                          slower too
+        :param clock: Monotonic clock in seconds
+        """
+        if time_step <= 0.0:
+            raise ValueError("Time step has to be positive")
+        if max_fps is not None and max_fps <= 0.0:
+            raise ValueError("Frame rate cap has to be positive")
+
+        self.step = step
+        self.render = render
+        self.time_step = time_step
+        self.max_fps = max_fps
+        self.max_steps = max_steps
+        self.clock = clock
+
+        self.fps = 0.0  # Smoothed frames per second
+        self._last = None
+        self._accumulator = 0.0
+        self._next_frame = None
+        self._root = None
+        self._after_id = None
+
+    def tick(self) -> float:
+        """
+        Advance the scene by the time since the previous tick and render a frame
+
+        :return: Seconds to wait before the next tick
+        """
+        now = self.clock()
+
+        if self._last is None:
+            self._last = now
+            self._next_frame = now
+
+        elapsed = now - self._last
+        self._last = now
+        self._accumulator += elapsed
+
+        steps = 0
+        while self._accumulator >= self.time_step:
+            if steps == self.max_steps:
+                self._accumulator %= self.time_step
+                break
+
+            self.step(self.time_step)
+            self._accumulator -= self.time_step
+            steps += 1
+
+        self.render()
+
+        if elapsed > 0.0:
+            self.fps = 1.0 / elapsed if self.fps == 0.0 else 0.9 * self.fps + 0.1 / elapsed
+
+        if self.max_fps is None:
+            return 0.0
+
+        # Frames are due at a steady rate, a late frame moves the schedule
+        # instead of being followed by a burst of frames catching up
+        self._next_frame += 1.0 / self.max_fps
+        wait = self._next_frame - self.clock()
+
+        if wait < 0.0:
+            self._next_frame -= wait
+            wait = 0.0
+
+        return wait
+
+    def start(self, root) -> None:
+        """
+        Schedule ticks on the event loop of a Tk root
+
+        :param root: Tk root or any widget
+        """
+        self._root = root
+        self._after_id = root.after(0, self._on_timer)
+
+    def stop(self) -> None:
+        """ Cancel the next scheduled tick """
+        if self._after_id is not None:
+            self._root.after_cancel(self._after_id)
+            self._after_id = None
+
+    def run(self, root) -> None:
+        """
+        Schedule ticks and enter the Tk main loop
+
+        :param root: Tk root
+        """
+        self.start(root)
+        root.mainloop()
+
+    def _on_timer(self) -> None:
+        wait = self.tick()
+
+        # Redraw the window now, idle tasks don't run while timers are always due
+        self._root.update_idletasks()
+        self._after_id = self._root.after(round(wait * 1000), self._on_timer)
@@ -0,0 +1,202 @@
+"""
+Building frames on a worker thread while Tk presents them.
+
+The geometry of a frame is built by a worker thread, so the Tk thread only
+draws finished frames and handles input. Every time the Tk thread presents
+a frame it asks the worker for the next one, so the geometry of frame N+1 is
+built while frame N is drawn. Finished frames go through a LatestQueue, when
+the Tk thread falls behind it skips to the newest frame instead of drawing
+old ones.
+
+Backends with a `blit` method, like FramebufferBackend, are rasterized on
+the worker too and the Tk thread only pushes the finished image.
+"""
+import threading
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+from helpers.loggers import get_a_logger
+from pipeline.helpers.frame_stats import FrameStats
+from pipeline.helpers.latest_queue import LatestQueue
+from pipeline.renderer import Renderer
+
+if TYPE_CHECKING:
+    # Only for annotations, frames are built without Tk
+    from tkinter import Canvas
+
+
+_LOGGER = get_a_logger(__name__)
+
+
+class Frame:
+    """
+    Frame - Finished frame handed from the worker to the Tk thread
+    """
+
+    __slots__ = ("triangles", "light", "image", "texts", "stats")
+
+    def __init__(
+            self,
+            triangles: np.ndarray,
+            light: np.ndarray,
+            image: bytes,
+            texts: (str, str),
+            stats: FrameStats
+    ):
+        """
+        :param triangles: Array of shape (K, 3, 3) with screen-space triangles,
+                          None when the frame was already rasterized
+        :param light: Array of shape (K,) with intensity of light, None when
+                      the frame was already rasterized
+        :param image: Rasterized frame encoded as PPM, None when the backend
+                      draws triangles itself
+        :param texts: Debug text, see Renderer.debug_text
+        :param stats: FrameStats of the frame, None without instrumentation
+        """
+        self.triangles = triangles
+        self.light = light
+        self.image = image
+        self.texts = texts
+        self.stats = stats
+
+
+class FrameWorker:
+    """
+    FrameWorker - Build frames of a Renderer on a thread of their own
+    """
+
+    def __init__(self, renderer: Renderer, queue_size: int = 1):
+        """
+        :param renderer: Renderer building the frames, its camera and scene
+                         are read by the worker
+        :param queue_size: Most finished frames waiting to be presented
+        """
+        self.renderer = renderer
+        self.frames = LatestQueue(queue_size)
+        self.presented = 0  # Frames drawn by present
+
+        self._lock = threading.Lock()
+        self._steps = []  # Time steps not applied to the renderer yet
+        self._wanted = threading.Event()  # Set when the next frame should be built
+        self._stopped = False
+        self._error = None
+        self._thread = None
+
+    def start(self) -> None:
+        """ Start the worker thread and build the first frame """
+        if self._thread is not None:
+            raise RuntimeError("Frame worker is already running")
+
+        self._stopped = False
+        self._thread = threading.Thread(target=self._run, name="frame-worker", daemon=True)
+        self._thread.start()
+        self._wanted.set()
+
+    def stop(self, timeout: float = None) -> None:
+        """
+        Stop the worker after the frame it's building
+
+        :param timeout: Most seconds to wait for the thread, None to wait as long as needed
+        """
+        self._stopped = True
+        self._wanted.set()
+
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+
+    def advance(self, time_step: float) -> None:
+        """
+        Queue a step for the scene, applied before the next frame is built
+
+        :param time_step: Seconds to advance the scene by
+        """
+        with self._lock:
+            self._steps.append(time_step)
+
+    def present(self, window: "Canvas") -> bool:
+        """
+        Draw the latest finished frame and ask for the next one. Called on the Tk thread.
+
+        :param window: tkinter Canvas to draw on
+        :return: True when a new frame was drawn, False when none was finished
+        """
+        if self._error is not None:
+            raise RuntimeError("Frame worker failed") from self._error
+
+        frame = self.frames.get_nowait()
+
+        # Build the next frame while this one is drawn
+        self._wanted.set()
+
+        if frame is None:
+            return False
+
+        renderer = self.renderer
+        backend = renderer.backend
+
+        # Time waiting in the queue is not a stage of the frame
+        if frame.stats is not None:
+            frame.stats.restart()
+
+        if frame.image is not None:
+            backend.blit(window, frame.image)
+
+            if frame.stats is not None:
+                frame.stats.lap("blit")
+        else:
+            backend.draw_frame(window, frame.triangles, frame.light, frame.stats)
+
+        renderer.draw_debug_text(window, frame.texts)
+        self.presented += 1
+
+        return True
+
+    def _run(self) -> None:
+        try:
+            while True:
+                self._wanted.wait()
+                self._wanted.clear()
+
+                if self._stopped:
+                    return
+
+                frame = self._build()
+
+                if frame is not None:
+                    self.frames.put(frame)
+        except Exception as error:
+            _LOGGER.exception("Building a frame failed")
+            self._error = error
+
+    def _build(self) -> Frame:
+        """
+        Apply queued steps and build the next frame
+
+        :return: Frame ready to be presented, None when the last one is still current
+        """
+        with self._lock:
+            steps, self._steps = self._steps, []
+
+        renderer = self.renderer
+
+        for time_step in steps:
+            renderer.advance(time_step)
+
+        triangles, light = renderer.build_frame(0.0)
+
+        # The last frame built is presented or waiting in the queue
+        if renderer.frame_reused:
+            return None
+
+        stats = renderer.stats
+        texts = renderer.debug_text(len(triangles))
+        backend = renderer.backend
+
+        if hasattr(backend, "blit"):
+            backend.rasterize(triangles, light, stats)
+            return Frame(None, None, backend.rasterizer.to_ppm(), texts, stats)
+
+        # Renderer buffers are overwritten by the next frame
+        return Frame(triangles.copy(), light.copy(), None, texts, stats)
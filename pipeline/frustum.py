@@ -0,0 +1,90 @@
+"""
+View frustum of the camera, used to skip whole objects outside of the view.
+
+The frustum is kept in View Space, where the camera sits at the origin and
+looks along +Z, so it only depends on the projection and doesn't change when
+the camera moves.
+"""
+import numpy as np
+
+
+class Frustum:
+    """
+    Frustum - Six planes n.p + d >= 0 enclosing everything the camera sees
+    """
+
+    def __init__(
+            self,
+            *,
+            near: float,
+            far: float,
+            x_scale: float,
+            y_scale: float,
+            x_range: (float, float),
+            y_range: (float, float)
+    ):
+        """
+        A point (x, y, z) in View Space is visible when near <= z <= far and
+        its projection x * x_scale / z, y * y_scale / z falls into the ranges.
+
+        :param near: float representing distance to near plane
+        :param far: float representing distance to far plane
+        :param x_scale: Scale of X in the projection matrix
+        :param y_scale: Scale of Y in the projection matrix
+        :param x_range: Tuple of lowest and highest projected X on the screen
+        :param y_range: Tuple of lowest and highest projected Y on the screen
+        """
+        x_low, x_high = x_range
+        y_low, y_high = y_range
+
+        planes = np.array([
+            [0.0, 0.0, 1.0, -near],  # Near
+            [0.0, 0.0, -1.0, far],  # Far
+            [x_scale, 0.0, -x_low, 0.0],  # Left
+            [-x_scale, 0.0, x_high, 0.0],  # Right
+            [0.0, y_scale, -y_low, 0.0],  # Top
+            [0.0, -y_scale, y_high, 0.0],  # Bottom
+        ], dtype=np.float64)
+
+        # Normalize planes so they give distances
+        planes /= np.linalg.norm(planes[:, :3], axis=1, keepdims=True)
+
+        self.planes = planes
+
+    def spheres_visible(self, centers: np.ndarray, radii: np.ndarray) -> np.ndarray:
+        """
+        Test which spheres are at least partly inside of the frustum
+
+        :param centers: Array of shape (K, 3) with View Space centers
+        :param radii: Array of shape (K,) with radii
+        :return: Boolean array of shape (K,)
+        """
+        distance = centers @ self.planes[:, :3].T + self.planes[:, 3]
+
+        return np.all(distance >= -np.asarray(radii)[:, None], axis=1)
+
+    def sphere_visible(self, center: np.ndarray, radius: float) -> bool:
+        """
+        Test if a sphere is at least partly inside of the frustum
+
+        :param center: Array of shape (3,) with View Space center
+        :param radius: Radius of the sphere
+        :return: bool
+        """
+        return bool(self.spheres_visible(np.reshape(center, (1, 3)), np.array([radius]))[0])
+
+    def world_planes(self, camera_view: np.ndarray) -> np.ndarray:
+        """
+        Planes of the frustum moved into World Space
+
+        :param camera_view: Array of shape (4, 4) converting World Space into View Space
+        :return: Array of shape (6, 4) with normalized planes n.p + d >= 0
+        """
+        # n.(p.R + t) + d = (R.n).p + (n.t + d)
+        planes = np.empty_like(self.planes)
+        planes[:, :3] = self.planes[:, :3] @ camera_view[:3, :3].T
+        planes[:, 3] = self.planes[:, :3] @ camera_view[3, :3] + self.planes[:, 3]
+
+        planes /= np.linalg.norm(planes[:, :3], axis=1, keepdims=True)
+
+        return planes
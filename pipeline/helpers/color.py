@@ -5,10 +5,16 @@ Can cast color to RGB and HLS representations.
 For  calculating shadows, RGB doesn't have a `intensity` parameter allowing for
 brighter or darker colors. One solution to this problem is using HLS
 (Hue, Luminance, Saturation) representation of RGB color space.
+
+Whole arrays of colors, e.g. of all triangles of a frame, are converted at
+once by the static *_array functions, which work on NumPy arrays with the
+same value ranges as Color objects.
 """
 import colorsys
 from typing import Union
 
+import numpy as np
+
 
 class Color:
     """
@@ -51,7 +57,7 @@ class Color:
             return list(self.color_values)
 
         # Convert RGB ints to floats
-        as_floats = list(map(lambda value: round(value/255), self.color_values))
+        as_floats = list(map(lambda value: value/255, self.color_values))
 
         # Convert to HLS
         converted = list(colorsys.rgb_to_hls(*as_floats))
@@ -69,6 +75,127 @@ class Color:
         as_hex = "#%02x%02x%02x" % tuple(as_rgb)
         return as_hex
 
+    @staticmethod
+    def rgb_to_hls_array(rgb, validate: bool = True) -> np.ndarray:
+        """
+        Convert many RGB colors to HLS at once
+
+        :param rgb: Array-like of shape (..., 3) with ints in [0, 255]
+        :param validate: bool, check values first. Trusted callers can skip it.
+        :return: Array of shape (..., 3) with Hue in degrees [0, 360),
+                 Luminance and Saturation in [0, 1]
+        """
+        rgb = np.asarray(rgb)
+        if validate:
+            Color.__check_rgb_array(rgb)
+
+        r, g, b = np.moveaxis(rgb.astype(np.float64) / 255, -1, 0)
+        max_c = np.maximum(np.maximum(r, g), b)
+        min_c = np.minimum(np.minimum(r, g), b)
+        range_c = max_c - min_c
+        grey = range_c == 0.0
+
+        hls = np.empty(rgb.shape, dtype=np.float64)
+        luminance = (max_c + min_c) / 2.0
+        hls[..., 1] = luminance
+
+        # Same formulas as colorsys.rgb_to_hls, guarded against dividing by 0
+        divisor = np.where(luminance <= 0.5, max_c + min_c, 2.0 - max_c - min_c)
+        safe_range = np.where(grey, 1.0, range_c)
+        hls[..., 2] = np.where(grey, 0.0, range_c / np.where(grey, 1.0, divisor))
+
+        r_c = (max_c - r) / safe_range
+        g_c = (max_c - g) / safe_range
+        b_c = (max_c - b) / safe_range
+        hue = np.where(r == max_c, b_c - g_c, np.where(g == max_c, 2.0 + r_c - b_c, 4.0 + g_c - r_c))
+        hls[..., 0] = np.where(grey, 0.0, (hue / 6.0) % 1.0) * 360
+
+        return hls
+
+    @staticmethod
+    def hls_to_rgb_array(hls, validate: bool = True) -> np.ndarray:
+        """
+        Convert many HLS colors to RGB at once
+
+        :param hls: Array-like of shape (..., 3) with Hue in degrees [0, 360],
+                    Luminance and Saturation in [0, 1]
+        :param validate: bool, check values first. Trusted callers can skip it.
+        :return: Array of shape (..., 3) of uint8
+        """
+        hls = np.asarray(hls, dtype=np.float64)
+        if validate:
+            Color.__check_hls_array(hls)
+
+        hue = hls[..., 0] / 360
+        luminance = hls[..., 1]
+        saturation = hls[..., 2]
+
+        # Same formulas as colorsys.hls_to_rgb
+        m2 = np.where(luminance <= 0.5, luminance * (1.0 + saturation), luminance + saturation - luminance * saturation)
+        m1 = 2.0 * luminance - m2
+
+        rgb = np.empty(hls.shape, dtype=np.float64)
+        for channel, offset in enumerate((1.0 / 3.0, 0.0, -1.0 / 3.0)):
+            channel_hue = (hue + offset) % 1.0
+            rgb[..., channel] = np.select(
+                [channel_hue < 1.0 / 6.0, channel_hue < 0.5, channel_hue < 2.0 / 3.0],
+                [m1 + (m2 - m1) * channel_hue * 6.0, m2, m1 + (m2 - m1) * (2.0 / 3.0 - channel_hue) * 6.0],
+                m1,
+            )
+
+        rgb[saturation == 0.0] = luminance[saturation == 0.0, None]
+
+        return np.rint(rgb * 255).astype(np.uint8)
+
+    @staticmethod
+    def pack_rgb_array(rgb, validate: bool = True) -> np.ndarray:
+        """
+        Pack many RGB colors into ints like 0xRRGGBB
+
+        :param rgb: Array-like of shape (..., 3) with ints in [0, 255]
+        :param validate: bool, check values first. Trusted callers can skip it.
+        :return: Array of shape (...) of uint32
+        """
+        rgb = np.asarray(rgb)
+        if validate:
+            Color.__check_rgb_array(rgb)
+
+        rgb = rgb.astype(np.uint32)
+
+        return (rgb[..., 0] << 16) | (rgb[..., 1] << 8) | rgb[..., 2]
+
+    @staticmethod
+    def to_hex_array(rgb, validate: bool = True) -> [str]:
+        """
+        Hex strings of many RGB colors
+
+        :param rgb: Array-like of shape (K, 3) with ints in [0, 255]
+        :param validate: bool, check values first. Trusted callers can skip it.
+        :return: List of K strings like "#00ff00"
+        """
+        packed = Color.pack_rgb_array(rgb, validate).reshape(-1)
+
+        return ["#%06x" % value for value in packed.tolist()]
+
+    @staticmethod
+    def __check_rgb_array(rgb):
+        if rgb.shape[-1:] != (3,):
+            raise ValueError(f"Wrong shape: {rgb.shape} - RGB arrays have to end with 3 values")
+
+        if rgb.size and (not np.all(rgb == np.round(rgb)) or rgb.min() < 0 or rgb.max() > 255):
+            raise ValueError("Wrong value - Values for RGB have to be whole numbers between 0 and 255.")
+
+    @staticmethod
+    def __check_hls_array(hls):
+        if hls.shape[-1:] != (3,):
+            raise ValueError(f"Wrong shape: {hls.shape} - HLS arrays have to end with 3 values")
+
+        if hls.size and (hls[..., 0].min() < 0 or hls[..., 0].max() > 360):
+            raise ValueError("Wrong value for Hue - Hue has to be between 0 and 360")
+
+        if hls.size and (hls[..., 1:].min() < 0 or hls[..., 1:].max() > 1):
+            raise ValueError("Wrong value - Luminance and Saturation have to be between 0 and 1")
+
     @staticmethod
     def __validate_values(space, args):
         if space == Color.RGB:
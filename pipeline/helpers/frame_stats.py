@@ -0,0 +1,73 @@
+"""
+Timings and triangle counts of a single frame.
+
+The renderer calls `lap` at the end of every stage of the pipeline, which
+adds the time since the previous lap to that stage. When instrumentation is
+off the renderer doesn't create FrameStats at all.
+"""
+from time import perf_counter
+
+
+class FrameStats:
+    """
+    FrameStats - Per-stage durations and triangle counts of a frame
+    """
+
+    def __init__(self):
+        self.stage_times = {}  # Seconds spent in every stage, in order of first lap
+        self.submitted = 0  # Triangles sent into the pipeline
+        self.culled = 0  # Triangles dropped before drawing
+        self.drawn = 0  # Triangles handed to the output backend
+        self.objects_culled = 0  # Objects skipped as a whole, outside of the view
+        self.clipped = 0  # Triangles cut by the near plane
+        self.simplified = 0  # Triangles left out by drawing simpler levels of detail
+        self._last = perf_counter()
+
+    def lap(self, stage: str) -> None:
+        """
+        Add time since the previous lap to a stage
+
+        :param stage: Name of the stage which just finished
+        """
+        now = perf_counter()
+        self.stage_times[stage] = self.stage_times.get(stage, 0.0) + now - self._last
+        self._last = now
+
+    def restart(self) -> None:
+        """ Don't count time since the previous lap to any stage """
+        self._last = perf_counter()
+
+    @property
+    def total_time(self) -> float:
+        return sum(self.stage_times.values())
+
+    def as_dict(self) -> dict:
+        """
+        Stats as plain values, e.g. for JSON
+
+        :return: dict with stage times in milliseconds and triangle counts
+        """
+        return {
+            "stages_ms": {stage: seconds * 1000 for stage, seconds in self.stage_times.items()},
+            "total_ms": self.total_time * 1000,
+            "submitted": self.submitted,
+            "culled": self.culled,
+            "drawn": self.drawn,
+            "objects_culled": self.objects_culled,
+            "clipped": self.clipped,
+            "simplified": self.simplified,
+        }
+
+    def as_text(self) -> str:
+        """
+        Stats formatted for the debug text on the window
+
+        :return: str
+        """
+        lines = ["Stages:"]
+        lines += [f" {stage}: {seconds * 1000:.2f} ms" for stage, seconds in self.stage_times.items()]
+        lines.append(f" total: {self.total_time * 1000:.2f} ms")
+        lines.append(f"Submitted: {self.submitted} Culled: {self.culled} Drawn: {self.drawn}")
+        lines.append(f"Objects culled: {self.objects_culled} Clipped: {self.clipped} Simplified: {self.simplified}")
+
+        return "\n".join(lines)
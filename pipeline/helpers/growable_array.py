@@ -0,0 +1,65 @@
+"""
+Typed array which grows as rows are appended.
+
+Lists of Python floats take several times the memory of the values they
+hold. Loaders append rows to a GrowableArray instead, which keeps them in a
+NumPy array and doubles its capacity when it runs out, so appending is cheap
+on average and memory stays close to the size of the final array.
+"""
+import numpy as np
+
+
+class GrowableArray:
+    """
+    GrowableArray - NumPy array of rows with amortized appending
+    """
+
+    def __init__(self, shape: tuple = (), dtype=np.float64, capacity: int = 1024):
+        """
+        :param shape: Shape of a single row
+        :param dtype: Type of values kept in the array
+        :param capacity: Number of rows allocated up front
+        """
+        self.shape = tuple(shape)
+        self._array = np.empty((max(1, capacity),) + self.shape, dtype=dtype)
+        self._count = 0
+
+    def __len__(self) -> int:
+        """ Number of rows appended """
+        return self._count
+
+    @property
+    def data(self) -> np.ndarray:
+        """ View of the appended rows, invalidated by growing """
+        return self._array[:self._count]
+
+    def reserve(self, count: int) -> None:
+        """
+        Make room for at least `count` rows in total
+
+        :param count: Number of rows needed
+        """
+        if count > len(self._array):
+            grown = np.empty((max(count, 2 * len(self._array)),) + self.shape, dtype=self._array.dtype)
+            grown[:self._count] = self._array[:self._count]
+            self._array = grown
+
+    def extend(self, rows) -> None:
+        """
+        Append rows
+
+        :param rows: Array-like of shape (K, *shape)
+        """
+        rows = np.asarray(rows, dtype=self._array.dtype).reshape((-1,) + self.shape)
+        self.reserve(self._count + len(rows))
+
+        self._array[self._count:self._count + len(rows)] = rows
+        self._count += len(rows)
+
+    def to_array(self) -> np.ndarray:
+        """
+        Appended rows in an array of exactly their size
+
+        :return: New np.ndarray of shape (len(self), *shape)
+        """
+        return self.data.copy()
@@ -0,0 +1,68 @@
+"""
+Write framebuffers to image files.
+
+Supports binary PPM and PNG, both written with the standard library only.
+"""
+import struct
+import zlib
+
+import numpy as np
+
+
+def encode_ppm(color: np.ndarray) -> bytes:
+    """
+    Encode RGB pixels as a binary PPM image
+
+    :param color: Array of shape (H, W, 3) of uint8
+    :return: bytes of the image
+    """
+    height, width = color.shape[:2]
+    header = f"P6 {width} {height} 255\n".encode("ascii")
+
+    return header + np.ascontiguousarray(color, dtype=np.uint8).tobytes()
+
+
+def _png_chunk(kind: bytes, data: bytes) -> bytes:
+    return struct.pack(">I", len(data)) + kind + data + struct.pack(">I", zlib.crc32(kind + data) & 0xffffffff)
+
+
+def encode_png(color: np.ndarray, compression: int = 1) -> bytes:
+    """
+    Encode RGB pixels as a PNG image
+
+    :param color: Array of shape (H, W, 3) of uint8
+    :param compression: zlib compression level, low values are faster
+    :return: bytes of the image
+    """
+    height, width = color.shape[:2]
+
+    # Every row starts with filter type 0 (None)
+    rows = np.zeros((height, width * 3 + 1), dtype=np.uint8)
+    rows[:, 1:] = color.reshape(height, width * 3)
+
+    header = struct.pack(">IIBBBBB", width, height, 8, 2, 0, 0, 0)  # 8 bit RGB
+
+    return (
+        b"\x89PNG\r\n\x1a\n"
+        + _png_chunk(b"IHDR", header)
+        + _png_chunk(b"IDAT", zlib.compress(rows.tobytes(), compression))
+        + _png_chunk(b"IEND", b"")
+    )
+
+
+def write_image(path: str, color: np.ndarray) -> None:
+    """
+    Write RGB pixels to a .ppm or .png file, based on the extension
+
+    :param path: Path of the file
+    :param color: Array of shape (H, W, 3) of uint8
+    """
+    if path.lower().endswith(".png"):
+        data = encode_png(color)
+    elif path.lower().endswith(".ppm"):
+        data = encode_ppm(color)
+    else:
+        raise ValueError(f"Wrong value: {path} - Image has to be a .png or .ppm file")
+
+    with open(path, "wb") as file:
+        file.write(data)
@@ -0,0 +1,60 @@
+"""
+Many placed copies of one mesh.
+
+Instances keep a reference to a single Mesh and a compact array with the
+matrix placing every copy, the vertices and faces of the mesh are never
+copied. Memory of a scene then grows with its unique meshes and not with
+the number of times they're placed. The renderer transforms all visible
+instances of a mesh with one batched matrix product.
+"""
+from typing import TypeVar
+
+import numpy as np
+
+from math_3d.mat4x4 import Mat4x4
+from pipeline.helpers.mesh import Mesh
+
+
+class Instances:
+    """
+    Instances - One Mesh drawn with many transforms
+    """
+    Instances = TypeVar("Instances")
+
+    def __init__(self, mesh: Mesh, transforms):
+        """
+        :param mesh: Mesh shared by every instance
+        :param transforms: List of Mat4x4 or array-like of shape (K, 4, 4)
+                           with the matrix placing every instance in the
+                           world, applied before the world matrix of the
+                           renderer
+        """
+        if len(transforms) and isinstance(transforms[0], Mat4x4):
+            transforms = [transform.as_array() for transform in transforms]
+
+        self.mesh = mesh
+        self.transforms = np.array(transforms, dtype=np.float64).reshape(-1, 4, 4)
+        self.transforms.flags.writeable = False
+
+    def __len__(self) -> int:
+        """ Number of triangles of all instances """
+        return len(self.mesh) * self.instance_count
+
+    @property
+    def instance_count(self) -> int:
+        return len(self.transforms)
+
+    @staticmethod
+    def from_translations(mesh: Mesh, positions) -> Instances:
+        """
+        Place copies of a mesh at positions, without rotating or scaling them
+
+        :param mesh: Mesh shared by every instance
+        :param positions: Array-like of shape (K, 3) with the translation of every instance
+        :return: Instances
+        """
+        positions = np.asarray(positions, dtype=np.float64).reshape(-1, 3)
+        transforms = np.tile(np.eye(4), (len(positions), 1, 1))
+        transforms[:, 3, :3] = positions
+
+        return Instances(mesh, transforms)
@@ -0,0 +1,64 @@
+"""
+Bounded queue between threads which keeps the newest items.
+
+Putting an item into a full queue drops the oldest one instead of blocking
+the producer, so a consumer falling behind always gets the latest items.
+"""
+import threading
+from collections import deque
+
+
+class LatestQueue:
+    """
+    LatestQueue - Thread-safe bounded queue where the latest items win
+    """
+
+    def __init__(self, maxsize: int = 1):
+        """
+        :param maxsize: Most items kept, older ones are dropped
+        """
+        if maxsize < 1:
+            raise ValueError("Queue has to hold at least one item")
+
+        self._items = deque(maxlen=maxsize)
+        self._condition = threading.Condition()
+        self.dropped = 0  # Items dropped before they were taken
+
+    def __len__(self) -> int:
+        with self._condition:
+            return len(self._items)
+
+    def put(self, item) -> None:
+        """
+        Add an item, dropping the oldest one when the queue is full
+
+        :param item: Any object
+        """
+        with self._condition:
+            if len(self._items) == self._items.maxlen:
+                self.dropped += 1
+
+            self._items.append(item)
+            self._condition.notify()
+
+    def get(self, timeout: float = None):
+        """
+        Take the oldest item kept, waiting for one
+
+        :param timeout: Most seconds to wait, None to wait as long as needed
+        :return: The item, None when the timeout passed
+        """
+        with self._condition:
+            if not self._condition.wait_for(lambda: self._items, timeout):
+                return None
+
+            return self._items.popleft()
+
+    def get_nowait(self):
+        """
+        Take the oldest item kept without waiting
+
+        :return: The item, None when the queue is empty
+        """
+        with self._condition:
+            return self._items.popleft() if self._items else None
@@ -0,0 +1,236 @@
+"""
+Levels of detail of meshes.
+
+Simplified meshes are made by quadric vertex clustering: vertices are
+grouped by the cell of a uniform grid they fall into and every group is
+replaced by a single vertex. Its position minimizes the summed squared
+distance to the planes of the faces around the group (the quadric error of
+Garland and Heckbert), so flat areas stay flat and sharp edges and corners
+stay in place. Faces whose corners end up in fewer than three groups are
+dropped. All of it works on whole arrays, so even big meshes are simplified
+quickly when they're loaded.
+
+The renderer picks a level for every object from the area it covers on the
+screen, see pick_level.
+"""
+from math import ceil
+
+import numpy as np
+
+from pipeline.helpers.mesh import Mesh
+
+
+# Pairs of rows and columns of the 10 distinct entries of a symmetric 4x4 quadric
+_QUADRIC_ENTRIES = [(0, 0), (0, 1), (0, 2), (0, 3), (1, 1), (1, 2), (1, 3), (2, 2), (2, 3), (3, 3)]
+
+# Weight pulling a vertex towards the mean of its group, relative to its
+# quadric, so groups on flat areas don't drift along the plane
+_REGULARIZATION = 1e-3
+
+
+def _row_keys(rows: np.ndarray, base: int) -> np.ndarray:
+    """
+    Single number for every row of three values below base, sorting a 1-D
+    array is much faster than sorting rows
+
+    :param rows: Array of shape (K, 3) of non-negative integers
+    :param base: Bound of the values
+    :return: Array of shape (K,), rows of structured type when numbers would overflow
+    """
+    if base ** 3 < 2 ** 63:
+        rows = rows.astype(np.int64)
+        return (rows[:, 0] * base + rows[:, 1]) * base + rows[:, 2]
+
+    return np.ascontiguousarray(rows).view([("", rows.dtype)] * 3).reshape(-1)
+
+
+def vertex_quadrics(mesh: Mesh) -> np.ndarray:
+    """
+    Sum of quadrics of the planes of faces around every vertex, weighted by area
+
+    :param mesh: Mesh
+    :return: Array of shape (N, 10) with the distinct entries of every quadric
+    """
+    normals = mesh.face_normals
+    length = np.linalg.norm(normals, axis=1)
+
+    # Plane (n, -n . p) scaled by 1 / sqrt(|n|) gives a quadric weighted by twice the area
+    scale = np.divide(1.0, np.sqrt(length), out=np.zeros_like(length), where=length > 0.)
+    planes = np.empty((len(mesh), 4))
+    planes[:, :3] = normals * scale[:, None]
+    planes[:, 3] = -np.einsum("ij,ij->i", planes[:, :3], mesh.vertices[mesh.faces[:, 0]])
+
+    corners = mesh.faces.reshape(-1)
+    quadrics = np.empty((mesh.vertex_count, 10))
+
+    for entry, (row, column) in enumerate(_QUADRIC_ENTRIES):
+        face_quadrics = np.repeat(planes[:, row] * planes[:, column], 3)
+        quadrics[:, entry] = np.bincount(corners, face_quadrics, mesh.vertex_count)
+
+    return quadrics
+
+
+def cluster_vertices(mesh: Mesh, grid_size: float, quadrics: np.ndarray = None) -> Mesh:
+    """
+    Merge vertices falling into the same cell of a grid
+
+    :param mesh: Mesh to simplify
+    :param grid_size: Number of cells along the longest side of the bounds,
+                      can be fractional
+    :param quadrics: vertex_quadrics of the mesh, computed when None
+    :return: New Mesh, faces keep their winding and order
+    """
+    if not len(mesh):
+        return mesh
+
+    if quadrics is None:
+        quadrics = vertex_quadrics(mesh)
+
+    vertices = mesh.vertices
+    low = vertices.min(axis=0)
+    cell_size = float((vertices.max(axis=0) - low).max()) / grid_size or 1.0
+    cell_count = ceil(grid_size)
+
+    cells = np.minimum(((vertices - low) / cell_size).astype(np.int64), cell_count - 1)
+    _, groups = np.unique(_row_keys(cells, cell_count), return_inverse=True)
+    groups = groups.reshape(-1)
+    group_count = int(groups.max()) + 1
+
+    # Sum quadrics of vertices of every group
+    quadrics = np.stack([np.bincount(groups, quadrics[:, entry], group_count) for entry in range(10)], axis=1)
+
+    matrices = np.empty((group_count, 3, 3))
+    for entry, (row, column) in enumerate(_QUADRIC_ENTRIES):
+        if column < 3:
+            matrices[:, row, column] = quadrics[:, entry]
+            matrices[:, column, row] = quadrics[:, entry]
+
+    counts = np.bincount(groups, minlength=group_count)[:, None]
+    means = np.stack([np.bincount(groups, vertices[:, axis], group_count) for axis in range(3)], axis=1) / counts
+
+    # Minimize the quadric error, pulled slightly towards the mean
+    weight = _REGULARIZATION * np.trace(matrices, axis1=1, axis2=2) / 3.0 + 1e-12
+    matrices += weight[:, None, None] * np.eye(3)
+    targets = weight[:, None] * means - quadrics[:, [3, 6, 8]]
+    positions = np.linalg.solve(matrices, targets[:, :, None])[:, :, 0]
+
+    faces = groups[mesh.faces]
+    faces = faces[(faces[:, 0] != faces[:, 1]) & (faces[:, 1] != faces[:, 2]) & (faces[:, 2] != faces[:, 0])]
+
+    # Faces collapsed onto the same groups, rotated to start at the lowest
+    # index so only faces of the same winding count as equal
+    shift = np.argmin(faces, axis=1)
+    rotated = faces[np.arange(len(faces))[:, None], (shift[:, None] + np.arange(3)) % 3]
+    _, first = np.unique(_row_keys(rotated, group_count), return_index=True)
+    faces = faces[np.sort(first)]
+
+    used, faces = np.unique(faces, return_inverse=True)
+
+    return Mesh(positions[used], faces.reshape(-1, 3))
+
+
+def simplify(mesh: Mesh, target_triangles: int, attempts: int = 6, tolerance: float = 0.1) -> Mesh:
+    """
+    Simplify a mesh to about a number of triangles
+
+    :param mesh: Mesh to simplify
+    :param target_triangles: Most triangles wanted
+    :param attempts: Most grid sizes tried
+    :param tolerance: Part of the target which can be missed, a result this
+                      close below the target is taken right away
+    :return: Simplified Mesh with the most triangles not above the target
+             found, the mesh with the fewest triangles if none was
+    """
+    quadrics = vertex_quadrics(mesh)
+
+    # Faces of a surface grow with the square of the grid size
+    grid_size = max(2.0, np.sqrt(target_triangles / 2.0))
+    best = None
+    fewest = None
+
+    for _ in range(attempts):
+        simplified = cluster_vertices(mesh, grid_size, quadrics)
+        count = len(simplified)
+
+        if count <= target_triangles and (best is None or count > len(best)):
+            best = simplified
+        if fewest is None or count < len(fewest):
+            fewest = simplified
+
+        if (1.0 - tolerance) * target_triangles <= count <= target_triangles or count == 0:
+            break
+
+        grid_size = max(2.0, grid_size * np.sqrt(target_triangles / count))
+
+    return best if best is not None else fewest
+
+
+def build_lods(mesh: Mesh, levels: int = 3, ratio: float = 0.25, min_triangles: int = 64) -> [Mesh]:
+    """
+    Chain of simplified meshes, each one simplified from the one before
+
+    :param mesh: Mesh with full detail
+    :param levels: Most simplified meshes made
+    :param ratio: Triangles of every level relative to the level before
+    :param min_triangles: Levels aren't simplified below this many triangles
+    :return: List of meshes, empty when the mesh is too small to simplify
+    """
+    chain = []
+    previous = mesh
+
+    for _ in range(levels):
+        target = int(len(previous) * ratio)
+        if target < min_triangles:
+            break
+
+        simplified = simplify(previous, target)
+
+        # Not worth a level of its own
+        if not len(simplified) or len(simplified) > 0.75 * len(previous):
+            break
+
+        chain.append(simplified)
+        previous = simplified
+
+    return chain
+
+
+def _level_for_area(triangle_counts: [int], area: float, pixels_per_triangle: float) -> int:
+    """ Coarsest level with enough triangles for an area in pixels """
+    wanted = area / pixels_per_triangle
+    level = 0
+
+    for index, count in enumerate(triangle_counts):
+        if count >= wanted:
+            level = index
+
+    return level
+
+
+def pick_level(
+        triangle_counts: [int],
+        area: float,
+        current: int = None,
+        pixels_per_triangle: float = 16.0,
+        hysteresis: float = 0.25
+) -> int:
+    """
+    Level of detail for an object covering an area of the screen.
+    The current level is kept until the area grows or shrinks past the
+    boundary of the level by the hysteresis, so objects near a boundary don't
+    switch levels back and forth every frame.
+
+    :param triangle_counts: Triangles of every level, finest first
+    :param area: Pixels covered by the object
+    :param current: Level picked in the previous frame, None for none
+    :param pixels_per_triangle: Pixels every triangle should cover on average
+    :param hysteresis: Relative change of area needed to leave the current level
+    :return: Index into triangle_counts
+    """
+    if current is None:
+        return _level_for_area(triangle_counts, area, pixels_per_triangle)
+
+    finest = _level_for_area(triangle_counts, area * (1.0 + hysteresis), pixels_per_triangle)
+    coarsest = _level_for_area(triangle_counts, area * (1.0 - hysteresis), pixels_per_triangle)
+
+    return min(max(current, finest), coarsest)
@@ -0,0 +1,164 @@
+"""
+Mesh representation backed by contiguous NumPy arrays.
+
+A mesh keeps its vertices in a N×3 float array and its faces in a M×3 array
+of indices into the vertex array. The renderer works on whole arrays at once
+instead of walking Triangle objects one by one.
+
+Geometry of a mesh is kept in model space and is read-only, so it can be
+shared by the renderer between frames without copying it.
+"""
+from typing import TypeVar
+
+import numpy as np
+
+from math_3d.vec3 import Vec3
+from pipeline.helpers.triangle import Triangle
+
+
+class Mesh:
+    """
+    Mesh - Structure-of-arrays model made of vertices and triangle indices
+    """
+    Mesh = TypeVar("Mesh")
+
+    def __init__(self, vertices, faces, copy: bool = True):
+        """
+        :param vertices: Array-like of shape (N, 3) with vertex positions
+        :param faces: Array-like of shape (M, 3) with indices into vertices
+        :param copy: bool, False to keep arrays which already have the right
+                     type and layout as they are, e.g. memory-mapped ones
+        """
+        make_array = np.array if copy else np.asarray
+
+        self.vertices = make_array(vertices, dtype=np.float64, order="C").reshape(-1, 3)
+        self.faces = make_array(faces, dtype=np.intp, order="C").reshape(-1, 3)
+
+        self.vertices.flags.writeable = False
+        self.faces.flags.writeable = False
+
+        self._bounding_sphere = None
+        self._face_normals = None
+        self._has_area = None
+
+        # Simplified meshes drawn instead when the mesh covers few pixels,
+        # each one coarser than the one before, see pipeline.helpers.lod
+        self.lods = []
+
+    def __len__(self) -> int:
+        """ Number of triangles in the mesh """
+        return len(self.faces)
+
+    @property
+    def vertex_count(self) -> int:
+        return len(self.vertices)
+
+    @property
+    def triangle_count(self) -> int:
+        return len(self.faces)
+
+    @property
+    def bounding_sphere(self) -> (np.ndarray, float):
+        """
+        Sphere enclosing all vertices, centered in the middle of their bounds
+
+        :return: Tuple of center of shape (3,) and radius in model space
+        """
+        if self._bounding_sphere is None:
+            if self.vertex_count:
+                center = (self.vertices.min(axis=0) + self.vertices.max(axis=0)) / 2.0
+                radius = float(np.linalg.norm(self.vertices - center, axis=1).max())
+            else:
+                center, radius = np.zeros(3), 0.0
+
+            self._bounding_sphere = (center, radius)
+
+        return self._bounding_sphere
+
+    @property
+    def face_normals(self) -> np.ndarray:
+        """
+        Cross products of the edges of every face, not normalized
+
+        :return: Array of shape (M, 3) in model space
+        """
+        if self._face_normals is None:
+            triangles = self.triangles()
+            self._face_normals = np.cross(triangles[:, 1] - triangles[:, 0], triangles[:, 2] - triangles[:, 0])
+            self._face_normals.flags.writeable = False
+
+        return self._face_normals
+
+    @property
+    def has_area(self) -> np.ndarray:
+        """
+        Faces whose corners don't all lie on a line
+
+        :return: Array of shape (M,) of bool
+        """
+        if self._has_area is None:
+            self._has_area = self.face_normals.any(axis=1)
+            self._has_area.flags.writeable = False
+
+        return self._has_area
+
+    def deduplicate(self) -> Mesh:
+        """
+        Merge vertices with equal positions so each one is shared by all
+        faces using it and gets transformed only once.
+        Vertices keep the order in which they first appear.
+
+        :return: New Mesh with unique vertices
+        """
+        if not self.vertex_count:
+            return self
+
+        _, first_index, inverse = np.unique(
+            self.vertices, axis=0, return_index=True, return_inverse=True
+        )
+
+        # np.unique sorts vertices, bring back order of first appearance
+        order = np.argsort(first_index, kind="stable")
+        new_index = np.empty_like(order)
+        new_index[order] = np.arange(len(order))
+
+        vertices = self.vertices[first_index[order]]
+        faces = new_index[inverse.reshape(-1)][self.faces]
+
+        return Mesh(vertices, faces)
+
+    def triangles(self) -> np.ndarray:
+        """
+        Gather vertices of every face
+
+        :return: Array of shape (M, 3, 3) - triangle, corner, coordinate
+        """
+        return self.vertices[self.faces]
+
+    def to_triangles(self) -> [Triangle]:
+        """
+        Build a list of Triangle objects for code working on single triangles
+
+        :return: List of Triangle objects
+        """
+        return [
+            Triangle(*(Vec3(*map(float, corner)) for corner in triangle))
+            for triangle in self.triangles()
+        ]
+
+    @staticmethod
+    def from_triangles(triangles: [Triangle]) -> Mesh:
+        """
+        Build a mesh from a list of Triangle objects, sharing equal vertices
+
+        :param triangles: List of Triangle objects
+        :return: Mesh
+        """
+        vertices = [
+            (point.x, point.y, point.z)
+            for triangle in triangles
+            for point in triangle.p
+        ]
+        faces = np.arange(len(vertices)).reshape(-1, 3)
+
+        return Mesh(vertices, faces).deduplicate()
@@ -0,0 +1,228 @@
+"""
+Binary cache of parsed meshes.
+
+Parsing a text .obj file is slow, so parsed meshes are written to a binary
+file holding a fixed header followed by the raw vertex and face arrays.
+Later runs memory-map the arrays instead of parsing the source again.
+Simplified levels of detail of the mesh follow in the same file, each one
+as a pair of arrays listed in a table after the arrays of the mesh, so they
+don't have to be built again either.
+
+A cache file belongs to a single source file and remembers its size,
+modification time and SHA-256 hash. When size and modification time match
+the source isn't read at all. When only the modification time differs, e.g.
+after a fresh checkout, the hash decides whether the cache is still valid.
+"""
+import hashlib
+import os
+import struct
+import tempfile
+
+import numpy as np
+
+from pipeline.helpers.mesh import Mesh
+
+
+MAGIC = b"P3DMESH\x00"
+VERSION = 2
+
+# magic, version, vertex count, face count, source size, source mtime in ns,
+# source SHA-256, levels of detail asked for, levels of detail stored
+_HEADER = struct.Struct("<8sIQQQq32sII")
+HEADER_SIZE = 128  # Header padded so arrays start aligned
+
+# vertex count, face count of a level of detail
+_LEVEL = struct.Struct("<QQ")
+
+_VERTEX_TYPE = np.dtype("<f8")
+_FACE_TYPE = np.dtype("<i8")
+
+
+def cache_path(source: str, cache_dir: str = None) -> str:
+    """
+    Path of the cache file of a source file
+
+    :param source: Path to the source file
+    :param cache_dir: Directory for cache files, next to the source when None
+    :return: str
+    """
+    if cache_dir is None:
+        return source + ".meshcache"
+
+    # Sources from different directories can share a name
+    source = os.path.abspath(source)
+    digest = hashlib.sha1(source.encode("utf-8")).hexdigest()[:16]
+
+    return os.path.join(cache_dir, f"{os.path.basename(source)}.{digest}.meshcache")
+
+
+def hash_file(path: str) -> bytes:
+    """
+    SHA-256 digest of the contents of a file
+
+    :param path: Path to the file
+    :return: bytes of the digest
+    """
+    digest = hashlib.sha256()
+
+    with open(path, "rb") as file:
+        for block in iter(lambda: file.read(1 << 20), b""):
+            digest.update(block)
+
+    return digest.digest()
+
+
+def _arrays_size(vertex_count: int, face_count: int) -> int:
+    """ Bytes of the vertex and face arrays of a mesh """
+    return vertex_count * 3 * _VERTEX_TYPE.itemsize + face_count * 3 * _FACE_TYPE.itemsize
+
+
+def save_mesh(source: str, mesh: Mesh, cache_dir: str = None, lod_levels: int = None) -> str:
+    """
+    Write a mesh parsed from a source file and its levels of detail to its
+    cache file. The file is written next to its final path and renamed, so
+    readers never see a partly written cache.
+
+    :param source: Path to the source file the mesh was parsed from
+    :param mesh: Parsed mesh, with the levels of detail built for it in `lods`
+    :param cache_dir: Directory for cache files, next to the source when None
+    :param lod_levels: Most levels of detail asked for when `lods` were
+                       built, the number of levels in `lods` when None
+    :return: Path of the cache file
+    """
+    path = cache_path(source, cache_dir)
+    directory = os.path.dirname(path) or "."
+    os.makedirs(directory, exist_ok=True)
+
+    lods = mesh.lods
+    if lod_levels is None:
+        lod_levels = len(lods)
+
+    status = os.stat(source)
+    header = _HEADER.pack(
+        MAGIC, VERSION, mesh.vertex_count, len(mesh), status.st_size, status.st_mtime_ns, hash_file(source),
+        lod_levels, len(lods)
+    )
+
+    handle, temporary = tempfile.mkstemp(dir=directory, suffix=".tmp")
+    try:
+        with os.fdopen(handle, "wb") as file:
+            file.write(header.ljust(HEADER_SIZE, b"\x00"))
+
+            _write_arrays(file, mesh)
+            file.write(b"".join(_LEVEL.pack(lod.vertex_count, len(lod)) for lod in lods))
+
+            for lod in lods:
+                _write_arrays(file, lod)
+
+        os.replace(temporary, path)
+    except BaseException:
+        os.remove(temporary)
+        raise
+
+    return path
+
+
+def load_mesh(source: str, cache_dir: str = None, lod_levels: int = 0):
+    """
+    Memory-map the cached mesh of a source file and its levels of detail
+
+    :param source: Path to the source file
+    :param cache_dir: Directory for cache files, next to the source when None
+    :param lod_levels: Most levels of detail wanted in `lods` of the mesh
+    :return: Mesh, or None when there is no valid cache for the source or it
+             holds fewer levels of detail than could be built
+    """
+    path = cache_path(source, cache_dir)
+
+    try:
+        with open(path, "rb") as file:
+            header = file.read(HEADER_SIZE)
+        status = os.stat(source)
+    except OSError:
+        return None
+
+    if len(header) < HEADER_SIZE:
+        return None
+
+    magic, version, vertex_count, face_count, size, mtime_ns, content_hash, levels, level_count = \
+        _HEADER.unpack_from(header)
+
+    if magic != MAGIC or version != VERSION or size != status.st_size:
+        return None
+
+    # Chains stop early when meshes get too small, a shorter chain than asked
+    # for has every level that can be built
+    if lod_levels > levels and level_count == levels:
+        return None
+
+    if mtime_ns != status.st_mtime_ns:
+        # Touched, but maybe not changed
+        if hash_file(source) != content_hash:
+            return None
+
+        _touch(path, header, status.st_mtime_ns)
+
+    table_offset = HEADER_SIZE + _arrays_size(vertex_count, face_count)
+    counts = [(vertex_count, face_count)]
+
+    try:
+        with open(path, "rb") as file:
+            file.seek(table_offset)
+            table = file.read(level_count * _LEVEL.size)
+    except OSError:
+        return None
+
+    if len(table) != level_count * _LEVEL.size:
+        return None
+
+    counts += list(_LEVEL.iter_unpack(table))
+
+    expected_size = table_offset + len(table) + sum(_arrays_size(*level) for level in counts[1:])
+    if os.path.getsize(path) != expected_size:
+        return None
+
+    meshes = []
+    offset = HEADER_SIZE
+
+    for level_vertices, level_faces in counts[:1 + lod_levels]:
+        vertices = _map(path, _VERTEX_TYPE, offset, level_vertices)
+        faces = _map(path, _FACE_TYPE, offset + level_vertices * 3 * _VERTEX_TYPE.itemsize, level_faces)
+
+        # Arrays are used in place when the machine matches the file format
+        meshes.append(Mesh(vertices, faces, copy=False))
+
+        offset += _arrays_size(level_vertices, level_faces)
+        if len(meshes) == 1:
+            offset += len(table)
+
+    mesh = meshes[0]
+    mesh.lods = meshes[1:]
+
+    return mesh
+
+
+def _write_arrays(file, mesh: Mesh) -> None:
+    """ Write vertex and face arrays of a mesh in the format of the cache """
+    file.write(mesh.vertices.astype(_VERTEX_TYPE, copy=False).tobytes())
+    file.write(mesh.faces.astype(_FACE_TYPE, copy=False).tobytes())
+
+
+def _map(path: str, dtype: np.dtype, offset: int, count: int) -> np.ndarray:
+    """ Read-only (count, 3) array mapped from a file, mmap can't map zero bytes """
+    if not count:
+        return np.empty((0, 3), dtype=dtype)
+
+    return np.memmap(path, dtype=dtype, mode="r", offset=offset, shape=(count, 3))
+
+
+def _touch(path: str, header: bytes, mtime_ns: int) -> None:
+    """ Store a new modification time of the source in a cache file """
+    fields = list(_HEADER.unpack_from(header))
+    fields[5] = mtime_ns
+
+    try:
+        with open(path, "r+b") as file:
+            file.write(_HEADER.pack(*fields))
+    except OSError:
+        pass  # Only costs hashing the source again next time
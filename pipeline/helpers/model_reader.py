@@ -3,35 +3,69 @@ Read models from files.
 
 Right now it supports only .obj files
 """
-from math_3d.vec3 import Vec3
-from pipeline.helpers.triangle import Triangle
+from helpers.loggers import get_a_logger
+from pipeline.helpers import mesh_cache
+from pipeline.helpers.lod import build_lods
+from pipeline.helpers.mesh import Mesh
+from pipeline.helpers.obj_parser import read_obj
+from pipeline.helpers.parallel_obj import read_obj_parallel
+
+_LOGGER = get_a_logger(__name__)
 
 
 class ModelReader:
 
     @staticmethod
-    def read_obj_model(path: str) -> [Triangle]:
+    def read_obj_model(
+            path: str,
+            cache: bool = True,
+            cache_dir: str = None,
+            workers: int = 1,
+            lod_levels: int = 3
+    ) -> Mesh:
         """
-        Read .obj file and return a list of Triangles, a Model.
+        Read .obj file and return a Mesh, a Model.
+        Vertices with equal positions are merged, so faces index unique vertices.
+        Simplified levels of detail of big enough models are built into `lods`.
+
+        Parsed meshes and their levels of detail are kept in a binary cache,
+        later reads of an unchanged file memory-map the cache instead of
+        parsing the text and simplifying the mesh again.
 
         :param path: Path to the .obj file
-        :return: Model represented as a list of Triangle objects
+        :param cache: bool, use and update the binary cache
+        :param cache_dir: Directory for cache files, next to the model when None
+        :param workers: Number of processes parsing the file, None for one
+                        per CPU. Worth it for files of many megabytes.
+        :param lod_levels: Most levels of detail built, 0 for none
+        :return: Model represented as a Mesh of vertex and face arrays
         """
-        v = []  # Vertices
-        f = []  # Faces/Triangles
+        mesh = mesh_cache.load_mesh(path, cache_dir, lod_levels) if cache else None
+
+        if mesh is None:
+            mesh = ModelReader._parse_obj_model(path, workers)
 
-        with open(path) as file:
-            lines = file.readlines()
+            if lod_levels:
+                mesh.lods = build_lods(mesh, lod_levels)
 
-        for line in lines:
-            line = line.split()  # Remove whitespaces
+            if cache:
+                try:
+                    mesh_cache.save_mesh(path, mesh, cache_dir, lod_levels)
+                except OSError as error:
+                    _LOGGER.warning(f"Could not cache {path}: {error}")
 
-            # Based of first char put in appropriate container
-            if 'v' in line:
-                v.append(Vec3(float(line[1]), float(line[2]), float(line[3])))
-            elif 'f' in line:
-                f.append(Triangle(v[int(line[1])-1], v[int(line[2])-1], v[int(line[3])-1]))
-            else:
-                continue
+        return mesh
+
+    @staticmethod
+    def _parse_obj_model(path: str, workers: int = 1) -> Mesh:
+        """
+        Parse .obj file text, merging equal vertices
+
+        :param path: Path to the .obj file
+        :param workers: Number of processes parsing the file
+        :return: Deduplicated Mesh
+        """
+        if workers == 1:
+            return read_obj(path).deduplicate()
 
-        return f
+        return read_obj_parallel(path, workers).deduplicate()
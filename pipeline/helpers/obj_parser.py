@@ -0,0 +1,262 @@
+"""
+Streaming parser of Wavefront .obj files.
+
+The file is read line by line, parsed values are collected in small batches
+and appended to typed arrays, so memory use stays close to the size of the
+final vertex and face arrays even for very big files.
+
+Supported records:
+    v x y z [w]         - vertex position, extra values are ignored
+    vt, vn              - texture coordinates and normals, skipped
+    f a b c ...         - face with any number of corners, fan-triangulated.
+                          Corners can be given as v, v/vt, v//vn or v/vt/vn,
+                          indices can be negative to count from the end
+Other records (comments, groups, materials, ...) are ignored.
+"""
+import numpy as np
+
+from pipeline.helpers.growable_array import GrowableArray
+from pipeline.helpers.mesh import Mesh
+
+
+class ObjParseError(ValueError):
+    """ Malformed record in an .obj file """
+
+
+# Number of values collected before they are moved into the arrays
+_BATCH_SIZE = 1 << 16
+
+# Record names, as lines can be str or bytes
+_VERTEX = (b"v", "v")
+_FACE = (b"f", "f")
+
+# Bytes of lines read from the file at once
+_READ_SIZE = 1 << 20
+
+
+class ObjParser:
+    """
+    ObjParser - Incremental .obj parser building vertex and face arrays
+    """
+
+    def __init__(self, vertex_offset: int = 0, line_offset: int = 0):
+        """
+        :param vertex_offset: Number of vertices in the file before the lines
+                              fed to the parser, when parsing a part of a file
+        :param line_offset: Number of lines in the file before the lines fed
+        """
+        self.vertices = GrowableArray((3,), np.float64)
+        self.faces = GrowableArray((3,), np.intp)
+        self.line_number = line_offset
+
+        self._pending_vertices = []  # Flat list of coordinates
+        self._pending_faces = []  # Flat list of 0-based indices
+        self._vertex_count = vertex_offset  # Vertices in the file so far, including pending ones
+
+    @property
+    def triangle_count(self) -> int:
+        """ Triangles read so far """
+        return len(self.faces) + len(self._pending_faces) // 3
+
+    def feed(self, lines) -> None:
+        """
+        Parse lines of the file
+
+        :param lines: Iterable of lines as str or bytes
+        """
+        pending_vertices = self._pending_vertices
+        pending_faces = self._pending_faces
+
+        for line in lines:
+            self.line_number += 1
+            parts = line.split()
+
+            if not parts:
+                continue
+
+            kind = parts[0]
+
+            if kind in _VERTEX:
+                if len(parts) < 4:
+                    raise ObjParseError(f"Vertex with less than 3 coordinates on line {self.line_number}")
+
+                pending_vertices += parts[1:4]
+                self._vertex_count += 1
+
+                if len(pending_vertices) >= _BATCH_SIZE:
+                    self._flush_vertices()
+
+            elif kind in _FACE:
+                corners = self._vertex_indices(parts)
+
+                # Fan of triangles sharing the first corner
+                if len(corners) == 3:
+                    pending_faces += corners
+                else:
+                    first = corners[0]
+                    for index in range(1, len(corners) - 1):
+                        pending_faces += (first, corners[index], corners[index + 1])
+
+                if len(pending_faces) >= _BATCH_SIZE:
+                    self._flush_faces()
+
+    def _vertex_indices(self, parts: list) -> [int]:
+        """
+        0-based vertex indices of face corners like 5, -1, 5/2, 5//3 or 5/2/3
+
+        :param parts: Tokens of the face record, starting with "f"
+        :return: List of int
+        """
+        if len(parts) < 4:
+            raise ObjParseError(f"Face with less than 3 corners on line {self.line_number}")
+
+        slash = b"/" if isinstance(parts[0], bytes) else "/"
+
+        try:
+            if slash in parts[1]:
+                # Corners with texture coordinate or normal indices
+                indices = [int(corner.split(slash, 1)[0]) - 1 for corner in parts[1:]]
+            else:
+                indices = [int(corner) - 1 for corner in parts[1:]]
+        except ValueError:
+            raise ObjParseError(f"Malformed face corner on line {self.line_number}") from None
+
+        if min(indices) >= 0:
+            return indices
+
+        if -1 in indices:
+            raise ObjParseError(f"Vertex index 0 on line {self.line_number}")
+
+        # Negative indices count back from the last vertex read
+        return [index if index >= 0 else self._vertex_count + index + 1 for index in indices]
+
+    def _flush_vertices(self) -> None:
+        try:
+            self.vertices.extend(np.array(self._pending_vertices, dtype=np.float64))
+        except ValueError as error:
+            raise ObjParseError(f"Malformed vertex before line {self.line_number}: {error}") from None
+
+        self._pending_vertices.clear()
+
+    def _flush_faces(self) -> None:
+        self.faces.extend(self._pending_faces)
+        self._pending_faces.clear()
+
+    def partial_mesh(self) -> Mesh:
+        """
+        Mesh of everything parsed so far. It shares memory with the parser,
+        but rows it covers are never changed by further parsing.
+
+        :return: Mesh with faces whose vertices were all read
+        """
+        self._flush_vertices()
+        self._flush_faces()
+
+        vertices = self.vertices.data
+        faces = self.faces.data
+
+        # Faces can refer to vertices further in the file
+        complete = faces.max(axis=1) < len(vertices) if len(faces) else np.ones(0, dtype=bool)
+        if not complete.all():
+            faces = faces[complete]
+
+        return Mesh(vertices, faces, copy=False)
+
+    def arrays(self) -> (np.ndarray, np.ndarray):
+        """
+        Vertices and faces parsed, faces index vertices of the whole file
+
+        :return: Tuple of new arrays of shape (N, 3) and (M, 3)
+        """
+        self._flush_vertices()
+        self._flush_faces()
+
+        return self.vertices.to_array(), self.faces.to_array()
+
+    def finish(self) -> Mesh:
+        """
+        Mesh of the whole file, checked for indices out of range
+
+        :return: Mesh with arrays of exactly its size
+        """
+        vertices, faces = self.arrays()
+        check_indices(faces, len(vertices))
+
+        return Mesh(vertices, faces, copy=False)
+
+
+def check_indices(faces: np.ndarray, vertex_count: int) -> None:
+    """
+    Raise ObjParseError when a face refers to a vertex which doesn't exist
+
+    :param faces: Array of shape (M, 3) with 0-based indices
+    :param vertex_count: Number of vertices in the file
+    """
+    if len(faces) and (faces.min() < 0 or faces.max() >= vertex_count):
+        raise ObjParseError("Face refers to a vertex which doesn't exist")
+
+
+def iter_obj(path: str, faces_per_mesh: int = 100000):
+    """
+    Parse an .obj file, yielding partial meshes while reading it
+
+    :param path: Path to the .obj file
+    :param faces_per_mesh: Number of new triangles between partial meshes
+    :return: Generator of partial meshes, the last one is the whole file
+    """
+    parser = ObjParser()
+    next_yield = faces_per_mesh
+
+    for block in read_blocks(path):
+        parser.feed(block.splitlines())
+
+        if parser.triangle_count >= next_yield:
+            next_yield = parser.triangle_count + faces_per_mesh
+            yield parser.partial_mesh()
+
+    yield parser.finish()
+
+
+def read_obj(path: str) -> Mesh:
+    """
+    Parse a whole .obj file
+
+    :param path: Path to the .obj file
+    :return: Mesh with the vertices and triangles of the file
+    """
+    parser = ObjParser()
+
+    for block in read_blocks(path):
+        parser.feed(block.splitlines())
+
+    return parser.finish()
+
+
+def read_blocks(path: str, start: int = 0, end: int = None):
+    """
+    Read a file in blocks of about _READ_SIZE bytes, each ending at the end
+    of a line
+
+    :param path: Path to the file
+    :param start: Offset of the first byte to read, at the start of a line
+    :param end: Offset after the last byte to read, at the start of a line,
+                the end of the file when None
+    :return: Generator of bytes
+    """
+    with open(path, "rb") as file:
+        file.seek(start)
+        remaining = end - start if end is not None else None
+
+        while remaining is None or remaining > 0:
+            block = file.read(_READ_SIZE if remaining is None else min(_READ_SIZE, remaining))
+            if not block:
+                return
+
+            # Finish the last line, `end` is at a line start so it's never crossed
+            if not block.endswith(b"\n"):
+                block += file.readline()
+
+            if remaining is not None:
+                remaining -= len(block)
+
+            yield block
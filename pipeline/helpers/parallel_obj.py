@@ -0,0 +1,121 @@
+"""
+Parallel loading of big .obj files.
+
+The file is split into byte ranges ending at line ends and every range is
+parsed in a worker process. Positive face indices already refer to the
+whole file, only negative ones depend on the vertices before them. So the
+workers first count vertices and lines of their ranges, then parse the
+ranges knowing how many vertices and lines precede each one. Parsed arrays
+are copied into a single vertex and a single face array.
+"""
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from pipeline.helpers.mesh import Mesh
+from pipeline.helpers.obj_parser import ObjParser, check_indices, read_blocks, read_obj
+
+
+# Ranges are kept small enough for their arrays to fit in memory comfortably
+# and numerous enough to balance the work between processes
+MAX_CHUNK_SIZE = 64 << 20
+CHUNKS_PER_WORKER = 4
+
+# Starts of vertex records, counted without splitting lines. Records indented
+# or separated by other whitespace are missed, then the file is parsed serially.
+_VERTEX_STARTS = (b"v ", b"v\t")
+
+
+def split_file(path: str, chunk_count: int) -> [(int, int)]:
+    """
+    Split a file into byte ranges starting at line starts
+
+    :param path: Path to the file
+    :param chunk_count: Number of ranges wanted, fewer for short files
+    :return: List of (start, end) offsets
+    """
+    size = os.path.getsize(path)
+    starts = [0]
+
+    with open(path, "rb") as file:
+        for chunk in range(1, chunk_count):
+            file.seek(max(size * chunk // chunk_count, starts[-1]))
+            file.readline()  # Move to the start of the next line
+
+            position = file.tell()
+            if position >= size:
+                break
+            if position > starts[-1]:
+                starts.append(position)
+
+    return list(zip(starts, starts[1:] + [size]))
+
+
+def _count_chunk(path: str, start: int, end: int) -> (int, int):
+    """ Number of vertices and lines in a byte range """
+    vertices = 0
+    lines = 0
+
+    for block in read_blocks(path, start, end):
+        for record in _VERTEX_STARTS:
+            vertices += block.count(b"\n" + record) + block.startswith(record)
+        lines += block.count(b"\n")
+
+    return vertices, lines
+
+
+def _parse_chunk(path: str, start: int, end: int, vertex_offset: int, line_offset: int) -> (np.ndarray, np.ndarray):
+    """ Vertices and faces of a byte range """
+    parser = ObjParser(vertex_offset, line_offset)
+
+    for block in read_blocks(path, start, end):
+        parser.feed(block.splitlines())
+
+    return parser.arrays()
+
+
+def read_obj_parallel(path: str, workers: int = None) -> Mesh:
+    """
+    Parse an .obj file in several processes
+
+    :param path: Path to the .obj file
+    :param workers: Number of processes, number of CPUs when None
+    :return: Mesh with the vertices and triangles of the file
+    """
+    workers = workers or os.cpu_count() or 1
+    chunk_count = max(workers * CHUNKS_PER_WORKER, -(-os.path.getsize(path) // MAX_CHUNK_SIZE))
+    chunks = split_file(path, chunk_count)
+    paths = [path] * len(chunks)
+    starts = [start for start, _ in chunks]
+    ends = [end for _, end in chunks]
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        counts = list(executor.map(_count_chunk, paths, starts, ends))
+
+        vertex_counts = [vertices for vertices, _ in counts]
+        vertex_offsets = np.cumsum([0] + vertex_counts[:-1]).tolist()
+        line_offsets = np.cumsum([0] + [lines for _, lines in counts[:-1]]).tolist()
+
+        vertices = np.empty((sum(vertex_counts), 3), dtype=np.float64)
+        parts = []
+        counted = True
+
+        for offset, count, (chunk_vertices, chunk_faces) in zip(
+                vertex_offsets, vertex_counts,
+                executor.map(_parse_chunk, paths, starts, ends, vertex_offsets, line_offsets)
+        ):
+            if len(chunk_vertices) != count:
+                counted = False  # Offsets of following ranges are wrong, negative indices too
+
+            if counted:
+                vertices[offset:offset + count] = chunk_vertices
+                parts.append(chunk_faces)
+
+    if not counted:
+        return read_obj(path)
+
+    faces = np.concatenate(parts) if parts else np.empty((0, 3), dtype=np.intp)
+    check_indices(faces, len(vertices))
+
+    return Mesh(vertices, faces, copy=False)
@@ -0,0 +1,72 @@
+"""
+Scratch arrays reused between frames.
+
+Transforming a mesh needs a few temporary arrays per stage. Allocating them on
+every frame creates garbage for the collector, so the renderer asks this pool
+for views into arrays that are only reallocated when a bigger one is needed.
+"""
+import numpy as np
+
+
+class ScratchBuffers:
+    """
+    Named pool of NumPy arrays that only ever grow
+    """
+
+    def __init__(self):
+        self._buffers = {}
+
+    def reserve(self, name: str, count: int, shape: tuple = (), dtype=np.float64) -> None:
+        """
+        Make sure buffer `name` can hold at least `count` rows
+
+        :param name: Name of the buffer
+        :param count: Number of rows needed
+        :param shape: Shape of a single row
+        :param dtype: Type of values kept in the buffer
+        """
+        buffer = self._buffers.get(name)
+
+        if buffer is None or len(buffer) < count or buffer.shape[1:] != shape or buffer.dtype != dtype:
+            self._buffers[name] = np.empty((count,) + tuple(shape), dtype=dtype)
+
+    def get(self, name: str, count: int, shape: tuple = (), dtype=np.float64) -> np.ndarray:
+        """
+        View of the first `count` rows of buffer `name`, growing it if needed.
+        Contents are left over from the previous use.
+
+        :param name: Name of the buffer
+        :param count: Number of rows needed
+        :param shape: Shape of a single row
+        :param dtype: Type of values kept in the buffer
+        :return: np.ndarray of shape (count, *shape)
+        """
+        self.reserve(name, count, shape, dtype)
+
+        return self._buffers[name][:count]
+
+    def grow(self, name: str, count: int, keep: int, shape: tuple = (), dtype=np.float64) -> np.ndarray:
+        """
+        Like `get`, but the first `keep` rows are preserved when the buffer
+        has to be reallocated. Used for outputs filled in several steps.
+
+        :param name: Name of the buffer
+        :param count: Number of rows needed
+        :param keep: Number of rows to preserve
+        :param shape: Shape of a single row
+        :param dtype: Type of values kept in the buffer
+        :return: np.ndarray of shape (count, *shape)
+        """
+        buffer = self._buffers.get(name)
+
+        if buffer is not None and len(buffer) < count:
+            grown = np.empty((max(count, 2 * len(buffer)),) + tuple(shape), dtype=dtype)
+            grown[:keep] = buffer[:keep]
+            self._buffers[name] = grown
+
+        return self.get(name, count, shape, dtype)
+
+    @property
+    def nbytes(self) -> int:
+        """ Memory taken by all buffers """
+        return sum(buffer.nbytes for buffer in self._buffers.values())
@@ -0,0 +1,129 @@
+"""
+Shading of triangles based on the light falling on them.
+
+Converting a color to HLS and back for every triangle is slow, so backends
+use a ShadeCache. It quantizes the intensity of light and keeps a table of
+final colors for every base color, so shading a frame is a table lookup.
+"""
+from collections import OrderedDict
+
+import numpy as np
+
+from pipeline.helpers.color import Color
+
+
+GREEN = (0, 255, 0)
+
+
+def shade_of_triangle(dot_value: float, base_color: (int, int, int) = GREEN) -> Color:
+    """
+    Calculate the shade of a color based on triangles angle to light
+
+    Using color in HLS color space we can manipulate the illumination
+
+    :param dot_value: Intensity of the light falling on the triangle
+    :param base_color: RGB color of a fully lit triangle, green by default
+    :return: Color of the triangle
+    """
+    base_color = Color(Color.RGB, *base_color)
+
+    # Change illumination of triangle based on angle
+    color_hls_form = base_color.to_hls()
+    color_hls_form[1] *= dot_value
+
+    return Color(Color.HLS, *color_hls_form)
+
+
+class ShadeCache:
+    """
+    ShadeCache - Colors of shaded triangles for quantized intensities of light
+    """
+
+    def __init__(self, levels: int = 256, max_colors: int = 64):
+        """
+        :param levels: Number of intensities of light between 0 and 1
+        :param max_colors: Most base colors kept, least recently used ones
+                           are dropped first
+        """
+        self.levels = levels
+        self.max_colors = max_colors
+        self._tables = OrderedDict()  # Base color -> (RGB array, list of hex strings)
+
+    def __len__(self) -> int:
+        """ Number of base colors kept """
+        return len(self._tables)
+
+    def _table(self, base_color: (int, int, int)) -> (np.ndarray, list):
+        """
+        RGB values and hex strings of all shades of a base color
+
+        :param base_color: RGB color of a fully lit triangle
+        :return: Tuple of array of shape (levels, 3) and list of levels strings
+        """
+        base_color = tuple(base_color)
+        table = self._tables.get(base_color)
+
+        if table is not None:
+            self._tables.move_to_end(base_color)
+            return table
+
+        # Same shades as shade_of_triangle, for all levels at once
+        hls = np.repeat(Color.rgb_to_hls_array([base_color]), self.levels, axis=0)
+        hls[:, 1] *= np.linspace(0.0, 1.0, self.levels)
+
+        rgb = Color.hls_to_rgb_array(hls, validate=False)
+        table = (rgb, Color.to_hex_array(rgb, validate=False))
+
+        self._tables[base_color] = table
+        if len(self._tables) > self.max_colors:
+            self._tables.popitem(last=False)
+
+        return table
+
+    def quantize(self, intensities) -> np.ndarray:
+        """
+        Levels of intensities of light
+
+        :param intensities: Array-like of intensities, clipped to [0, 1]
+        :return: Array of int levels
+        """
+        intensities = np.clip(np.asarray(intensities, dtype=np.float64), 0.0, 1.0)
+
+        return np.rint(intensities * (self.levels - 1)).astype(np.intp)
+
+    def rgb_colors(self, intensities, base_color: (int, int, int) = GREEN) -> np.ndarray:
+        """
+        RGB colors of triangles, e.g. for a framebuffer
+
+        :param intensities: Array-like of shape (K,) with intensity of light
+        :param base_color: RGB color of a fully lit triangle
+        :return: Array of shape (K, 3) of uint8
+        """
+        rgb, _ = self._table(base_color)
+
+        return rgb[self.quantize(intensities)]
+
+    def hex_colors(self, intensities, base_color: (int, int, int) = GREEN) -> [str]:
+        """
+        Fill strings of triangles, e.g. for a Canvas
+
+        :param intensities: Array-like of shape (K,) with intensity of light
+        :param base_color: RGB color of a fully lit triangle
+        :return: List of K strings like "#00ff00"
+        """
+        _, hex_strings = self._table(base_color)
+
+        return [hex_strings[level] for level in self.quantize(intensities).tolist()]
+
+    def hex_color(self, intensity: float, base_color: (int, int, int) = GREEN) -> str:
+        """
+        Fill string of a single triangle
+
+        :param intensity: Intensity of the light falling on the triangle
+        :param base_color: RGB color of a fully lit triangle
+        :return: str like "#00ff00"
+        """
+        _, hex_strings = self._table(base_color)
+        level = int(round(min(max(intensity, 0.0), 1.0) * (self.levels - 1)))
+
+        return hex_strings[level]
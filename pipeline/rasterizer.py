@@ -0,0 +1,184 @@
+"""
+Software rasterizer drawing triangles into a NumPy framebuffer.
+
+Every pixel keeps its depth, so triangles are drawn correctly in any order,
+including intersecting ones. Triangle setup (bounding boxes, edge equations
+and depth planes) is done for all triangles at once, pixel coverage is
+computed for the whole bounding box of a triangle at once.
+"""
+import numpy as np
+
+from pipeline.helpers.image_writer import encode_ppm
+
+
+def setup_triangles(triangles: np.ndarray) -> (np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray):
+    """
+    Compute edge equations, depth planes and bounding boxes of triangles
+
+    Barycentric weight of corner i at pixel (x, y) is
+    edges[:, i, 0] * x + edges[:, i, 1] * y + edges[:, i, 2], and the depth is
+    depth_planes[:, 0] * x + depth_planes[:, 1] * y + depth_planes[:, 2]
+
+    :param triangles: Array of shape (K, 3, 3) with screen-space triangles
+    :return: Tuple of edges (K, 3, 3), depth planes (K, 3), bounding boxes
+             (K, 4) as [min_x, min_y, max_x, max_y] and a mask (K,) of
+             triangles with non-zero area
+    """
+    x = triangles[:, :, 0]
+    y = triangles[:, :, 1]
+    z = triangles[:, :, 2]
+
+    # Edge opposite of corner i goes from corner i+1 to i+2
+    x_a, y_a = np.roll(x, -1, axis=1), np.roll(y, -1, axis=1)
+    x_b, y_b = np.roll(x, -2, axis=1), np.roll(y, -2, axis=1)
+
+    edges = np.empty(triangles.shape, dtype=np.float64)
+    edges[:, :, 0] = y_a - y_b
+    edges[:, :, 1] = x_b - x_a
+    edges[:, :, 2] = x_a * y_b - x_b * y_a
+
+    area = edges[:, 0, 0] * x[:, 0] + edges[:, 0, 1] * y[:, 0] + edges[:, 0, 2]
+    valid = area != 0.
+
+    # Normalize edges so they give barycentric weights
+    np.divide(edges, area[:, None, None], out=edges, where=valid[:, None, None])
+
+    depth_planes = np.einsum("kij,ki->kj", edges, z)
+
+    boxes = np.empty((len(triangles), 4), dtype=np.float64)
+    boxes[:, 0] = np.floor(x.min(axis=1))
+    boxes[:, 1] = np.floor(y.min(axis=1))
+    boxes[:, 2] = np.ceil(x.max(axis=1))
+    boxes[:, 3] = np.ceil(y.max(axis=1))
+
+    return edges, depth_planes, boxes, valid
+
+
+def rasterize(
+        color: np.ndarray,
+        depth: np.ndarray,
+        triangles: np.ndarray,
+        colors: np.ndarray,
+        origin: (int, int) = (0, 0),
+        covered: np.ndarray = None
+) -> int:
+    """
+    Draw triangles into color and depth buffers, keeping the nearest pixels
+
+    Buffers can be a region of a bigger frame, `origin` is then the position
+    of their top-left pixel in the frame.
+
+    :param color: Array of shape (H, W, 3) with colors of pixels
+    :param depth: Array of shape (H, W) with depth of pixels
+    :param triangles: Array of shape (K, 3, 3) with screen-space triangles
+    :param colors: Array of shape (K, 3) with RGB color of every triangle
+    :param origin: Tuple (x, y) of the top-left pixel of the buffers
+    :param covered: Boolean array of shape (K,), set for triangles which
+                    covered at least one pixel, None to only count them
+    :return: Number of triangles which covered at least one pixel
+    """
+    height, width = depth.shape
+    origin_x, origin_y = origin
+
+    edges, depth_planes, boxes, valid = setup_triangles(triangles)
+
+    # Clip bounding boxes to the buffers
+    boxes[:, 0] = np.maximum(boxes[:, 0], origin_x)
+    boxes[:, 1] = np.maximum(boxes[:, 1], origin_y)
+    boxes[:, 2] = np.minimum(boxes[:, 2], origin_x + width - 1)
+    boxes[:, 3] = np.minimum(boxes[:, 3], origin_y + height - 1)
+    valid &= (boxes[:, 0] <= boxes[:, 2]) & (boxes[:, 1] <= boxes[:, 3])
+
+    drawn = 0
+
+    for index in np.flatnonzero(valid):
+        min_x, min_y, max_x, max_y = boxes[index].astype(int)
+
+        # Sample pixels at their centers
+        px = np.arange(min_x, max_x + 1) + 0.5
+        py = (np.arange(min_y, max_y + 1) + 0.5)[:, None]
+
+        edge = edges[index]
+        inside = (edge[0, 0] * px + edge[0, 1] * py + edge[0, 2]) >= 0.
+        inside &= (edge[1, 0] * px + edge[1, 1] * py + edge[1, 2]) >= 0.
+        inside &= (edge[2, 0] * px + edge[2, 1] * py + edge[2, 2]) >= 0.
+
+        plane = depth_planes[index]
+        z = plane[0] * px + plane[1] * py + plane[2]
+
+        rows = slice(min_y - origin_y, max_y - origin_y + 1)
+        columns = slice(min_x - origin_x, max_x - origin_x + 1)
+        depth_region = depth[rows, columns]
+
+        nearer = inside & (z < depth_region)
+        if not nearer.any():
+            continue
+
+        depth_region[nearer] = z[nearer]
+        color[rows, columns][nearer] = colors[index]
+        drawn += 1
+
+        if covered is not None:
+            covered[index] = True
+
+    return drawn
+
+
+class Rasterizer:
+    """
+    Rasterizer - Framebuffer with a color and a depth buffer
+    """
+
+    def __init__(self, width: int, height: int, background: (int, int, int) = (0, 0, 0)):
+        """
+        :param width: int representing width of the framebuffer
+        :param height: int representing height of the framebuffer
+        :param background: RGB color of pixels not covered by any triangle
+        """
+        self.width = width
+        self.height = height
+        self.background = np.array(background, dtype=np.uint8)
+
+        self.color = np.empty((height, width, 3), dtype=np.uint8)
+        self.depth = np.empty((height, width), dtype=np.float64)
+        self.clear()
+
+    def clear(self) -> None:
+        """ Fill framebuffer with background color and infinite depth """
+        self.color[...] = self.background
+        self.depth.fill(np.inf)
+
+    def draw_triangles(self, triangles: np.ndarray, colors: np.ndarray) -> int:
+        """
+        Draw triangles into the framebuffer
+
+        :param triangles: Array of shape (K, 3, 3) with screen-space triangles
+        :param colors: Array of shape (K, 3) with RGB color of every triangle
+        :return: Number of triangles which covered at least one pixel
+        """
+        return rasterize(self.color, self.depth, triangles, colors)
+
+    def to_ppm(self) -> bytes:
+        """
+        Framebuffer as a binary PPM image
+
+        :return: bytes of the image
+        """
+        return encode_ppm(self.color)
+
+
+def make_tiled_rasterizer(width: int, height: int, workers: int = None, **kwargs):
+    """
+    Rasterizer drawing tiles of the framebuffer in worker processes, see
+    pipeline.tiled_rasterizer. It needs shared memory from Python 3.8, so
+    it's only imported when asked for and the rest runs on older versions.
+
+    :param width: int representing width of the framebuffer
+    :param height: int representing height of the framebuffer
+    :param workers: Number of processes, number of CPUs when None
+    :param kwargs: Other arguments of TiledRasterizer
+    :return: TiledRasterizer
+    """
+    from pipeline.tiled_rasterizer import TiledRasterizer
+
+    return TiledRasterizer(width, height, workers, **kwargs)
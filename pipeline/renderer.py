@@ -1,21 +1,34 @@
-import copy
-from math import sin, cos, tan, pi
-from tkinter import Canvas, NW, SW, NE, SE
+from math import tan, pi
+from typing import TYPE_CHECKING
+
+import numpy as np
 
 from math_3d.mat4x4 import Mat4x4
 from math_3d.vec3 import Vec3
 
+from pipeline.bvh import BVH
 from pipeline.camera import Camera
+from pipeline.clipping import clip_triangles
+from pipeline.frustum import Frustum
 
-from pipeline.helpers.color import Color
-from pipeline.helpers.triangle import Triangle
+from pipeline.helpers.frame_stats import FrameStats
+from pipeline.helpers.instances import Instances
+from pipeline.helpers.lod import pick_level
+from pipeline.helpers.mesh import Mesh
 
 from pipeline.helpers.model_reader import ModelReader
+from pipeline.helpers.scratch_buffers import ScratchBuffers
+
+from pipeline.scene_graph import SceneGraph, SceneNode
+
+if TYPE_CHECKING:
+    # Only for annotations, the pipeline runs without Tk
+    from tkinter import Canvas
 
 
-def get_objects_for_scene() -> [[Triangle]]:
-    # For now return a list with the points of a cube
-    objects = []
+def get_scene() -> SceneGraph:
+    # For now return a graph with the points of a cube
+    scene = SceneGraph(Renderer._default_world_matrix())
     #
     # cube = [
     #     # SOUTH
@@ -43,18 +56,18 @@ def get_objects_for_scene() -> [[Triangle]]:
     #     Triangle(Vec3(1.0, 0.0, 1.0), Vec3(0.0, 0.0, 0.0), Vec3(1.0, 0.0, 0.0)),
     # ]
     #
-    # objects.append(cube)
+    # scene.add(SceneNode(Mesh.from_triangles(cube), name="cube"))
 
     axis = ModelReader.read_obj_model(r"models/axis.obj")
-    objects.append(axis)
+    scene.add(SceneNode(axis, name="axis"))
 
     # spaceship = ModelReader.read_obj_model(r"models/ship.obj")
-    # objects.append(spaceship)
+    # scene.add(SceneNode(spaceship, Mat4x4.translation_matrix(0.0, 0.0, 10.0), name="spaceship"))
 
     # teapot = ModelReader.read_obj_model(r"models/teapot.obj")
-    # objects.append(teapot)
+    # scene.add(SceneNode(teapot, Mat4x4.translation_matrix(5.0, 0.0, 10.0), name="teapot"))
 
-    return objects
+    return scene
 
 
 class Renderer:
@@ -62,6 +75,15 @@ class Renderer:
     Renderer - Compute the frame of a scene
     """
 
+    # Part of the screen covered by the projected range [-1, 1]
+    view_scale = 0.6
+
+    # Pixels every triangle of the level of detail picked for an object
+    # should cover on average, and the relative change of the covered area
+    # needed to switch levels
+    lod_pixels = 16.0
+    lod_hysteresis = 0.25
+
     def __init__(
             self,
             *,
@@ -69,7 +91,12 @@ class Renderer:
             far: float,
             fov: float,
             screen_height: int,
-            screen_width: int
+            screen_width: int,
+            vectorized: bool = True,
+            backend=None,
+            objects: ["Mesh | Instances"] = None,
+            scene: SceneGraph = None,
+            instrument: bool = False
     ):
         """
         Set up all variables needed for the projection matrix
@@ -79,22 +106,183 @@ class Renderer:
         :param fov: float representing field-of-view
         :param screen_height: int representing height of the screen
         :param screen_width: int representing width of the screen
+        :param vectorized: bool, process whole meshes with batched array
+                           operations instead of one triangle at a time
+        :param backend: Output backend drawing triangles on the window,
+                        RetainedCanvasBackend by default
+        :param objects: List of meshes and Instances in the scene, all
+                        placed by the default world matrix
+        :param scene: SceneGraph placing every object on its own, used
+                      instead of objects, get_scene() when both are None
+        :param instrument: bool, time every stage of the pipeline and keep
+                           the result of the last frame in `stats`
         """
-        self.near = near,
-        self.far = far,
-        self.fov = fov,
+        self.near = near
+        self.far = far
+        self.fov = fov
         self.screen_height = screen_height
         self.screen_width = screen_width
         self.aspect_ration = float(screen_height / screen_width)
         self.fov_rad = 1.0 / tan(fov * 0.5 / 180.0 * pi)
         self.theta = pi/4
         self.time_diff = 1
+        self.triangle_count = 0
+        self.vectorized = vectorized
+        self.instrument = instrument
+        self.stats = None
+        self.backend = backend if backend is not None else self._default_backend()
 
         self.camera = Camera(Vec3(0, 0, -10))
         self.projection_matrix = self._make_projection_matrix(far, near)
+        self.frustum = self._make_frustum()
+
+        # Arrays reused by every frame
+        self.buffers = ScratchBuffers()
+
+        # Matrices and frame kept until the camera or the scene changes
+        self._camera_version = None
+        self._camera_view = None
+        self._view_projection = None
+        self._world_planes = None
+        self._object_matrices = []
+        self._frame_key = None
+        self._frame = None
+        self.frame_reused = False
+        self._presented = None
+
+        # Get objects for the scene, drawn by the nodes of the scene graph
+        self.scene = None
+        self.objects = []
+        self._nodes = []
+        self._node_objects = {}
+        self._structure_version = None
+        self.object_index = None
+        self._indexed_version = None
+        self._object_entries = None
+        self._entry_objects = None
+        self._entry_instances = None
+        self._world_centers = None
+        self._world_radii = None
+        self._lod_levels = []
+
+        if scene is None:
+            scene = get_scene() if objects is None else SceneGraph.from_objects(objects, self._default_world_matrix())
+
+        self.set_scene(scene)
+
+    @staticmethod
+    def _default_backend():
+        """ Canvas backend, imported here so the pipeline runs without Tk """
+        from pipeline.backends.retained_canvas import RetainedCanvasBackend
+
+        return RetainedCanvasBackend()
+
+    def set_scene(self, scene: SceneGraph) -> None:
+        """
+        Replace the scene graph, nodes added to or removed from it later are
+        picked up by the next frame
 
-        # Get objects for the scene
-        self.objects = get_objects_for_scene()
+        :param scene: SceneGraph
+        """
+        self.scene = scene
+        self._structure_version = None
+        self._sync_scene()
+
+    def set_objects(self, objects: ["Mesh | Instances"]) -> None:
+        """
+        Replace objects in the scene with a scene graph placing all of them
+        by the current world matrix
+
+        :param objects: List of meshes and Instances
+        """
+        self.set_scene(SceneGraph.from_objects(objects, self.world_matrix))
+
+    def _sync_scene(self) -> None:
+        """ Index drawn nodes again and grow frame buffers to fit them when nodes were added or removed """
+        scene = self.scene
+
+        if scene.structure_version == self._structure_version:
+            return
+
+        nodes = scene.drawables()
+        objects = [node.geometry for node in nodes]
+
+        self._nodes = nodes
+        self._node_objects = {node: index for index, node in enumerate(nodes)}
+        self.objects = objects
+
+        # Every mesh and every instance is an entry of the object index
+        entry_objects = []
+        entry_instances = []
+
+        for index, obj in enumerate(objects):
+            if isinstance(obj, Instances):
+                entry_objects += [index] * obj.instance_count
+                entry_instances += range(obj.instance_count)
+            else:
+                entry_objects.append(index)
+                entry_instances.append(-1)
+
+        self._entry_objects = np.array(entry_objects, dtype=np.intp)
+        self._entry_instances = np.array(entry_instances, dtype=np.intp)
+
+        # Entries of object i are object_entries[i] up to object_entries[i + 1]
+        self._object_entries = np.searchsorted(self._entry_objects, np.arange(len(objects) + 1))
+
+        # All instances of a mesh can be processed as one batch
+        batches = [(obj.mesh, obj.instance_count) if isinstance(obj, Instances) else (obj, 1) for obj in objects]
+        largest_object = max((len(mesh) * count for mesh, count in batches), default=0)
+        most_vertices = max((mesh.vertex_count * count for mesh, count in batches), default=0)
+        triangle_count = sum(len(obj) for obj in objects)
+
+        self.buffers.reserve("clip", most_vertices, (4,))
+        self.buffers.reserve("screen_vertices", most_vertices, (3,))
+        self.buffers.reserve("corners", largest_object, (3, 4))
+        self.buffers.reserve("visible_faces", largest_object, (3,), np.intp)
+        self.buffers.reserve("object_screen", largest_object, (3, 3))
+        self.buffers.reserve("screen", triangle_count, (3, 3))
+        self.buffers.reserve("light", triangle_count)
+
+        # Index of objects for frustum culling, built from scratch so moves
+        # recorded so far are already in it
+        scene.take_moved()
+        centers, radii = self._world_spheres(objects, [node.world_matrix for node in nodes])
+        self.object_index = BVH(centers, radii)
+        self._indexed_version = scene.version
+        self._structure_version = scene.structure_version
+        self._world_centers, self._world_radii = centers, radii
+
+        # Level of detail of every entry picked in the last frame
+        self._lod_levels = [None] * len(entry_objects)
+        self._object_matrices = [None] * len(objects)
+
+    @property
+    def scene_version(self) -> int:
+        """ Changes whenever nodes of the scene move, are added or removed """
+        return self.scene.version
+
+    @property
+    def world_matrix(self) -> Mat4x4:
+        """ Matrix of the root of the scene graph placing the whole scene in the world, assign a new one to move it """
+        return self.scene.root.transform
+
+    @world_matrix.setter
+    def world_matrix(self, matrix: Mat4x4) -> None:
+        self.scene.root.transform = matrix
+
+    def invalidate(self) -> None:
+        """ Build and draw the next frame even if nothing seems to have changed """
+        self._frame_key = None
+        self._presented = None
+
+    def advance(self, time_step: float) -> None:
+        """
+        Move everything in the scene by a step of time
+
+        :param time_step: Seconds to move by
+        """
+        self.time_diff = time_step
+        self.update_camera_position()
 
     def update_camera_position(self):
         if self.camera.move_direction == "UP":
@@ -125,30 +313,41 @@ class Renderer:
 
     def _make_projection_matrix(self, far, near):
         """ Create matrix for projection with parameters defined in object """
-        proj_mat = Mat4x4()
-        proj_mat.m[0][0] = self.aspect_ration * self.fov_rad
-        proj_mat.m[1][1] = self.fov_rad
-        proj_mat.m[2][2] = far // (far - near)
-        proj_mat.m[3][2] = (-far * near) / (far - near)
-        proj_mat.m[2][3] = 1.0
-        proj_mat.m[3][3] = 0.0
+        return Mat4x4((
+            self.aspect_ration * self.fov_rad, 0.0, 0.0, 0.0,
+            0.0, self.fov_rad, 0.0, 0.0,
+            0.0, 0.0, far // (far - near), 1.0,
+            0.0, 0.0, (-far * near) / (far - near), 0.0,
+        ))
 
-        return proj_mat
+    @staticmethod
+    def _default_world_matrix() -> Mat4x4:
+        """ Matrix placing objects in the world """
+        # Setup Z and X rotation matrices
+        z_rotate = Mat4x4.z_rotation_matrix(3*pi)
+        x_rotate = Mat4x4.x_rotation_matrix(2*pi)
 
-    def _project_triangle(self, tri: Triangle) -> Triangle:
-        """
-        Project triangle from 3D to 2D using Renderer's projection matrix
+        # Setup Translation matrix
+        translation_matrix = Mat4x4.translation_matrix(0.0, 0.0, 0.0)
 
-        :param tri: Triangle to be projected
-        :return: Projected triangle
-        """
+        world_matrix = Mat4x4.multiply_matrix(z_rotate, x_rotate)
+        world_matrix = Mat4x4.multiply_matrix(world_matrix, translation_matrix)
 
-        tri_projected = tri
-        tri_projected.p[0] = self.projection_matrix * tri.p[0]
-        tri_projected.p[1] = self.projection_matrix * tri.p[1]
-        tri_projected.p[2] = self.projection_matrix * tri.p[2]
+        return world_matrix
 
-        return tri_projected
+    def _make_frustum(self) -> Frustum:
+        """ Frustum in View Space matching the projection and the screen """
+        # Projected points inside of the screen after _scale_points
+        visible_range = (-1.0, 1.0 / self.view_scale - 1.0)
+
+        return Frustum(
+            near=self.near,
+            far=self.far,
+            x_scale=self.aspect_ration * self.fov_rad,
+            y_scale=self.fov_rad,
+            x_range=visible_range,
+            y_range=visible_range,
+        )
 
     @staticmethod
     def _point_at_matrix(position: Vec3, target: Vec3, up: Vec3) -> Mat4x4:
@@ -165,193 +364,727 @@ class Renderer:
         new_right = new_up // new_forward
 
         # Construct Dimensioning and translation matrix
-        matrix = Mat4x4()
-        matrix.m[0] = [new_right.x, new_right.y, new_right.z, 0.0]
-        matrix.m[1] = [new_up.x, new_up.y, new_up.z, 0.0]
-        matrix.m[2] = [new_forward.x, new_forward.y, new_forward.z, 0.0]
-        matrix.m[3] = [position.x, position.y, position.z, 1.0]
-
-        return matrix
+        return Mat4x4((
+            new_right.x, new_right.y, new_right.z, 0.0,
+            new_up.x, new_up.y, new_up.z, 0.0,
+            new_forward.x, new_forward.y, new_forward.z, 0.0,
+            position.x, position.y, position.z, 1.0,
+        ))
 
     @staticmethod
     def _quick_inverse_matrix(original: Mat4x4) -> Mat4x4:
-        matrix = Mat4x4()
-        matrix.m[0][0] = original.m[0][0]
-        matrix.m[0][1] = original.m[1][0]
-        matrix.m[0][2] = original.m[2][0]
-        matrix.m[0][3] = 0.0
-
-        matrix.m[1][0] = original.m[0][1]
-        matrix.m[1][1] = original.m[1][1]
-        matrix.m[1][2] = original.m[2][1]
-        matrix.m[1][3] = 0.0
-
-        matrix.m[2][0] = original.m[0][2]
-        matrix.m[2][1] = original.m[1][2]
-        matrix.m[2][2] = original.m[2][2]
-        matrix.m[2][3] = 0.0
-
-        matrix.m[3][0] = -(
-                original.m[3][0] * original.m[0][0] + original.m[3][1] * original.m[1][0] + original.m[3][2] *
-                original.m[2][0])
-        matrix.m[3][1] = -(
-                original.m[3][0] * original.m[0][1] + original.m[3][1] * original.m[1][1] + original.m[3][2] *
-                original.m[2][1])
-        matrix.m[3][2] = -(
-                original.m[3][0] * original.m[0][2] + original.m[3][1] * original.m[1][2] + original.m[3][2] *
-                original.m[2][2])
-        matrix.m[3][3] = 1.0
-
-        return matrix
+        """
+        Inverse of a rotation and translation matrix, rotation is transposed
+        and translation is rotated back and negated
 
-    @staticmethod
-    def _calculate_shade_of_triangle(tri: Triangle) -> Color:
+        :param original: Matrix without scaling or projection
+        :return: New Mat4x4
+        """
+        m = original.m
+        right, up, forward, position = (list(m[row]) for row in range(4))
+
+        return Mat4x4((
+            right[0], up[0], forward[0], 0.0,
+            right[1], up[1], forward[1], 0.0,
+            right[2], up[2], forward[2], 0.0,
+            -(position[0] * right[0] + position[1] * right[1] + position[2] * right[2]),
+            -(position[0] * up[0] + position[1] * up[1] + position[2] * up[2]),
+            -(position[0] * forward[0] + position[1] * forward[1] + position[2] * forward[2]),
+            1.0,
+        ))
+
+    def _scale_point(self, point: Vec3) -> Vec3:
         """
-        Calculate the shade of a color based on triangles angle to light
+        Scale point for the view, in place
 
-        Using color in HLS color space we can manipulate the illumination
+        :param point: Point to be scaled
+        :return: Scaled point
         """
-        dot_value = tri.angle_to_light
-        base_color = Color(Color.RGB, 0, 255, 0)  # Use Green for now
 
-        # Change illumination of triangle based on angle
-        color_hls_form = base_color.to_hls()
-        color_hls_form[1] *= dot_value
+        point.x += 1.0
+        point.y += 1.0
 
-        shade_of_triangle = Color(Color.HLS, *color_hls_form)
+        point.x *= self.view_scale * self.screen_width
+        point.y *= self.view_scale * self.screen_height
 
-        return shade_of_triangle
+        return point
+
+    def _scale_points(self, points: np.ndarray) -> np.ndarray:
+        """
+        Scale projected points for the view, in place
+
+        :param points: Array of shape (..., 3) with projected points
+        :return: The same array, scaled
+        """
+        points[..., 0] += 1.0
+        points[..., 1] += 1.0
+
+        points[..., 0] *= self.view_scale * self.screen_width
+        points[..., 1] *= self.view_scale * self.screen_height
+
+        return points
+
+    def _to_screen(self, points: np.ndarray, out: np.ndarray) -> np.ndarray:
+        """
+        Divide Clip Space points by w and scale them into view
+
+        :param points: Array of shape (N, 4)
+        :param out: Array of shape (N, 3) to write screen-space points to
+        :return: out
+        """
+        w = points[:, 3:]
+        out[...] = points[:, :3]
+        np.divide(out, w, out=out, where=w != 0.)
+
+        return self._scale_points(out)
 
     @staticmethod
-    def _draw_triangle(tri: Triangle, window: Canvas) -> None:
+    def _world_spheres(
+            objects: ["Mesh | Instances"],
+            world_matrices: [Mat4x4]
+    ) -> (np.ndarray, np.ndarray):
         """
-        Draw triangle to screen
+        Bounding spheres of objects placed in the world, one for every mesh
+        and one for every instance
 
-        :param tri: Triangle to be drawn
+        :param objects: List of meshes and Instances
+        :param world_matrices: List with the matrix placing every object in the world
+        :return: Tuple of centers of shape (K, 3) and radii of shape (K,)
         """
-        points = [tri.p[0].x, tri.p[0].y, tri.p[1].x, tri.p[1].y, tri.p[2].x, tri.p[2].y]
-        shade_of_triangle = Renderer._calculate_shade_of_triangle(tri)
+        centers = [np.empty((0, 3))]
+        radii = [np.empty(0)]
+
+        for obj, world_matrix in zip(objects, world_matrices):
+            linear = world_matrix.as_array()[:3, :3]
 
-        # With wireframe
-        # window.create_polygon(points, outline="red", fill=shade_of_triangle.to_hex())
+            if isinstance(obj, Instances):
+                # Centers placed by every instance transform, then by the world matrix
+                center, radius = obj.mesh.bounding_sphere
+                transforms = obj.transforms
+                center = center @ transforms[:, :3, :3] + transforms[:, 3, :3]
+                radii.append(radius * np.linalg.norm(transforms[:, :3, :3] @ linear, 2, axis=(1, 2)))
+            else:
+                center, radius = obj.bounding_sphere
+                radii.append([radius * np.linalg.norm(linear, 2)])
 
-        window.create_polygon(points, fill=shade_of_triangle.to_hex())
+            centers.append(world_matrix.transform_points(np.reshape(center, (-1, 3)), projective=False))
 
-    def _scale_triangle(self, tri: Triangle) -> Triangle:
+        return np.concatenate(centers), np.concatenate(radii).astype(np.float64)
+
+    def _frame_matrices(self) -> (Mat4x4, np.ndarray):
         """
-        Scale triangle for the view
+        View x projection matrix and planes of the frustum in World Space,
+        made again only when the camera changed
 
-        :param tri: Triangle to be scaled
-        :return: Scaled triangle
+        :return: Tuple of Mat4x4 and array of shape (6, 4)
         """
+        camera_version = self.camera.version
 
-        tri_scaled = tri
+        if camera_version != self._camera_version:
+            # Make point_at matrix
+            up_vector = Vec3(0, 1, 0)
+            target_vector = Vec3(0, 0, 1)
+            camera_rotation = Mat4x4.y_rotation_matrix(self.camera.yaw)
+            self.camera.look_direction = camera_rotation * target_vector
+            target_vector = self.camera.position + self.camera.look_direction
 
-        tri_scaled.p[0].x += 1.0
-        tri_scaled.p[1].x += 1.0
-        tri_scaled.p[2].x += 1.0
+            camera_matrix = self._point_at_matrix(self.camera.position, target_vector, up_vector)
+            self._camera_view = self._quick_inverse_matrix(camera_matrix)
+            self._view_projection = self._camera_view @ self.projection_matrix
+            self._world_planes = self.frustum.world_planes(self._camera_view.as_array())
+            self._camera_version = camera_version
 
-        tri_scaled.p[0].y += 1.0
-        tri_scaled.p[1].y += 1.0
-        tri_scaled.p[2].y += 1.0
+        return self._view_projection, self._world_planes
 
-        tri_scaled.p[0].x *= 0.6 * self.screen_width
-        tri_scaled.p[0].y *= 0.6 * self.screen_height
+    def _matrices_of(self, index: int, view_projection: Mat4x4) -> (Mat4x4, Mat4x4):
+        """
+        World matrix of an object and the single matrix taking its vertices
+        from Model Space into Clip Space, composed again only when its node
+        or the camera moved
 
-        tri_scaled.p[1].x *= 0.6 * self.screen_width
-        tri_scaled.p[1].y *= 0.6 * self.screen_height
+        :param index: Index of the object in objects
+        :param view_projection: View x projection matrix from _frame_matrices
+        :return: Tuple of world matrix and world x view x projection matrix
+        """
+        world_matrix = self._nodes[index].world_matrix
+        matrices = self._object_matrices[index]
 
-        tri_scaled.p[2].x *= 0.6 * self.screen_width
-        tri_scaled.p[2].y *= 0.6 * self.screen_height
+        # Both matrices are replaced, never changed, when they move
+        if matrices is None or matrices[0] is not world_matrix or matrices[1] is not view_projection:
+            matrices = (world_matrix, view_projection, world_matrix @ view_projection)
+            self._object_matrices[index] = matrices
 
-        return tri_scaled
+        return world_matrix, matrices[2]
 
-    def render_frame(self, window: Canvas, time_diff: float) -> Canvas:
-        # Clear screen
-        window.delete("all")
+    def _refit(self, moved: ["SceneNode"]) -> None:
+        """
+        Update the object index for drawn nodes below moved nodes, entries
+        of all other nodes are kept
 
-        # update time_diff
-        self.time_diff = time_diff
+        :param moved: List of SceneNodes, see SceneGraph.take_moved
+        """
+        changed = set()
 
-        # update camera position
-        self.update_camera_position()
+        for node in dict.fromkeys(moved):
+            for below in node.walk():
+                index = self._node_objects.get(below)
+                if index is not None:
+                    changed.add(index)
+
+        changed = sorted(changed)
+        centers, radii = self._world_spheres(
+            [self.objects[index] for index in changed], [self._nodes[index].world_matrix for index in changed]
+        )
+        starts = self._object_entries
+        entries = [entry for index in changed for entry in range(starts[index], starts[index + 1])]
+
+        for entry, center, radius in zip(entries, centers, radii.tolist()):
+            self.object_index.update(entry, center, radius)
+
+        self._world_centers[entries] = centers
+        self._world_radii[entries] = radii
+
+    def _visible_objects(self, world_planes: np.ndarray) -> np.ndarray:
+        """
+        Query the object index for objects at least partly inside of the view.
+        Entries of nodes which moved since the last query are refitted first.
+
+        :param world_planes: Array of shape (6, 4) with planes of the frustum in World Space
+        :return: Sorted array of indices of entries, see _sync_scene
+        """
+        if self._indexed_version != self.scene.version:
+            self._refit(self.scene.take_moved())
+            self._indexed_version = self.scene.version
+
+        return self.object_index.query(world_planes)
+
+    def _level_of_detail(self, index: int, camera_position: np.ndarray) -> Mesh:
+        """
+        Mesh drawn for an entry, one of its simplified levels of detail when
+        its bounding sphere covers few pixels
+
+        :param index: Index of the entry, see _sync_scene
+        :param camera_position: Array of shape (3,) with position of the camera
+        :return: The mesh of the entry or one of its lods
+        """
+        obj = self.objects[self._entry_objects[index]]
+
+        if isinstance(obj, Instances):
+            obj = obj.mesh
+
+        if not obj.lods:
+            return obj
+
+        radius = self._world_radii[index]
+        distance = float(np.linalg.norm(self._world_centers[index] - camera_position))
+
+        # Camera inside of the bounding sphere, parts of the object can be right in front of it
+        if distance <= radius:
+            self._lod_levels[index] = 0
+            return obj
+
+        projected_radius = radius * self.fov_rad * self.view_scale * self.screen_height / distance
+        area = pi * projected_radius * projected_radius
+
+        level = pick_level(
+            [len(obj)] + [len(lod) for lod in obj.lods],
+            area,
+            self._lod_levels[index],
+            self.lod_pixels,
+            self.lod_hysteresis,
+        )
+        self._lod_levels[index] = level
+
+        return obj.lods[level - 1] if level else obj
+
+    def _draw_batches(self, visible: np.ndarray, camera_position: np.ndarray) -> [(int, Mesh, np.ndarray, int)]:
+        """
+        Meshes to draw for visible entries, visible instances of an object
+        drawn with the same level of detail are grouped together
+
+        :param visible: Array of indices of entries, see _sync_scene
+        :param camera_position: Array of shape (3,) with position of the camera
+        :return: List of the index of the object, the mesh to draw, array of
+                 shape (I, 4, 4) with transforms of its instances or None for
+                 a single mesh, and the number of triangles at full detail
+        """
+        batches = []
+        instance_batches = {}
 
-        # Get objects in scene
-        objects = copy.deepcopy(self.objects)
+        for index in visible.tolist():
+            object_index = int(self._entry_objects[index])
+            obj = self.objects[object_index]
+            mesh = self._level_of_detail(index, camera_position)
+
+            if isinstance(obj, Instances):
+                key = (object_index, id(mesh))
+                if key not in instance_batches:
+                    instance_batches[key] = (object_index, mesh, [])
+                instance_batches[key][2].append(self._entry_instances[index])
+            else:
+                batches.append((object_index, mesh, None, len(obj)))
+
+        for object_index, mesh, instances in instance_batches.values():
+            obj = self.objects[object_index]
+            batches.append((object_index, mesh, obj.transforms[instances], len(obj.mesh) * len(instances)))
+
+        return batches
+
+    def _clip_near_plane(self, tri_clip: np.ndarray, light: np.ndarray) -> (np.ndarray, np.ndarray):
+        """
+        Clip Clip Space triangles crossing the near plane, where w equals the
+        depth in View Space, and scale them into view
+
+        :param tri_clip: Array of shape (K, 3, 4)
+        :param light: Array of shape (K,) with intensity of light
+        :return: Screen-space triangles and their intensity of light
+        """
+        tri_clipped, light_clipped = clip_triangles(tri_clip, light, np.array([0.0, 0.0, 0.0, 1.0]), -self.near)
+        points = tri_clipped.reshape(-1, 4)
+
+        return self._to_screen(points, np.empty((len(points), 3))).reshape(-1, 3, 3), light_clipped
+
+    def _clip_screen_edges(self, triangles: np.ndarray, light: np.ndarray) -> (np.ndarray, np.ndarray):
+        """
+        Clip screen-space triangles against edges of the screen
+
+        :param triangles: Array of shape (K, 3, 3)
+        :param light: Array of shape (K,) with intensity of light
+        :return: Triangles inside of the screen and their intensity of light
+        """
+        edges = [
+            (np.array([1.0, 0.0, 0.0]), 0.0),
+            (np.array([-1.0, 0.0, 0.0]), float(self.screen_width)),
+            (np.array([0.0, 1.0, 0.0]), 0.0),
+            (np.array([0.0, -1.0, 0.0]), float(self.screen_height)),
+        ]
+
+        for normal, offset in edges:
+            triangles, light = clip_triangles(triangles, light, normal, offset)
+
+        return triangles, light
+
+    def _process_object(
+            self,
+            obj: Mesh,
+            world_matrix: Mat4x4,
+            world_view_projection: Mat4x4,
+            stats: FrameStats = None
+    ) -> (np.ndarray, np.ndarray, int):
+        """
+        Run a mesh through the pipeline, every stage on the whole mesh at once
+
+        :param obj: Mesh to be processed
+        :param world_matrix: Matrix placing the mesh in the world
+        :param world_view_projection: World matrix composed with the view and
+                                      projection matrices
+        :param stats: FrameStats to time stages with, None to skip timing
+        :return: Screen-space triangles of shape (K, 3, 3), their intensity
+                 of light of shape (K,) and the number of triangles which
+                 survived culling
+        """
+        return self._process_batch(
+            obj, world_matrix.as_array()[None, :3, :3], world_view_projection.as_array()[None], stats
+        )
+
+    def _process_instances(
+            self,
+            mesh: Mesh,
+            transforms: np.ndarray,
+            world_matrix: Mat4x4,
+            world_view_projection: Mat4x4,
+            stats: FrameStats = None
+    ) -> (np.ndarray, np.ndarray, int):
+        """
+        Run copies of a mesh placed by instance transforms through the pipeline
+
+        :param mesh: Mesh shared by the instances
+        :param transforms: Array of shape (I, 4, 4) placing every instance,
+                           applied before the world matrix
+        :param world_matrix: Matrix placing the instances in the world
+        :param world_view_projection: World matrix composed with the view and
+                                      projection matrices
+        :param stats: FrameStats to time stages with, None to skip timing
+        :return: Screen-space triangles of all instances, their intensity of
+                 light and the number of triangles which survived culling
+        """
+        if not self.vectorized:
+            parts = []
+
+            for transform in transforms:
+                instance = Mat4x4.from_array(transform)
+                parts.append(self._process_object_scalar(
+                    mesh, instance @ world_matrix, instance @ world_view_projection, stats
+                ))
+
+            return (
+                np.concatenate([screen for screen, _, _ in parts]),
+                np.concatenate([light for _, light, _ in parts]),
+                sum(kept for _, _, kept in parts),
+            )
+
+        linear = transforms[:, :3, :3] @ world_matrix.as_array()[:3, :3]
+
+        return self._process_batch(mesh, linear, transforms @ world_view_projection.as_array(), stats)
+
+    def _process_batch(
+            self,
+            obj: Mesh,
+            world_linear: np.ndarray,
+            world_view_projection: np.ndarray,
+            stats: FrameStats = None
+    ) -> (np.ndarray, np.ndarray, int):
+        """
+        Run copies of a mesh through the pipeline, every stage on all copies
+        at once. Each unique vertex is transformed once per copy, by a single
+        matrix taking it from Model Space into Clip Space, triangles are
+        assembled from the transformed vertices.
+
+        :param obj: Mesh to be processed
+        :param world_linear: Array of shape (I, 3, 3) with the rotation and
+                             scale placing every copy in the world
+        :param world_view_projection: Array of shape (I, 4, 4) with the
+                                      matrix taking every copy into Clip Space
+        :param stats: FrameStats to time stages with, None to skip timing
+        :return: Screen-space triangles of shape (K, 3, 3), their intensity
+                 of light of shape (K,) and the number of triangles which
+                 survived culling
+        """
+        copies = len(world_view_projection)
+        vertex_count = obj.vertex_count * copies
+        count = len(obj) * copies
+
+        # Transform vertices straight into Clip Space, w is the depth in View Space
+        clip_vertices = self.buffers.get("clip", vertex_count, (4,))
+        copy_vertices = clip_vertices.reshape(copies, obj.vertex_count, 4)
+        np.matmul(obj.vertices, world_view_projection[:, :3], out=copy_vertices)
+        copy_vertices += world_view_projection[:, None, 3]
+
+        # Faces of every copy index its own vertices
+        faces = obj.faces
+        if copies > 1:
+            offsets = np.arange(0, vertex_count, obj.vertex_count)
+            faces = self.buffers.get("faces", count, (3,), np.intp)
+            np.add(obj.faces, offsets[:, None, None], out=faces.reshape(copies, len(obj), 3))
+
+        # Assemble triangles in Clip Space
+        tri_clip = self.buffers.get("corners", count, (3, 4))
+        np.take(clip_vertices, faces, axis=0, out=tri_clip)
+
+        if stats is not None:
+            stats.lap("world_transform")
+
+        # Keep triangles facing the camera. The determinant of x, y and w of the
+        # corners is normal . (corner - camera) in World Space times the
+        # determinant of the same columns of the view and projection matrices.
+        # Their sign is the one of these columns of world_view_projection
+        # divided by the one of the world matrix.
+        x, y, w = tri_clip[:, :, 0], tri_clip[:, :, 1], tri_clip[:, :, 3]
+        determinant = self.buffers.get("determinant", count)
+        minor = self.buffers.get("minor", count)
+        product = self.buffers.get("product", count)
+
+        # Expansion along the first corner, a0 * (b1 * c2 - c1 * b2) for every row
+        for row, (a, b, c) in enumerate(((x, y, w), (y, x, w), (w, x, y))):
+            np.multiply(b[:, 1], c[:, 2], out=minor)
+            np.multiply(c[:, 1], b[:, 2], out=product)
+            minor -= product
+            minor *= a[:, 0]
+
+            if row == 0:
+                determinant[...] = minor
+            elif row == 1:
+                determinant -= minor
+            else:
+                determinant += minor
+
+        orientation = np.linalg.det(world_view_projection[:, :3][:, :, [0, 1, 3]]) * np.linalg.det(world_linear)
+        copy_determinant = determinant.reshape(copies, len(obj))
+        copy_determinant *= orientation[:, None]
+
+        facing = self.buffers.get("facing", count, (), bool)
+        np.less(determinant, 0.0, out=facing)
+
+        # Rounding errors give degenerate triangles a side
+        copy_facing = facing.reshape(copies, len(obj))
+        np.logical_and(copy_facing, obj.has_area, out=copy_facing)
+        facing_count = int(np.count_nonzero(facing))
+
+        visible_faces = self.buffers.get("visible_faces", facing_count, (3,), np.intp)
+        np.compress(facing, faces, axis=0, out=visible_faces)
+
+        # Illuminate triangles towards the camera, normals of Model Space are
+        # carried into World Space by the cofactor matrix of the world matrix
+        cofactor = np.cross(world_linear[:, [1, 2, 0]], world_linear[:, [2, 0, 1]])
+        normals = self.buffers.get("normals", count, (3,))
+        np.matmul(obj.face_normals, cofactor, out=normals.reshape(copies, len(obj), 3))
+        normal = self.buffers.get("visible_normals", facing_count, (3,))
+        np.compress(facing, normals, axis=0, out=normal)
+
+        length = self.buffers.get("normal_length", facing_count)
+        np.einsum("ij,ij->i", normal, normal, out=length)
+        np.sqrt(length, out=length)
+
+        light = self.buffers.get("object_light", facing_count)
+        np.negative(normal[:, 2], out=light)
+        np.divide(light, length, out=light, where=length != 0.)
+        np.maximum(light, 0.1, out=light)
+
+        if stats is not None:
+            stats.lap("normals_culling")
+
+        # Triangles in front of the near plane are projected as shared vertices,
+        # triangles crossing it are clipped first, triangles behind it dropped
+        in_front = self.buffers.get("in_front", vertex_count, (), bool)
+        np.greater_equal(clip_vertices[:, 3], self.near, out=in_front)
+
+        face_in_front = self.buffers.get("face_in_front", facing_count, (3,), bool)
+        np.take(in_front, visible_faces, out=face_in_front)
+        corners_in_front = self.buffers.get("corners_in_front", facing_count, (), np.intp)
+        np.sum(face_in_front, axis=1, out=corners_in_front)
+
+        whole = self.buffers.get("whole", facing_count, (), bool)
+        np.equal(corners_in_front, 3, out=whole)
+
+        # Some corners in front, but not all of them
+        crossing = self.buffers.get("crossing", facing_count, (), bool)
+        np.greater(corners_in_front, 0, out=crossing)
+        np.logical_xor(crossing, whole, out=crossing)
+
+        # Divide by w and scale vertices into view
+        screen_vertices = self._to_screen(clip_vertices, self.buffers.get("screen_vertices", vertex_count, (3,)))
+
+        # Assemble triangles in Screen Space
+        whole_count = int(np.count_nonzero(whole))
+        whole_faces = self.buffers.get("whole_faces", whole_count, (3,), np.intp)
+        np.compress(whole, visible_faces, axis=0, out=whole_faces)
+        screen = self.buffers.get("object_screen", whole_count, (3, 3))
+        np.take(screen_vertices, whole_faces, axis=0, out=screen)
+        light_whole = self.buffers.get("light_whole", whole_count)
+        np.compress(whole, light, out=light_whole)
+
+        if stats is not None:
+            stats.lap("projection")
+
+        kept = whole_count
+
+        if crossing.any():
+            tri_clipped, light_clipped = self._clip_near_plane(
+                clip_vertices[visible_faces[crossing]], light[crossing]
+            )
+            screen = np.concatenate([screen, tri_clipped])
+            light_whole = np.concatenate([light_whole, light_clipped])
+            kept += int(np.count_nonzero(crossing))
+
+            if stats is not None:
+                stats.clipped += int(np.count_nonzero(crossing))
+                stats.lap("clipping")
+
+        return screen, light_whole, kept
+
+    def _process_object_scalar(
+            self,
+            obj: Mesh,
+            world_matrix: Mat4x4,
+            world_view_projection: Mat4x4,
+            stats: FrameStats = None
+    ) -> (np.ndarray, np.ndarray, int):
+        """
+        Run a mesh through the pipeline one vertex and triangle at a time.
+        Reference for the batched path in _process_object, only the few
+        triangles crossing the near plane are clipped in a batch.
+
+        :param obj: Mesh to be processed
+        :param world_matrix: Matrix placing the mesh in the world
+        :param world_view_projection: World matrix composed with the view and
+                                      projection matrices
+        :param stats: FrameStats to time stages with, None to skip timing
+        :return: Screen-space triangles of shape (K, 3, 3), their intensity
+                 of light of shape (K,) and the number of triangles which
+                 survived culling
+        """
+        model_vertices = [Vec3(*vertex) for vertex in obj.vertices.tolist()]
+
+        # Perform Translate-Rotate-Scale matrix multiplication on vertices
+        world_vertices = [world_matrix * vertex for vertex in model_vertices]
+
+        if stats is not None:
+            stats.lap("world_transform")
+
+        # Transform vertices straight into Clip Space, divide by w and scale them into view
+        clip_vertices = [world_view_projection.transform_homogeneous(vertex) for vertex in model_vertices]
+        screen_vertices = [
+            self._scale_point(Vec3(x / w, y / w, z / w) if w != 0. else Vec3(x, y, z))
+            for x, y, z, w in clip_vertices
+        ]
+
+        if stats is not None:
+            stats.lap("projection")
+
+        triangles = []
+        lights = []
+        crossing = []
+        crossing_lights = []
+
+        # Vectors reused by every triangle
+        line_a = Vec3(0.0, 0.0, 0.0)
+        line_b = Vec3(0.0, 0.0, 0.0)
+        normal = Vec3(0.0, 0.0, 0.0)
+        to_triangle = Vec3(0.0, 0.0, 0.0)
+        light_direction = Vec3(0.0, 0.0, -1.0).normalize()  # towards the camera
+
+        # Loop on triangles in an object
+        for face in obj.faces.tolist():
+            p0, p1, p2 = (world_vertices[index] for index in face)
+
+            # Get normal of triangle
+            p1.sub_into(p0, line_a)
+            p2.sub_into(p0, line_b)
+            line_a.cross_into(line_b, normal).normalize()
+
+            if normal * p0.sub_into(self.camera.position, to_triangle) < 0.0:
+                # Illuminate triangle
+                dot_product = max(0.1, light_direction * normal)
+
+                in_front = sum(clip_vertices[index][3] >= self.near for index in face)
+
+                # Store triangle
+                if in_front == 3:
+                    triangles.append([(screen_vertices[index].x, screen_vertices[index].y, screen_vertices[index].z)
+                                      for index in face])
+                    lights.append(dot_product)
+                elif in_front:
+                    crossing.append([clip_vertices[index] for index in face])
+                    crossing_lights.append(dot_product)
+
+        if stats is not None:
+            stats.lap("normals_culling")
+
+        screen = np.array(triangles, dtype=np.float64).reshape(-1, 3, 3)
+        light = np.array(lights, dtype=np.float64)
+        kept = len(triangles) + len(crossing)
+
+        if crossing:
+            tri_clipped, light_clipped = self._clip_near_plane(
+                np.array(crossing, dtype=np.float64), np.array(crossing_lights, dtype=np.float64)
+            )
+            screen = np.concatenate([screen, tri_clipped])
+            light = np.concatenate([light, light_clipped])
+
+            if stats is not None:
+                stats.clipped += len(crossing)
+                stats.lap("clipping")
+
+        return screen, light, kept
+
+    def build_frame(self, time_diff: float) -> (np.ndarray, np.ndarray):
+        """
+        Move the camera and run all objects through the pipeline. When
+        neither the camera nor the scene changed since the last frame, the
+        last frame is returned again and `frame_reused` is set.
+
+        :param time_diff: Time since the previous frame in seconds
+        :return: Screen-space triangles of shape (K, 3, 3) and their
+                 intensity of light of shape (K,). Both can be views into
+                 frame buffers, valid until the next frame is built.
+        """
+        self.advance(time_diff)
+        self._sync_scene()
+
+        frame_key = (self.camera.version, self.scene_version, self.vectorized)
+        self.frame_reused = frame_key == self._frame_key
+
+        if self.frame_reused:
+            return self._frame
+
+        stats = FrameStats() if self.instrument else None
+        self.stats = stats
+
+        # Get objects in scene, their geometry is never modified
+        objects = self.objects
 
         # Angle for rotation
         # self.theta += time_diff * 1.0
 
-        # Setup Z and X rotation matrices
-        z_rotate = Mat4x4.z_rotation_matrix(3*pi)
-        x_rotate = Mat4x4.x_rotation_matrix(2*pi)
+        view_projection, world_planes = self._frame_matrices()
 
-        # Setup Translation matrix
-        translation_matrix = Mat4x4.translation_matrix(0.0, 0.0, 0.0)
+        if stats is not None:
+            stats.lap("camera")
 
-        # Setup World matrix
-        world_matrix = Mat4x4.multiply_matrix(z_rotate, x_rotate)
-        world_matrix = Mat4x4.multiply_matrix(world_matrix, translation_matrix)
+        process_object = self._process_object if self.vectorized else self._process_object_scalar
 
-        # Make point_at matrix
-        up_vector = Vec3(0, 1, 0)
-        target_vector = Vec3(0, 0, 1)
-        camera_rotation = Mat4x4.y_rotation_matrix(self.camera.yaw)
-        self.camera.look_direction = camera_rotation * target_vector
-        target_vector = self.camera.position + self.camera.look_direction
+        triangle_count = 0
+        for obj in objects:
+            triangle_count = triangle_count + len(obj)
 
-        camera_matrix = self._point_at_matrix(self.camera.position, target_vector, up_vector)
-        camera_view = self._quick_inverse_matrix(camera_matrix)
+        # Triangles to be drawn
+        screen = self.buffers.get("screen", 0, (3, 3))
+        light = self.buffers.get("light", 0)
+        drawn = 0
+        kept = 0
+        visible_count = 0  # Triangles of objects in the view, at full detail
+        processed = 0  # Triangles of the levels of detail run through the pipeline
 
-        # Triangle to be drawn
-        triangles_to_draw = []
+        # Skip objects outside of the view
+        visible = self._visible_objects(world_planes)
 
-        # Loop on objects in scene
-        for obj in objects:
-            # Loop on triangles in an object
-            for tri in obj:
+        if stats is not None:
+            stats.objects_culled = len(self._entry_objects) - len(visible)
+            stats.lap("frustum_culling")
 
-                # Perform Translate-Rotate-Scale matrix multiplication on triangle
-                tri_transformed = tri
-                tri_transformed.p[0] = world_matrix * tri.p[0]
-                tri_transformed.p[1] = world_matrix * tri.p[1]
-                tri_transformed.p[2] = world_matrix * tri.p[2]
+        position = self.camera.position
+        camera_position = np.array([position.x, position.y, position.z])
 
-                # Get normal of triangle
-                line_a = tri_transformed.p[1] - tri_transformed.p[0]
-                line_b = tri_transformed.p[2] - tri_transformed.p[0]
-                normal = line_a // line_b
-                normal.normalize()
+        # Loop on visible objects in scene, instances of a mesh in one batch
+        for index, mesh, transforms, full_count in self._draw_batches(visible, camera_position):
+            world_matrix, world_view_projection = self._matrices_of(index, view_projection)
 
-                if normal * (tri_transformed.p[0] - self.camera.position) < 0.0:
-                    # Illuminate triangle
-                    light_direction = Vec3(0.0, 0.0, -1.0).normalize()  # towards the camera
-                    dot_product = max(0.1, light_direction * normal)
-                    tri_transformed.angle_to_light = dot_product
+            if transforms is None:
+                tri_screen, tri_light, tri_kept = process_object(mesh, world_matrix, world_view_projection, stats)
+            else:
+                tri_screen, tri_light, tri_kept = self._process_instances(
+                    mesh, transforms, world_matrix, world_view_projection, stats
+                )
+            kept += tri_kept
+            visible_count += full_count
+            processed += len(mesh) * (1 if transforms is None else len(transforms))
 
-                    # Convert World Space into View Space
-                    tri_viewed = tri_transformed
-                    tri_viewed.p[0] = camera_view * tri_transformed.p[0]
-                    tri_viewed.p[1] = camera_view * tri_transformed.p[1]
-                    tri_viewed.p[2] = camera_view * tri_transformed.p[2]
+            screen = self.buffers.grow("screen", drawn + len(tri_screen), drawn, (3, 3))
+            light = self.buffers.grow("light", drawn + len(tri_screen), drawn)
+            screen[drawn:] = tri_screen
+            light[drawn:] = tri_light
+            drawn += len(tri_screen)
 
-                    # Project triangles
-                    tri_projected = self._project_triangle(tri_viewed)
+        # Cut triangles at edges of the screen
+        screen, light = self._clip_screen_edges(screen, light)
 
-                    # Scale triangle into view
-                    tri_scaled = self._scale_triangle(tri_projected)
+        if stats is not None:
+            stats.lap("clipping")
 
-                    # Store triangle
-                    triangles_to_draw.append(tri_scaled)
+        self.triangle_count = triangle_count
 
-        # Sort the triangles using *z-buffer*
-        triangles_to_draw.sort(key=lambda x: (x.p[0].z + x.p[1].z + x.p[2].z) / 3.0, reverse=True)
+        if stats is not None:
+            stats.submitted = triangle_count
+            stats.simplified = visible_count - processed
 
-        # Draw triangles to screen
-        for triangle in triangles_to_draw:
-            self._draw_triangle(triangle, window)
+            # Triangles of objects outside of the view and triangles of the
+            # drawn levels which didn't survive culling, simplified ones aside
+            stats.culled = triangle_count - visible_count + processed - kept
+            stats.drawn = len(screen)
 
-        # Add debug info to window
+        self._frame_key = frame_key
+        self._frame = (screen, light)
+
+        return screen, light
+
+    def debug_text(self, drawn: int) -> (str, str):
+        """
+        Text with camera position and triangle counts shown on the window,
+        followed by stage timings when instrumentation is on
+
+        :param drawn: Number of triangles drawn in the frame
+        :return: Tuple of camera text and triangle text
+        """
         camera_text = (
             f"Camera:\n"
             f" X: {self.camera.position.x}\n"
@@ -360,17 +1093,48 @@ class Renderer:
             f" Yaw: {self.camera.yaw}"
         )
 
-        triangle_count = 0
-        for obj in objects:
-            triangle_count = triangle_count + len(obj)
-
         triangle_text = (
             "Triangles:\n"
-            f" Total: {triangle_count}\n"
-            f" Drawn: {len(triangles_to_draw)}"
+            f" Total: {self.triangle_count}\n"
+            f" Drawn: {drawn}"
         )
 
-        window.create_text(5, 5, anchor=NW, text=camera_text, fill="red")
-        window.create_text(5, 100, anchor=NW, text=triangle_text, fill="red")
+        if self.stats is not None:
+            triangle_text += "\n" + self.stats.as_text()
+
+        return camera_text, triangle_text
+
+    def render_frame(self, window: "Canvas", time_diff: float) -> "Canvas":
+        """
+        Build a frame and draw it on the window using the output backend
+
+        :param window: tkinter Canvas to draw on
+        :param time_diff: Time since the previous frame in seconds
+        :return: The window
+        """
+        triangles_to_draw, angles_to_light = self.build_frame(time_diff)
+
+        # The window still shows the same frame
+        if self.frame_reused and self._presented == (window, self.backend):
+            return window
+
+        # Draw triangles to screen
+        self.backend.draw_frame(window, triangles_to_draw, angles_to_light, self.stats)
+
+        # Add debug info to window
+        self.draw_debug_text(window, self.debug_text(len(triangles_to_draw)))
+        self._presented = (window, self.backend)
 
         return window
+
+    def draw_debug_text(self, window: "Canvas", texts: (str, str)) -> None:
+        """
+        Draw text from debug_text on the window using the output backend
+
+        :param window: tkinter Canvas to draw on
+        :param texts: Tuple of camera text and triangle text
+        """
+        camera_text, triangle_text = texts
+
+        self.backend.draw_text(window, 5, 5, camera_text)
+        self.backend.draw_text(window, 5, 100, triangle_text)
@@ -0,0 +1,233 @@
+"""
+Scene graph of objects placed relative to each other.
+
+Every node has a transform relative to its parent, an optional Mesh or
+Instances drawn at it and any number of children. World matrices are
+composed from the root down only when they're asked for and kept until the
+transform of the node or of one of its ancestors changes. Moving a node
+forgets the matrices of its subtree only, so animating one node of a big
+hierarchy costs as much as the size of its subtree.
+
+A node whose world matrix is forgotten always has the matrices of all its
+descendants forgotten too, which lets both forgetting and composing stop
+early.
+"""
+import itertools
+from typing import Iterator, TypeVar
+
+from math_3d.mat4x4 import Mat4x4
+
+
+# Versions of all graphs come from a single counter, so a new graph never
+# has the version of one it replaces
+_VERSIONS = itertools.count(1)
+
+
+class SceneNode:
+    """
+    SceneNode - Transform relative to the parent, optional geometry and child nodes
+    """
+    SceneNode = TypeVar("SceneNode")
+
+    def __init__(self, geometry=None, transform: Mat4x4 = None, name: str = None):
+        """
+        :param geometry: Mesh or Instances drawn at the node, None for a node
+                         only grouping its children
+        :param transform: Mat4x4 placing the node relative to its parent,
+                          identity when None
+        :param name: Name of the node, e.g. for finding it with SceneGraph.find
+        """
+        self.name = name
+        self.geometry = geometry
+        self.parent = None
+        self.children = []
+        self.graph = None  # SceneGraph the node belongs to
+
+        self._transform = transform if transform is not None else Mat4x4.identity_matrix()
+        self._world = None  # World matrix, None until composed
+
+    @property
+    def transform(self) -> Mat4x4:
+        """ Matrix placing the node relative to its parent, assign a new one to move the node """
+        return self._transform
+
+    @transform.setter
+    def transform(self, matrix: Mat4x4) -> None:
+        self._transform = matrix
+        self._forget_world()
+
+        if self.graph is not None:
+            self.graph._moved(self)
+
+    @property
+    def world_matrix(self) -> Mat4x4:
+        """ Transform of the node followed by the transforms of all its ancestors """
+        if self._world is None:
+            # Ancestors up to the closest one with a known world matrix
+            path = []
+            node = self
+            while node is not None and node._world is None:
+                path.append(node)
+                node = node.parent
+
+            world = node._world if node is not None else None
+            for node in reversed(path):
+                world = node._transform if world is None else node._transform @ world
+                node._world = world
+
+        return self._world
+
+    @property
+    def is_composed(self) -> bool:
+        """ True when the world matrix is known and won't be composed again """
+        return self._world is not None
+
+    def add(self, child: SceneNode) -> SceneNode:
+        """
+        Attach a node below this one, detaching it from its previous parent
+
+        :param child: SceneNode, not an ancestor of this one
+        :return: child
+        """
+        node = self
+        while node is not None:
+            if node is child:
+                raise ValueError("Node can't be attached below itself")
+            node = node.parent
+
+        if child.parent is not None:
+            child.parent.remove(child)
+
+        child.parent = self
+        self.children.append(child)
+        child._forget_world()
+        child._set_graph(self.graph)
+
+        if self.graph is not None:
+            self.graph._restructured()
+
+        return child
+
+    def remove(self, child: SceneNode) -> None:
+        """
+        Detach a child node with its subtree
+
+        :param child: SceneNode, one of children
+        """
+        self.children.remove(child)
+        child.parent = None
+        child._forget_world()
+        child._set_graph(None)
+
+        if self.graph is not None:
+            self.graph._restructured()
+
+    def walk(self) -> Iterator[SceneNode]:
+        """ Nodes of the subtree, depth first, parents before their children """
+        stack = [self]
+
+        while stack:
+            node = stack.pop()
+            yield node
+            stack.extend(reversed(node.children))
+
+    def _forget_world(self) -> None:
+        """ Forget world matrices of the subtree, they're composed again when needed """
+        stack = [self]
+
+        while stack:
+            node = stack.pop()
+
+            # Its subtree is already forgotten
+            if node._world is None and node is not self:
+                continue
+
+            node._world = None
+            stack.extend(node.children)
+
+    def _set_graph(self, graph) -> None:
+        for node in self.walk():
+            node.graph = graph
+
+    def __repr__(self) -> str:
+        return f"SceneNode({self.name!r}, children={len(self.children)})"
+
+
+class SceneGraph:
+    """
+    SceneGraph - Tree of SceneNodes with versions telling what changed
+    """
+    SceneGraph = TypeVar("SceneGraph")
+
+    def __init__(self, transform: Mat4x4 = None):
+        """
+        :param transform: Mat4x4 of the root node, placing the whole scene in
+                          the world, identity when None
+        """
+        self.root = SceneNode(transform=transform, name="root")
+        self.root.graph = self
+
+        self.version = next(_VERSIONS)  # Changes whenever a node moves, is added or removed
+        self.structure_version = self.version  # Changes whenever a node is added or removed
+        self._moved_nodes = []
+
+    def add(self, node: SceneNode, parent: SceneNode = None) -> SceneNode:
+        """
+        Attach a node to the graph
+
+        :param node: SceneNode
+        :param parent: SceneNode of the graph, the root when None
+        :return: node
+        """
+        return (parent if parent is not None else self.root).add(node)
+
+    def nodes(self) -> Iterator[SceneNode]:
+        """ All nodes, depth first, parents before their children """
+        return self.root.walk()
+
+    def drawables(self) -> [SceneNode]:
+        """ Nodes with geometry, depth first """
+        return [node for node in self.nodes() if node.geometry is not None]
+
+    def find(self, name: str) -> SceneNode:
+        """
+        First node with a name
+
+        :param name: Name of the node
+        :return: SceneNode, None when there's none
+        """
+        return next((node for node in self.nodes() if node.name == name), None)
+
+    def take_moved(self) -> [SceneNode]:
+        """
+        Nodes whose transform was assigned since the previous call
+
+        :return: List of SceneNodes, moving a node also moves its subtree
+        """
+        moved, self._moved_nodes = self._moved_nodes, []
+
+        return moved
+
+    def _moved(self, node: SceneNode) -> None:
+        self.version = next(_VERSIONS)
+        self._moved_nodes.append(node)
+
+    def _restructured(self) -> None:
+        self.version = next(_VERSIONS)
+        self.structure_version = self.version
+
+    @staticmethod
+    def from_objects(objects: list, transform: Mat4x4 = None) -> SceneGraph:
+        """
+        Graph with every object in a node of its own below the root
+
+        :param objects: List of Mesh or Instances
+        :param transform: Mat4x4 of the root node, identity when None
+        :return: SceneGraph
+        """
+        graph = SceneGraph(transform)
+
+        for obj in objects:
+            graph.add(SceneNode(obj))
+
+        return graph
@@ -0,0 +1,285 @@
+"""
+Rasterizer splitting the frame into tiles drawn by a pool of processes.
+
+The color and depth buffers live in shared memory and worker processes draw
+straight into them, no pixels are ever sent between processes. Every frame,
+triangles are binned into the square tiles their bounding boxes overlap and
+copied into shared memory as well, so workers only get the bounds of their
+tiles and the indices of the triangles in them. Tiles don't overlap, so no
+two workers write the same pixels. Triangles of a tile are drawn in the order
+they were given, which gives exactly the frame Rasterizer draws.
+"""
+import os
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import get_context, shared_memory
+
+import numpy as np
+
+from pipeline.helpers.image_writer import encode_ppm
+from pipeline.rasterizer import rasterize
+
+
+# Groups of tiles sent to every worker per frame, more groups balance the
+# work better, fewer cost less to send
+TASKS_PER_WORKER = 4
+
+# Shared arrays attached in a worker process, by their role
+_ATTACHED = {}
+
+
+class _SharedArray:
+    """
+    _SharedArray - NumPy array in a block of shared memory
+    """
+
+    def __init__(self, shape: tuple, dtype):
+        size = int(np.prod(shape)) * np.dtype(dtype).itemsize
+
+        self.memory = shared_memory.SharedMemory(create=True, size=max(size, 1))
+        self.array = np.ndarray(shape, dtype=dtype, buffer=self.memory.buf)
+
+    @property
+    def spec(self) -> (str, tuple, str):
+        """ Name, shape and dtype, enough for another process to attach """
+        return self.memory.name, self.array.shape, self.array.dtype.str
+
+    def close(self) -> None:
+        """ Free the memory, arrays still viewing it keep it mapped until they're gone """
+        self.array = None
+
+        try:
+            self.memory.close()
+        except BufferError:
+            pass  # Unmapped when the last view is gone
+
+        self.memory.unlink()
+
+
+def _attach(role: str, spec: (str, tuple, str)) -> np.ndarray:
+    """
+    Array of a shared block in a worker, attached once per block
+
+    :param role: Name of the array, a new block replaces the previous one of the role
+    :param spec: _SharedArray.spec of the block
+    :return: Array viewing the block
+    """
+    name, shape, dtype = spec
+    attached = _ATTACHED.get(role)
+
+    if attached is not None and attached[0].name == name:
+        return attached[1]
+
+    if attached is not None:
+        del _ATTACHED[role]
+        memory = attached[0]
+        attached = None
+        memory.close()
+
+    memory = shared_memory.SharedMemory(name=name)
+    array = np.ndarray(shape, dtype=dtype, buffer=memory.buf)
+    _ATTACHED[role] = (memory, array)
+
+    return array
+
+
+def _draw_tiles(specs: tuple, tiles: [(int, int, int, int, np.ndarray)]) -> np.ndarray:
+    """
+    Draw tiles into the shared framebuffer, run in a worker process
+
+    :param specs: Specs of the color, depth, triangle and triangle color arrays
+    :param tiles: Tiles from bin_triangles
+    :return: Indices of triangles which covered at least one pixel
+    """
+    color = _attach("color", specs[0])
+    depth = _attach("depth", specs[1])
+    triangles = _attach("triangles", specs[2])
+    colors = _attach("colors", specs[3])
+    covered = []
+
+    for x0, y0, x1, y1, indices in tiles:
+        tile_covered = np.zeros(len(indices), dtype=bool)
+        rasterize(
+            color[y0:y1, x0:x1], depth[y0:y1, x0:x1], triangles[indices], colors[indices], (x0, y0), tile_covered
+        )
+        covered.append(indices[tile_covered])
+
+    return np.concatenate(covered)
+
+
+def bin_triangles(
+        triangles: np.ndarray,
+        width: int,
+        height: int,
+        tile_size: int
+) -> [(int, int, int, int, np.ndarray)]:
+    """
+    Find triangles overlapping every tile of the screen
+
+    :param triangles: Array of shape (K, 3, 3) with screen-space triangles
+    :param width: int representing width of the screen
+    :param height: int representing height of the screen
+    :param tile_size: Width and height of tiles in pixels
+    :return: List of (x0, y0, x1, y1, indices) of tiles with any triangles,
+             x1 and y1 excluded, indices of triangles in ascending order
+    """
+    x = triangles[:, :, 0]
+    y = triangles[:, :, 1]
+
+    # Pixels sampled by the rasterizer, see setup_triangles
+    min_x = np.maximum(np.floor(x.min(axis=1)), 0)
+    min_y = np.maximum(np.floor(y.min(axis=1)), 0)
+    max_x = np.minimum(np.ceil(x.max(axis=1)), width - 1)
+    max_y = np.minimum(np.ceil(y.max(axis=1)), height - 1)
+
+    index = np.flatnonzero((min_x <= max_x) & (min_y <= max_y))
+    if len(index) == 0:
+        return []
+
+    tile_x0 = min_x[index].astype(np.intp) // tile_size
+    tile_y0 = min_y[index].astype(np.intp) // tile_size
+    columns = max_x[index].astype(np.intp) // tile_size - tile_x0 + 1
+    rows = max_y[index].astype(np.intp) // tile_size - tile_y0 + 1
+
+    # One pair for every tile of every triangle
+    counts = columns * rows
+    pair_count = int(counts.sum())
+    pair_triangles = np.repeat(index, counts)
+    pair_columns = np.repeat(columns, counts)
+    step = np.arange(pair_count) - np.repeat(np.cumsum(counts) - counts, counts)
+    tile_x = np.repeat(tile_x0, counts) + step % pair_columns
+    tile_y = np.repeat(tile_y0, counts) + step // pair_columns
+
+    tiles_across = -(-width // tile_size)
+    pair_tiles = tile_y * tiles_across + tile_x
+
+    order = np.argsort(pair_tiles, kind="stable")
+    pair_tiles = pair_tiles[order]
+    pair_triangles = pair_triangles[order]
+
+    starts = np.flatnonzero(np.diff(pair_tiles, prepend=-1))
+    ends = np.append(starts[1:], pair_count)
+    tiles = []
+
+    for start, end in zip(starts.tolist(), ends.tolist()):
+        row, column = divmod(int(pair_tiles[start]), tiles_across)
+        x0 = column * tile_size
+        y0 = row * tile_size
+        tiles.append((x0, y0, min(x0 + tile_size, width), min(y0 + tile_size, height), pair_triangles[start:end]))
+
+    return tiles
+
+
+class TiledRasterizer:
+    """
+    TiledRasterizer - Framebuffer in shared memory drawn by worker processes
+    """
+
+    def __init__(
+            self,
+            width: int,
+            height: int,
+            workers: int = None,
+            tile_size: int = 64,
+            background: (int, int, int) = (0, 0, 0)
+    ):
+        """
+        :param width: int representing width of the framebuffer
+        :param height: int representing height of the framebuffer
+        :param workers: Number of processes, number of CPUs when None
+        :param tile_size: Width and height of tiles in pixels
+        :param background: RGB color of pixels not covered by any triangle
+        """
+        self.width = width
+        self.height = height
+        self.workers = workers or os.cpu_count() or 1
+        self.tile_size = tile_size
+        self.background = np.array(background, dtype=np.uint8)
+
+        self._color = _SharedArray((height, width, 3), np.uint8)
+        self._depth = _SharedArray((height, width), np.float64)
+        self._triangles = None
+        self._colors = None
+
+        self.color = self._color.array
+        self.depth = self._depth.array
+        self.clear()
+
+        # Forked workers would inherit threads and the Tk connection
+        self._executor = ProcessPoolExecutor(max_workers=self.workers, mp_context=get_context("spawn"))
+
+    def __enter__(self) -> "TiledRasterizer":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def clear(self) -> None:
+        """ Fill framebuffer with background color and infinite depth """
+        self.color[...] = self.background
+        self.depth.fill(np.inf)
+
+    def draw_triangles(self, triangles: np.ndarray, colors: np.ndarray) -> int:
+        """
+        Draw triangles into the framebuffer, tiles are drawn in parallel
+
+        :param triangles: Array of shape (K, 3, 3) with screen-space triangles
+        :param colors: Array of shape (K, 3) with RGB color of every triangle
+        :return: Number of triangles which covered at least one pixel
+        """
+        tiles = bin_triangles(triangles, self.width, self.height, self.tile_size)
+        if not tiles:
+            return 0
+
+        self._share_triangles(triangles, colors)
+
+        specs = (self._color.spec, self._depth.spec, self._triangles.spec, self._colors.spec)
+        task_count = min(len(tiles), self.workers * TASKS_PER_WORKER)
+
+        # Neighbouring tiles cost about the same, spread them over tasks
+        groups = [tiles[start::task_count] for start in range(task_count)]
+        covered = np.zeros(len(triangles), dtype=bool)
+
+        for indices in self._executor.map(_draw_tiles, [specs] * task_count, groups):
+            covered[indices] = True
+
+        return int(np.count_nonzero(covered))
+
+    def _share_triangles(self, triangles: np.ndarray, colors: np.ndarray) -> None:
+        """ Copy triangles and their colors into shared memory, growing it when needed """
+        count = len(triangles)
+
+        if self._triangles is None or len(self._triangles.array) < count:
+            capacity = count if self._triangles is None else max(count, 2 * len(self._triangles.array))
+
+            # Workers attach the new blocks, the old ones are unlinked right away
+            if self._triangles is not None:
+                self._triangles.close()
+                self._colors.close()
+
+            self._triangles = _SharedArray((capacity, 3, 3), np.float64)
+            self._colors = _SharedArray((capacity, 3), np.uint8)
+
+        self._triangles.array[:count] = triangles
+        self._colors.array[:count] = colors
+
+    def to_ppm(self) -> bytes:
+        """
+        Framebuffer as a binary PPM image
+
+        :return: bytes of the image
+        """
+        return encode_ppm(self.color)
+
+    def close(self) -> None:
+        """ Stop the worker processes and free shared memory """
+        self._executor.shutdown()
+
+        self.color = None
+        self.depth = None
+
+        for shared in (self._color, self._depth, self._triangles, self._colors):
+            if shared is not None:
+                shared.close()
+
+        self._triangles = None
+        self._colors = None
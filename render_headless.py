@@ -0,0 +1,77 @@
+import argparse
+import os
+import time
+
+from helpers.loggers import get_a_logger
+from pipeline.backends.headless import HeadlessBackend
+from pipeline.batch import render_frames, write_frames, write_raw_stream
+from pipeline.helpers.model_reader import ModelReader
+from pipeline.rasterizer import make_tiled_rasterizer
+from pipeline.renderer import Renderer
+
+
+_LOGGER = get_a_logger(__name__)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Render frames to image files without a display")
+    parser.add_argument("--model", action="append", help="path to an .obj model, can be repeated")
+    parser.add_argument("--frames", type=int, default=1, help="number of frames to render")
+    parser.add_argument("--width", type=int, default=600)
+    parser.add_argument("--height", type=int, default=600)
+    parser.add_argument("--camera", type=float, nargs=3, default=[0., 0., -10.], metavar=("X", "Y", "Z"))
+    parser.add_argument("--yaw", type=float, default=0.)
+    parser.add_argument(
+        "--move",
+        choices=["UP", "DOWN", "LEFT", "RIGHT", "FORWARDS", "BACKWARDS", "TURN_LEFT", "TURN_RIGHT"],
+        help="direction the camera moves in between frames",
+    )
+    parser.add_argument("--time-step", type=float, default=1 / 30, help="seconds between frames")
+    parser.add_argument(
+        "--workers",
+        type=int,
+        help="rasterize tiles of every frame in this many processes, 0 for all CPUs, one process by default",
+    )
+    parser.add_argument("--format", choices=["png", "ppm", "raw"], default="png")
+    parser.add_argument(
+        "--output",
+        default="frames",
+        help="directory for image files, or file for the raw stream ('-' for stdout)",
+    )
+    args = parser.parse_args()
+
+    objects = [ModelReader.read_obj_model(path) for path in (args.model or [r"models/axis.obj"])]
+
+    rasterizer = None if args.workers is None else make_tiled_rasterizer(args.width, args.height, args.workers)
+
+    ren = Renderer(
+        near=0.1,
+        far=100.,
+        fov=90.,
+        screen_height=args.height,
+        screen_width=args.width,
+        backend=HeadlessBackend(args.width, args.height, rasterizer=rasterizer),
+        objects=objects,
+    )
+    ren.camera.position.x, ren.camera.position.y, ren.camera.position.z = args.camera
+    ren.camera.yaw = args.yaw
+    ren.camera.move_direction = args.move
+
+    frames = render_frames(ren, args.frames, args.time_step)
+    start = time.perf_counter()
+
+    if args.format == "raw":
+        if args.output == "-":
+            written = write_raw_stream(frames)
+        else:
+            with open(args.output, "wb") as stream:
+                written = write_raw_stream(frames, stream)
+    else:
+        os.makedirs(args.output, exist_ok=True)
+        written = write_frames(frames, os.path.join(args.output, "frame_{:04d}." + args.format))
+
+    elapsed = time.perf_counter() - start
+    _LOGGER.info(f"Rendered {written} frames in {elapsed:.3f}s ({written / max(elapsed, 1e-9):.1f} FPS)")
+
+    if args.workers is not None:
+        ren.backend.rasterizer.close()
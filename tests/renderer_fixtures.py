@@ -0,0 +1,47 @@
+"""
+Renderers and helpers shared by the tests.
+"""
+import numpy as np
+
+from pipeline.backends.headless import HeadlessBackend
+from pipeline.helpers.model_reader import ModelReader
+from pipeline.renderer import Renderer
+
+
+def read_ship():
+    """ Mesh of the ship model, read without writing a cache file into the source tree """
+    return ModelReader.read_obj_model(r"models/ship.obj", cache=False)
+
+
+def make_renderer(objects: list = None, width: int = 40, height: int = 30, backend=None, **kwargs) -> Renderer:
+    """
+    Renderer of a small screen drawn without a display
+
+    :param objects: List of meshes and Instances, the ship model when
+                    neither objects nor a scene are given
+    :param width: int representing width of the screen
+    :param height: int representing height of the screen
+    :param backend: Output backend, HeadlessBackend of the screen size when None
+    :param kwargs: Other arguments of Renderer, e.g. scene or instrument
+    :return: Renderer
+    """
+    if objects is None and "scene" not in kwargs:
+        objects = [read_ship()]
+
+    return Renderer(
+        near=0.1,
+        far=100.,
+        fov=90.,
+        screen_height=height,
+        screen_width=width,
+        backend=backend if backend is not None else HeadlessBackend(width, height),
+        objects=objects,
+        **kwargs,
+    )
+
+
+def sorted_triangles(triangles: np.ndarray) -> np.ndarray:
+    """ Triangles in a fixed order, so frames can be compared """
+    rows = np.round(triangles.reshape(len(triangles), -1), 6)
+
+    return rows[np.lexsort(rows.T[::-1])]
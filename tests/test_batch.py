@@ -0,0 +1,54 @@
+import io
+import os
+import tempfile
+import unittest
+
+from pipeline.batch import render_frames, write_frames, write_raw_stream
+from pipeline.helpers.image_writer import encode_png, encode_ppm
+from renderer_fixtures import make_renderer
+
+
+class TestBatch(unittest.TestCase):
+    """
+    Unit tests for headless batch rendering
+    """
+
+    def test_render_frames(self):
+        """Test frames are rendered into the framebuffer"""
+        frames = list(render_frames(make_renderer(), 2, 0.1))
+
+        self.assertEqual(2, len(frames), "Asserting number of frames")
+        self.assertEqual((30, 40, 3), frames[0].shape, "Asserting shape of frame")
+        self.assertGreater(frames[0].sum(), 0, "Asserting something was drawn")
+
+    def test_render_frames_needs_headless_backend(self):
+        """Test rendering raises without a framebuffer to render into"""
+        renderer = make_renderer()
+        renderer.backend = object()
+
+        with self.assertRaises(ValueError):
+            next(render_frames(renderer, 1, 0.1))
+
+    def test_write_frames(self):
+        """Test every frame is written to its own file"""
+        with tempfile.TemporaryDirectory() as directory:
+            pattern = os.path.join(directory, "frame_{:02d}.png")
+            written = write_frames(render_frames(make_renderer(), 3, 0.1), pattern)
+
+            self.assertEqual(3, written, "Asserting number of frames written")
+            self.assertEqual(["frame_00.png", "frame_01.png", "frame_02.png"], sorted(os.listdir(directory)))
+
+    def test_write_raw_stream(self):
+        """Test frames are written back to back as RGB24"""
+        stream = io.BytesIO()
+        written = write_raw_stream(render_frames(make_renderer(), 2, 0.1), stream)
+
+        self.assertEqual(2, written, "Asserting number of frames written")
+        self.assertEqual(2 * 40 * 30 * 3, len(stream.getvalue()), "Asserting size of the stream")
+
+    def test_encode_images(self):
+        """Test PPM and PNG headers"""
+        frame = make_renderer().backend.rasterizer.color
+
+        self.assertTrue(encode_ppm(frame).startswith(b"P6 40 30 255\n"), "Asserting PPM header")
+        self.assertTrue(encode_png(frame).startswith(b"\x89PNG\r\n\x1a\n"), "Asserting PNG signature")
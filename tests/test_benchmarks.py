@@ -0,0 +1,33 @@
+import unittest
+
+from benchmarks.render_benchmark import run_benchmarks
+from benchmarks.synthetic import uv_sphere
+
+
+class TestBenchmarks(unittest.TestCase):
+    """
+    Unit tests for the render benchmarks
+    """
+
+    def test_uv_sphere(self):
+        """Test synthetic sphere has at least the requested triangles"""
+        sphere = uv_sphere(1000)
+
+        self.assertGreaterEqual(len(sphere), 1000, "Asserting triangle count")
+        self.assertLess(len(sphere), 1500, "Asserting triangle count is close")
+        self.assertEqual(sphere.vertex_count, sphere.deduplicate().vertex_count, "Asserting vertices are shared")
+
+    def test_run_benchmarks(self):
+        """Test report of a short benchmark run"""
+        report = run_benchmarks(["axis"], ["geometry"], ["vectorized", "scalar"], 1, 0, 1000, 10, cache=False)
+
+        self.assertEqual(2, len(report["results"]), "Asserting one result per path")
+        self.assertEqual(3, report["results"][0]["frames"], "Asserting one frame per camera position")
+        self.assertIn("p99_ms", report["results"][0])
+
+    def test_limits_skip_cases(self):
+        """Test cases above limits are reported as skipped"""
+        report = run_benchmarks(["axis"], ["headless"], ["scalar"], 1, 0, 10, 10, cache=False)
+
+        self.assertEqual([], report["results"], "Asserting nothing was run")
+        self.assertEqual(1, len(report["skipped"]), "Asserting skipped case")
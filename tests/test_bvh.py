@@ -0,0 +1,74 @@
+import unittest
+
+import numpy as np
+
+from math_3d.vec3 import Vec3
+from pipeline.backends.headless import HeadlessBackend
+from pipeline.bvh import BVH
+from pipeline.frustum import Frustum
+from pipeline.helpers.model_reader import ModelReader
+from pipeline.renderer import Renderer
+
+
+class TestBVH(unittest.TestCase):
+    """
+    Unit tests for BVH
+    """
+    frustum = Frustum(near=0.1, far=100.0, x_scale=1.0, y_scale=1.0, x_range=(-1.0, 1.0), y_range=(-1.0, 1.0))
+
+    def setUp(self):
+        random = np.random.default_rng(7)
+        self.centers = random.uniform(-60.0, 60.0, (500, 3))
+        self.radii = random.uniform(0.1, 3.0, 500)
+
+    def test_query_matches_linear_test(self):
+        """Test query finds the same spheres as testing each one"""
+        bvh = BVH(self.centers, self.radii)
+        expected = np.flatnonzero(self.frustum.spheres_visible(self.centers, self.radii))
+
+        self.assertEqual(expected.tolist(), bvh.query(self.frustum.planes).tolist())
+
+    def test_update(self):
+        """Test moved spheres are found at their new positions"""
+        bvh = BVH(self.centers, self.radii)
+
+        bvh.update(3, np.array([0.0, 0.0, -50.0]), 1.0)  # Behind the camera
+        bvh.update(4, np.array([0.0, 0.0, 50.0]), 1.0)  # In front of the camera
+        found = bvh.query(self.frustum.planes).tolist()
+
+        self.assertNotIn(3, found, "Asserting sphere moved out of view is skipped")
+        self.assertIn(4, found, "Asserting sphere moved into view is found")
+
+        expected = np.flatnonzero(self.frustum.spheres_visible(bvh.centers, bvh.radii))
+        self.assertEqual(expected.tolist(), found)
+
+    def test_empty(self):
+        """Test tree without items"""
+        bvh = BVH(np.empty((0, 3)), np.empty(0))
+
+        self.assertEqual(0, len(bvh.query(self.frustum.planes)))
+
+    def test_world_planes(self):
+        """Test planes moved into World Space agree with View Space planes"""
+        camera_view = np.eye(4)
+        camera_view[3, :3] = [5.0, -2.0, 3.0]  # World Space point p is p + t in View Space
+
+        world = self.frustum.world_planes(camera_view)
+        expected = self.frustum.spheres_visible(self.centers + camera_view[3, :3], self.radii)
+        distance = self.centers @ world[:, :3].T + world[:, 3]
+
+        self.assertEqual(expected.tolist(), np.all(distance >= -self.radii[:, None], axis=1).tolist())
+
+    def test_renderer_skips_objects_outside_of_view(self):
+        """Test renderer only processes objects found by the index"""
+        ship = ModelReader.read_obj_model(r"models/ship.obj", cache=False)
+        renderer = Renderer(
+            near=0.1, far=100., fov=90., screen_height=60, screen_width=60,
+            backend=HeadlessBackend(60, 60), objects=[ship, ship], instrument=True,
+        )
+        renderer.object_index.update(1, np.array([0.0, 0.0, -50.0]), 1.0)
+        renderer.camera.position = Vec3(0, 0, -10)
+
+        renderer.build_frame(0.0)
+
+        self.assertEqual(1, renderer.stats.objects_culled, "Asserting one object was culled")
@@ -0,0 +1,115 @@
+import unittest
+
+import numpy as np
+
+from math_3d.vec3 import Vec3
+from pipeline.backends.headless import HeadlessBackend
+from pipeline.clipping import clip_triangles
+from pipeline.frustum import Frustum
+from pipeline.helpers.model_reader import ModelReader
+from pipeline.renderer import Renderer
+
+
+def _area(triangles):
+    line_a = triangles[:, 1, :2] - triangles[:, 0, :2]
+    line_b = triangles[:, 2, :2] - triangles[:, 0, :2]
+    return np.abs(line_a[:, 0] * line_b[:, 1] - line_a[:, 1] * line_b[:, 0]).sum() / 2
+
+
+class TestClipping(unittest.TestCase):
+    """
+    Unit tests for clip_triangles and Frustum
+    """
+    triangle = np.array([[[0.0, 0.0, 0.0], [4.0, 0.0, 0.0], [0.0, 4.0, 0.0]]])
+    light = np.array([0.5])
+
+    def test_inside(self):
+        """Test triangles inside are returned untouched"""
+        triangles, light = clip_triangles(self.triangle, self.light, np.array([1.0, 0.0, 0.0]), 1.0)
+
+        self.assertIs(self.triangle, triangles, "Asserting input was returned")
+        self.assertIs(self.light, light, "Asserting input was returned")
+
+    def test_outside(self):
+        """Test triangles outside are dropped"""
+        triangles, light = clip_triangles(self.triangle, self.light, np.array([1.0, 0.0, 0.0]), -5.0)
+
+        self.assertEqual(0, len(triangles), "Asserting triangle was dropped")
+        self.assertEqual(0, len(light), "Asserting light was dropped")
+
+    def test_two_corners_inside(self):
+        """Test keeping two corners gives two triangles"""
+        # Keep x <= 2
+        triangles, light = clip_triangles(self.triangle, self.light, np.array([-1.0, 0.0, 0.0]), 2.0)
+
+        self.assertEqual(2, len(triangles), "Asserting quad split in two")
+        self.assertAlmostEqual(6.0, _area(triangles), msg="Asserting area of clipped part")
+        self.assertTrue((triangles[:, :, 0] <= 2.0 + 1e-9).all(), "Asserting all corners inside")
+        self.assertEqual([0.5, 0.5], light.tolist(), "Asserting light was copied")
+
+    def test_one_corner_inside(self):
+        """Test keeping one corner gives one smaller triangle"""
+        # Keep x >= 2
+        triangles, light = clip_triangles(self.triangle, self.light, np.array([1.0, 0.0, 0.0]), -2.0)
+
+        self.assertEqual(1, len(triangles), "Asserting one triangle")
+        self.assertAlmostEqual(2.0, _area(triangles), msg="Asserting area of clipped part")
+        self.assertTrue((triangles[:, :, 0] >= 2.0 - 1e-9).all(), "Asserting all corners inside")
+
+    def test_frustum_spheres(self):
+        """Test spheres in front, behind and beside the camera"""
+        frustum = Frustum(near=0.1, far=100.0, x_scale=1.0, y_scale=1.0, x_range=(-1.0, 1.0), y_range=(-1.0, 1.0))
+        centers = np.array([[0.0, 0.0, 10.0], [0.0, 0.0, -10.0], [30.0, 0.0, 10.0], [11.0, 0.0, 10.0]])
+        radii = np.array([1.0, 1.0, 1.0, 2.0])
+
+        self.assertEqual([True, False, False, True], frustum.spheres_visible(centers, radii).tolist())
+
+    def test_renderer_culls_objects_behind_camera(self):
+        """Test objects behind the camera are skipped as a whole"""
+        renderer = Renderer(
+            near=0.1, far=100., fov=90., screen_height=60, screen_width=60,
+            backend=HeadlessBackend(60, 60), objects=[ModelReader.read_obj_model(r"models/ship.obj", cache=False)],
+            instrument=True,
+        )
+        renderer.camera.position = Vec3(0, 0, 10)
+
+        triangles, _ = renderer.build_frame(0.0)
+
+        self.assertEqual(0, len(triangles), "Asserting nothing is drawn")
+        self.assertEqual(1, renderer.stats.objects_culled, "Asserting object was culled")
+
+    def test_renderer_clips_to_screen(self):
+        """Test camera inside of a model gives triangles on the screen only"""
+        renderer = Renderer(
+            near=0.1, far=100., fov=90., screen_height=60, screen_width=80,
+            backend=HeadlessBackend(80, 60), objects=[ModelReader.read_obj_model(r"models/teapot.obj", cache=False)],
+        )
+        renderer.camera.position = Vec3(0, -1, 0)
+
+        for vectorized in (True, False):
+            renderer.vectorized = vectorized
+            triangles, _ = renderer.build_frame(0.0)
+
+            self.assertGreater(len(triangles), 0, "Asserting something is drawn")
+            self.assertTrue((triangles[:, :, 0] >= -1e-6).all() and (triangles[:, :, 0] <= 80 + 1e-6).all())
+            self.assertTrue((triangles[:, :, 1] >= -1e-6).all() and (triangles[:, :, 1] <= 60 + 1e-6).all())
+
+    def test_renderer_paths_match(self):
+        """Test batched and scalar paths give the same frame with a turned camera"""
+        renderer = Renderer(
+            near=0.1, far=100., fov=90., screen_height=60, screen_width=80,
+            backend=HeadlessBackend(80, 60), objects=[ModelReader.read_obj_model(r"models/teapot.obj", cache=False)],
+        )
+        renderer.camera.position = Vec3(2, 1, -3)
+        renderer.camera.yaw = 0.7
+
+        frames = []
+        for vectorized in (True, False):
+            renderer.vectorized = vectorized
+            triangles, light = renderer.build_frame(0.0)
+            frames.append((triangles.copy(), light.copy()))
+
+        (triangles, light), (expected_triangles, expected_light) = frames
+        self.assertEqual(expected_triangles.shape, triangles.shape, "Asserting same number of triangles")
+        self.assertTrue(np.allclose(expected_triangles, triangles), "Asserting same triangles")
+        self.assertTrue(np.allclose(expected_light, light), "Asserting same light")
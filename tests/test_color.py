@@ -1,4 +1,7 @@
 import unittest
+
+import numpy as np
+
 from pipeline.helpers.color import Color
 
 
@@ -66,3 +69,45 @@ class TestColor(unittest.TestCase):
 
         green_as_hls = Color(Color.HLS, *green_as_rgb.to_hls())
         self.assertEqual("#00ff00", green_as_hls.to_hex())
+
+    def test_rgb_to_hls_array(self):
+        """Test batched rgb conversion to hls matches single colors"""
+        rgb = [[0, 255, 0], [255, 0, 0], [0, 0, 0], [128, 128, 128]]
+        hls = Color.rgb_to_hls_array(rgb)
+
+        self.assertEqual([120, 0.5, 1.0], hls[0].tolist(), "Asserting green")
+        self.assertEqual([0.0, 0.0, 0.0], hls[2].tolist(), "Asserting black")
+        self.assertEqual(0.0, hls[3][2], "Asserting grey has no saturation")
+
+    def test_hls_to_rgb_array(self):
+        """Test batched hls conversion to rgb matches single colors"""
+        hls = [[120, 0.5, 1.0], [0, 0.5, 1.0], [360, 0, 0], [357, 1, 0.21], [200, 0.3, 0.7]]
+        expected = [Color(Color.HLS, *values).to_rgb() for values in hls]
+
+        self.assertEqual(expected, Color.hls_to_rgb_array(hls).tolist())
+
+    def test_round_trip_array(self):
+        """Test many colors survive conversion to hls and back"""
+        rgb = np.random.default_rng(0).integers(0, 256, (1000, 3))
+
+        self.assertTrue(np.array_equal(rgb, Color.hls_to_rgb_array(Color.rgb_to_hls_array(rgb))))
+
+    def test_hex_array(self):
+        """Test hex strings and packed values of many colors"""
+        rgb = [[0, 255, 0], [1, 2, 3]]
+
+        self.assertEqual(["#00ff00", "#010203"], Color.to_hex_array(rgb))
+        self.assertEqual([0x00ff00, 0x010203], Color.pack_rgb_array(rgb).tolist())
+
+    def test_array_validation(self):
+        """Test batched conversions raise on values beyond range unless told not to check"""
+        with self.assertRaises(ValueError):
+            Color.rgb_to_hls_array([[0, 256, 0]])
+
+        with self.assertRaises(ValueError):
+            Color.hls_to_rgb_array([[120, 1.5, 0]])
+
+        with self.assertRaises(ValueError):
+            Color.to_hex_array([0, 255])
+
+        Color.hls_to_rgb_array([[120, 1.5, 0]], validate=False)
@@ -0,0 +1,88 @@
+import unittest
+
+from pipeline.frame_loop import FrameLoop
+
+
+class _Clock:
+    """ Clock moved by hand """
+
+    def __init__(self):
+        self.now = 100.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestFrameLoop(unittest.TestCase):
+    """
+    Unit tests for FrameLoop
+    """
+
+    def _make_loop(self, **options):
+        self.clock = _Clock()
+        self.steps = []
+        self.frames = 0
+
+        def render():
+            self.frames += 1
+
+        return FrameLoop(self.steps.append, render, time_step=0.01, clock=self.clock, **options)
+
+    def test_fixed_steps(self):
+        """Test steps are of fixed size and leftover time carries over"""
+        loop = self._make_loop()
+        loop.tick()
+
+        self.clock.now += 0.025
+        loop.tick()
+        self.assertEqual([0.01, 0.01], self.steps, "Asserting two whole steps")
+
+        self.clock.now += 0.006
+        loop.tick()
+        self.assertEqual(3, len(self.steps), "Asserting leftover time made a step")
+        self.assertEqual(3, self.frames, "Asserting a frame per tick")
+
+    def test_max_steps(self):
+        """Test a long pause doesn't run an unbounded number of steps"""
+        loop = self._make_loop(max_steps=4)
+        loop.tick()
+
+        self.clock.now += 10.0
+        loop.tick()
+        self.assertEqual(4, len(self.steps), "Asserting steps were capped")
+
+        self.clock.now += 0.01
+        loop.tick()
+        self.assertEqual(5, len(self.steps), "Asserting dropped time isn't made up later")
+
+    def test_frame_cap(self):
+        """Test waiting time keeps frames at the capped rate"""
+        loop = self._make_loop(max_fps=50)
+
+        self.assertAlmostEqual(0.02, loop.tick(), msg="Asserting wait for the next frame")
+
+        self.clock.now += 0.015
+        self.assertAlmostEqual(0.025, loop.tick(), msg="Asserting schedule is kept")
+
+        self.clock.now += 0.1
+        self.assertEqual(0.0, loop.tick(), "Asserting no wait after a slow frame")
+
+        self.clock.now += 0.005
+        self.assertAlmostEqual(0.015, loop.tick(), msg="Asserting no burst of frames catching up")
+
+    def test_no_cap(self):
+        """Test frames aren't delayed without a cap"""
+        loop = self._make_loop()
+
+        self.assertEqual(0.0, loop.tick())
+
+    def test_fps(self):
+        """Test measured frame rate"""
+        loop = self._make_loop()
+        loop.tick()
+
+        for _ in range(50):
+            self.clock.now += 0.04
+            loop.tick()
+
+        self.assertAlmostEqual(25.0, loop.fps)
@@ -0,0 +1,47 @@
+import unittest
+
+from pipeline.helpers.frame_stats import FrameStats
+from renderer_fixtures import make_renderer
+
+
+class TestFrameStats(unittest.TestCase):
+    """
+    Unit tests for FrameStats
+    """
+
+    def test_lap(self):
+        """Test laps add up per stage"""
+        stats = FrameStats()
+        stats.lap("a")
+        stats.lap("b")
+        stats.lap("a")
+
+        self.assertEqual(["a", "b"], list(stats.stage_times), "Asserting order of stages")
+        self.assertGreaterEqual(stats.total_time, 0.0, "Asserting total time")
+
+    def test_as_text(self):
+        """Test text contains stages and counts"""
+        stats = FrameStats()
+        stats.lap("world_transform")
+        stats.submitted, stats.culled, stats.drawn = 10, 4, 6
+
+        self.assertIn("world_transform", stats.as_text())
+        self.assertIn("Submitted: 10 Culled: 4 Drawn: 6", stats.as_text())
+
+    def test_renderer_stats(self):
+        """Test renderer fills stats of the last frame"""
+        renderer = make_renderer(instrument=True)
+        renderer.render_frame(None, 0.0)
+        stats = renderer.stats
+
+        self.assertEqual(renderer.triangle_count, stats.submitted, "Asserting submitted triangles")
+        self.assertEqual(stats.submitted, stats.culled + stats.drawn, "Asserting counts add up")
+        for stage in ("camera", "world_transform", "normals_culling", "projection", "rasterize"):
+            self.assertIn(stage, stats.stage_times, f"Asserting {stage} was timed")
+
+    def test_renderer_without_stats(self):
+        """Test nothing is timed when instrumentation is off"""
+        renderer = make_renderer(instrument=False)
+        renderer.render_frame(None, 0.0)
+
+        self.assertIsNone(renderer.stats)
@@ -0,0 +1,136 @@
+import time
+import unittest
+
+import numpy as np
+
+from math_3d.vec3 import Vec3
+from pipeline.backends.headless import HeadlessBackend
+from pipeline.frame_worker import FrameWorker
+from renderer_fixtures import make_renderer
+
+
+class _RecordingBackend(HeadlessBackend):
+    """ HeadlessBackend remembering what the Tk thread was given """
+
+    def __init__(self, width: int, height: int):
+        super().__init__(width, height)
+        self.drawn = []
+        self.texts = []
+
+    def draw_frame(self, window, triangles, angles_to_light, stats=None):
+        self.drawn.append(triangles)
+        super().draw_frame(window, triangles, angles_to_light, stats)
+
+    def draw_text(self, window, x, y, text):
+        self.texts.append(text)
+
+
+class _BlitBackend(_RecordingBackend):
+    """ Backend showing images rasterized by the worker """
+
+    def blit(self, window, data):
+        self.drawn.append(data)
+
+
+class _FailingBackend(_BlitBackend):
+    def rasterize(self, triangles, angles_to_light, stats=None):
+        raise ValueError("broken")
+
+
+def _present(worker, window=None, timeout=5.0):
+    """ Call present like the Tk loop does until a frame was drawn """
+    end = time.monotonic() + timeout
+
+    while not worker.present(window):
+        if time.monotonic() > end:
+            raise AssertionError("No frame was presented")
+        time.sleep(0.001)
+
+
+class TestFrameWorker(unittest.TestCase):
+    """
+    Unit tests for building frames on a worker thread
+    """
+
+    def test_frames_match_render_frame(self):
+        """Test presented triangles are the ones render_frame draws"""
+        renderer = make_renderer(backend=_RecordingBackend(40, 30))
+        renderer.camera.position = Vec3(0, 0, -10)
+        expected, _ = renderer.build_frame(0.0)
+        expected = expected.copy()
+        renderer.invalidate()
+
+        worker = FrameWorker(renderer)
+        worker.start()
+        try:
+            _present(worker)
+        finally:
+            worker.stop()
+
+        np.testing.assert_array_equal(expected, renderer.backend.drawn[0])
+        self.assertEqual(2, len(renderer.backend.texts), "Asserting debug text is drawn")
+        self.assertEqual(1, worker.presented)
+
+    def test_steps_are_applied(self):
+        """Test queued steps move the camera before the next frame"""
+        renderer = make_renderer(backend=_RecordingBackend(40, 30))
+        renderer.camera.move_direction = "LEFT"
+        start = renderer.camera.position.x
+
+        worker = FrameWorker(renderer)
+        worker.advance(0.5)
+        worker.advance(0.5)
+        worker.start()
+        try:
+            _present(worker)
+        finally:
+            worker.stop()
+
+        self.assertAlmostEqual(start - 8.0, renderer.camera.position.x, msg="Asserting both steps were applied")
+        self.assertEqual(1, len(renderer.backend.drawn))
+
+    def test_still_frames_are_not_queued(self):
+        """Test nothing new is presented while nothing changes"""
+        renderer = make_renderer(backend=_RecordingBackend(40, 30))
+        worker = FrameWorker(renderer)
+        worker.start()
+        try:
+            _present(worker)
+
+            for _ in range(5):
+                worker.present(None)
+                time.sleep(0.005)
+        finally:
+            worker.stop()
+
+        self.assertEqual(1, len(renderer.backend.drawn), "Asserting still frame was drawn once")
+
+    def test_rasterized_on_worker(self):
+        """Test backends with blit get finished images"""
+        renderer = make_renderer(backend=_BlitBackend(40, 30))
+        worker = FrameWorker(renderer)
+        worker.start()
+        try:
+            _present(worker)
+        finally:
+            worker.stop()
+
+        image = renderer.backend.drawn[0]
+        self.assertIsInstance(image, bytes)
+        self.assertTrue(image.startswith(b"P6"), "Asserting image is a PPM")
+
+    def test_error_is_raised_on_present(self):
+        """Test a failure on the worker is raised on the presenting thread"""
+        worker = FrameWorker(make_renderer(backend=_FailingBackend(40, 30)))
+        worker.start()
+        worker._thread.join(5.0)
+
+        with self.assertRaises(RuntimeError) as context:
+            worker.present(None)
+
+        self.assertIsInstance(context.exception.__cause__, ValueError)
+        worker.stop()
+
+
+if __name__ == '__main__':
+    unittest.main()
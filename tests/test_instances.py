@@ -0,0 +1,74 @@
+import unittest
+
+import numpy as np
+
+from math_3d.mat4x4 import Mat4x4
+from math_3d.vec3 import Vec3
+from pipeline.helpers.instances import Instances
+from pipeline.helpers.mesh import Mesh
+from pipeline.helpers.model_reader import ModelReader
+from renderer_fixtures import make_renderer, sorted_triangles
+
+
+def _make_renderer(objects):
+    return make_renderer(objects, 80, 60, instrument=True)
+
+
+class TestInstances(unittest.TestCase):
+    """
+    Unit tests for Instances
+    """
+
+    def setUp(self):
+        ship = ModelReader.read_obj_model(r"models/ship.obj", cache=False, lod_levels=0)
+
+        # Degenerate faces of copies placed by hand get a side from rounding errors
+        self.ship = Mesh(ship.vertices, ship.faces[ship.face_normals.any(axis=1)])
+
+    def test_shares_mesh(self):
+        """Test instances keep one mesh and a transform per copy"""
+        instances = Instances.from_translations(self.ship, [[0, 0, 0], [5, 0, 0], [0, 5, 0]])
+
+        self.assertIs(self.ship, instances.mesh, "Asserting mesh is not copied")
+        self.assertEqual(3, instances.instance_count)
+        self.assertEqual(3 * len(self.ship), len(instances), "Asserting triangles of all copies")
+        self.assertEqual([5, 0, 0], instances.transforms[1, 3, :3].tolist(), "Asserting translation")
+        self.assertFalse(instances.transforms.flags.writeable, "Asserting transforms are read-only")
+
+    def test_matches_separate_meshes(self):
+        """Test instances give the frame of copies of the mesh placed by hand"""
+        transforms = [
+            Mat4x4.translation_matrix(-3.0, 0.0, 0.0),
+            Mat4x4.y_rotation_matrix(0.7) @ Mat4x4.translation_matrix(3.0, 1.0, 2.0),
+        ]
+        copies = [
+            Mesh(transform.transform_points(self.ship.vertices, projective=False), self.ship.faces)
+            for transform in transforms
+        ]
+
+        for vectorized in (True, False):
+            instanced = _make_renderer([Instances(self.ship, transforms)])
+            separate = _make_renderer(copies)
+            instanced.vectorized = separate.vectorized = vectorized
+
+            triangles, light = instanced.build_frame(0.0)
+            expected, expected_light = separate.build_frame(0.0)
+
+            self.assertGreater(len(triangles), 0, "Asserting something is drawn")
+            np.testing.assert_allclose(sorted_triangles(expected), sorted_triangles(triangles), atol=1e-6)
+            np.testing.assert_allclose(np.sort(expected_light), np.sort(light), atol=1e-9)
+            self.assertEqual(separate.stats.culled, instanced.stats.culled, "Asserting culled triangles")
+
+    def test_instances_are_culled(self):
+        """Test every instance is culled on its own"""
+        instances = Instances.from_translations(self.ship, [[0, 0, 0], [0, 0, -50], [200, 0, 0]])
+        renderer = _make_renderer([instances])
+        renderer.camera.position = Vec3(0, 0, -10)
+
+        renderer.build_frame(0.0)
+
+        self.assertEqual(2, renderer.stats.objects_culled, "Asserting instances out of view were culled")
+
+
+if __name__ == '__main__':
+    unittest.main()
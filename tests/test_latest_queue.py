@@ -0,0 +1,44 @@
+import threading
+import unittest
+
+from pipeline.helpers.latest_queue import LatestQueue
+
+
+class TestLatestQueue(unittest.TestCase):
+    """
+    Unit tests for LatestQueue
+    """
+
+    def test_latest_wins(self):
+        """Test putting into a full queue drops the oldest item"""
+        queue = LatestQueue(2)
+
+        for item in range(5):
+            queue.put(item)
+
+        self.assertEqual(2, len(queue), "Asserting queue is bounded")
+        self.assertEqual(3, queue.dropped, "Asserting dropped items are counted")
+        self.assertEqual(3, queue.get_nowait(), "Asserting oldest kept item comes first")
+        self.assertEqual(4, queue.get_nowait(), "Asserting latest item is kept")
+        self.assertIsNone(queue.get_nowait(), "Asserting empty queue gives None")
+
+    def test_get_waits(self):
+        """Test get waits for an item from another thread and times out"""
+        queue = LatestQueue()
+
+        self.assertIsNone(queue.get(timeout=0.01), "Asserting get times out on empty queue")
+
+        producer = threading.Timer(0.01, queue.put, ("frame",))
+        producer.start()
+
+        self.assertEqual("frame", queue.get(timeout=5.0), "Asserting get wakes up on put")
+        producer.join()
+
+    def test_size(self):
+        """Test queue holds at least one item"""
+        with self.assertRaises(ValueError):
+            LatestQueue(0)
+
+
+if __name__ == '__main__':
+    unittest.main()
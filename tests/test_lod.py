@@ -0,0 +1,99 @@
+import unittest
+
+import numpy as np
+
+from benchmarks.synthetic import uv_sphere
+from math_3d.vec3 import Vec3
+from pipeline.backends.headless import HeadlessBackend
+from pipeline.helpers.lod import build_lods, cluster_vertices, pick_level, simplify
+from pipeline.helpers.mesh import Mesh
+from pipeline.helpers.model_reader import ModelReader
+from pipeline.renderer import Renderer
+
+
+class TestLod(unittest.TestCase):
+    """
+    Unit tests for levels of detail
+    """
+
+    def test_cluster_keeps_flat_faces_flat(self):
+        """Test merged vertices of a plane stay on the plane"""
+        x, y = np.meshgrid(np.arange(11.0), np.arange(11.0))
+        vertices = np.stack([x.ravel(), y.ravel(), np.full(121, 2.0)], axis=1)
+        index = np.arange(121).reshape(11, 11)[:-1, :-1].ravel()
+        faces = np.concatenate([
+            np.stack([index, index + 11, index + 1], axis=1),
+            np.stack([index + 1, index + 11, index + 12], axis=1),
+        ])
+        plane = Mesh(vertices, faces)
+
+        simplified = cluster_vertices(plane, 3)
+
+        self.assertLess(len(simplified), len(plane), "Asserting triangles were removed")
+        self.assertTrue(np.allclose(2.0, simplified.vertices[:, 2]), "Asserting vertices on the plane")
+        self.assertTrue((simplified.face_normals[:, 2] < 0).all(), "Asserting winding is kept")
+
+    def test_simplify_sphere(self):
+        """Test simplified sphere has about the wanted triangles and keeps its shape"""
+        sphere = uv_sphere(5000)
+        simplified = simplify(sphere, 1000)
+
+        self.assertLessEqual(len(simplified), 1000, "Asserting target is not exceeded")
+        self.assertGreater(len(simplified), 500, "Asserting target is nearly reached")
+
+        radii = np.linalg.norm(simplified.vertices, axis=1)
+        self.assertTrue(np.allclose(3.0, radii, atol=0.1), "Asserting vertices stay on the sphere")
+
+    def test_build_lods(self):
+        """Test every level is coarser than the one before"""
+        sphere = uv_sphere(5000)
+        lods = build_lods(sphere, levels=3, ratio=0.25, min_triangles=64)
+        counts = [len(sphere)] + [len(lod) for lod in lods]
+
+        self.assertEqual(3, len(lods), "Asserting number of levels")
+        self.assertEqual(sorted(counts, reverse=True), counts, "Asserting levels get coarser")
+        self.assertEqual([], build_lods(uv_sphere(100)), "Asserting small meshes get no levels")
+
+    def test_pick_level_hysteresis(self):
+        """Test level is kept near a boundary and changed past it"""
+        counts = [1000, 250, 60]
+
+        self.assertEqual(0, pick_level(counts, 16000.0), "Asserting big area picks full detail")
+        self.assertEqual(2, pick_level(counts, 100.0), "Asserting small area picks coarsest level")
+        self.assertEqual(1, pick_level(counts, 3900.0), "Asserting level for area just past a boundary")
+        self.assertEqual(1, pick_level(counts, 3900.0, current=1), "Asserting level is kept")
+        self.assertEqual(0, pick_level(counts, 3900.0, current=0), "Asserting finer level is kept too")
+        self.assertEqual(1, pick_level(counts, 5000.0, current=1), "Asserting level kept inside the band")
+        self.assertEqual(0, pick_level(counts, 5500.0, current=1), "Asserting finer level past the band")
+        self.assertEqual(1, pick_level(counts, 3000.0, current=0), "Asserting coarser level past the band")
+
+    def test_model_reader_builds_lods(self):
+        """Test big models get levels of detail when they're read"""
+        self.assertEqual(3, len(ModelReader.read_obj_model(r"models/teapot.obj", cache=False).lods))
+        self.assertEqual([], ModelReader.read_obj_model(r"models/teapot.obj", cache=False, lod_levels=0).lods)
+
+    def test_renderer_picks_levels(self):
+        """Test far objects are drawn with fewer triangles"""
+        sphere = uv_sphere(20000)
+        sphere.lods = build_lods(sphere)
+        renderer = Renderer(
+            near=0.1, far=1000., fov=90., screen_height=600, screen_width=600,
+            backend=HeadlessBackend(600, 600), objects=[sphere], instrument=True,
+        )
+
+        renderer.camera.position = Vec3(0, 0, -5)
+        renderer.build_frame(0.0)
+        self.assertEqual(0, renderer.stats.simplified, "Asserting near sphere has full detail")
+
+        renderer.camera.position = Vec3(0, 0, -200)
+        renderer.build_frame(0.0)
+        self.assertEqual(len(sphere) - len(sphere.lods[-1]), renderer.stats.simplified,
+                         "Asserting far sphere uses the coarsest level")
+
+        stats = renderer.stats
+        self.assertEqual(stats.submitted, stats.simplified + stats.culled + stats.drawn,
+                         "Asserting simplified triangles aren't counted as culled")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,6 +1,8 @@
 import unittest
 from math import cos, sin
 
+import numpy as np
+
 from math_3d.vec3 import Vec3
 from math_3d.mat4x4 import Mat4x4
 
@@ -142,3 +144,73 @@ class TestMat4x4(unittest.TestCase):
         self.assertEqual(row_1, identity_matrix[1], "Asserting mat[1] row for identity_matrix")
         self.assertEqual(row_2, identity_matrix[2], "Asserting mat[2] row for identity_matrix")
         self.assertEqual(row_3, identity_matrix[3], "Asserting mat[3] row for identity_matrix")
+
+    def test_compose(self):
+        """ Test compose and @ apply the left matrix first """
+        rotation = Mat4x4.z_rotation_matrix(0.5)
+        translation = Mat4x4.translation_matrix(2.0, 3.0, 1.0)
+        vec = Vec3(1, 2, 3)
+
+        expected = translation * (rotation * vec)
+        result = (rotation @ translation) * vec
+
+        self.assertAlmostEqual(expected.x, result.x, msg="Asserting vec.x from composed matrix")
+        self.assertAlmostEqual(expected.y, result.y, msg="Asserting vec.y from composed matrix")
+        self.assertAlmostEqual(expected.z, result.z, msg="Asserting vec.z from composed matrix")
+
+    def test_transpose(self):
+        """ Test transpose """
+        matrix = Mat4x4(range(16)).transpose().m
+
+        self.assertEqual([0.0, 4.0, 8.0, 12.0], matrix[0], "Asserting mat[0] row for transpose")
+        self.assertEqual([3.0, 7.0, 11.0, 15.0], matrix[3], "Asserting mat[3] row for transpose")
+
+    def test_inverse(self):
+        """ Test inverse composed with the matrix gives identity """
+        matrix = Mat4x4.x_rotation_matrix(0.3) @ Mat4x4.translation_matrix(2.0, 3.0, 1.0)
+        matrix.m[0][1] = 2.0  # Shear
+        matrix.m[2][3] = 0.5  # Projective
+        identity = Mat4x4.identity_matrix().m
+
+        result = (matrix @ matrix.inverse()).m
+
+        for row in range(4):
+            for column in range(4):
+                self.assertAlmostEqual(identity[row][column], result[row][column], msg=f"Asserting mat[{row}][{column}]")
+
+        with self.assertRaises(ValueError):
+            Mat4x4().inverse()
+
+    def test_transform_homogeneous(self):
+        """ Test transform_homogeneous keeps w """
+        matrix = Mat4x4.identity_matrix()
+        matrix.m[2][3] = 1.0
+        matrix.m[3][3] = 0.0
+
+        self.assertEqual((1.0, 2.0, 3.0, 3.0), matrix.transform_homogeneous(Vec3(1, 2, 3)))
+
+    def test_transform_points(self):
+        """ Test transform_points matches transforming one Vec3 at a time """
+        matrix = Mat4x4.z_rotation_matrix(0.5) @ Mat4x4.translation_matrix(2.0, 3.0, 1.0)
+        matrix.m[2][3] = 1.0
+        vectors = [Vec3(1, 2, 3), Vec3(-1, 0, 2), Vec3(0, 0, 0)]
+        expected = [[vec.x, vec.y, vec.z] for vec in (matrix * vec for vec in vectors)]
+
+        self.assertTrue(np.allclose(expected, matrix.transform_points(vectors)), "Asserting sequence of Vec3")
+
+        out = np.empty((3, 3))
+        points = np.array([[1, 2, 3, 1], [-1, 0, 2, 1], [0, 0, 0, 1]], dtype=np.float64)
+        self.assertIs(out, matrix.transform_points(points, out=out), "Asserting out is returned")
+        self.assertTrue(np.allclose(expected, out), "Asserting array of shape (N, 4)")
+
+    def test_transform_points_modes(self):
+        """ Test affine and homogeneous modes of transform_points """
+        matrix = Mat4x4.translation_matrix(2.0, 3.0, 1.0)
+        matrix.m[2][3] = 1.0
+        points = np.array([[1.0, 2.0, 3.0]])
+
+        self.assertEqual([[3.0, 5.0, 4.0]], matrix.transform_points(points, projective=False).tolist())
+        self.assertEqual([[3.0, 5.0, 4.0, 4.0]], matrix.transform_points(points, divide=False).tolist())
+
+        with self.assertRaises(ValueError):
+            matrix.transform_points(points, out=np.empty((1, 4)))
@@ -0,0 +1,89 @@
+import unittest
+
+from math_3d.vec3 import Vec3
+from pipeline.helpers.mesh import Mesh
+from pipeline.helpers.model_reader import ModelReader
+from pipeline.helpers.triangle import Triangle
+
+
+class TestMesh(unittest.TestCase):
+    """
+    Unit tests for Mesh
+    """
+
+    def test_mesh(self):
+        """Test mesh constructor builds contiguous arrays"""
+        mesh = Mesh([[0, 0, 0], [1, 0, 0], [0, 1, 0]], [[0, 1, 2]])
+
+        self.assertEqual((3, 3), mesh.vertices.shape, "Asserting shape of vertices")
+        self.assertEqual((1, 3), mesh.faces.shape, "Asserting shape of faces")
+        self.assertTrue(mesh.vertices.flags["C_CONTIGUOUS"], "Asserting vertices are contiguous")
+        self.assertEqual(1, len(mesh), "Asserting triangle count")
+
+    def test_empty_mesh(self):
+        """Test mesh without any faces"""
+        mesh = Mesh([], [])
+
+        self.assertEqual((0, 3), mesh.vertices.shape, "Asserting shape of vertices")
+        self.assertEqual((0, 3, 3), mesh.triangles().shape, "Asserting shape of triangles")
+
+    def test_triangles(self):
+        """Test gathering vertices of faces"""
+        mesh = Mesh([[0, 0, 0], [1, 0, 0], [0, 1, 0], [0, 0, 1]], [[0, 1, 2], [3, 2, 1]])
+        triangles = mesh.triangles()
+
+        self.assertEqual((2, 3, 3), triangles.shape, "Asserting shape of triangles")
+        self.assertEqual([0, 0, 1], triangles[1][0].tolist(), "Asserting first corner of second face")
+
+    def test_from_triangles(self):
+        """Test round trip between Triangle objects and a mesh"""
+        triangle = Triangle(Vec3(0.0, 0.0, 0.0), Vec3(0.0, 1.0, 0.0), Vec3(1.0, 1.0, 0.0))
+        mesh = Mesh.from_triangles([triangle])
+        result = mesh.to_triangles()[0]
+
+        self.assertEqual(1, len(mesh), "Asserting triangle count")
+        for index in range(3):
+            self.assertEqual(triangle.p[index], result.p[index], f"Asserting point {index}")
+
+    def test_read_obj_model(self):
+        """Test reading .obj file into a mesh"""
+        mesh = ModelReader.read_obj_model(r"models/axis.obj", cache=False)
+
+        self.assertIsInstance(mesh, Mesh)
+        self.assertGreater(len(mesh), 0, "Asserting faces were read")
+        self.assertLess(mesh.faces.max(), mesh.vertex_count, "Asserting indices point at vertices")
+
+    def test_read_only(self):
+        """Test geometry of a mesh can't be modified in place"""
+        mesh = Mesh([[0, 0, 0], [1, 0, 0], [0, 1, 0]], [[0, 1, 2]])
+
+        with self.assertRaises(ValueError):
+            mesh.vertices[0, 0] = 1.0
+
+    def test_has_area(self):
+        """Test faces with corners on a line have no area"""
+        mesh = Mesh([[0, 0, 0], [1, 0, 0], [0, 1, 0], [2, 0, 0]], [[0, 1, 2], [0, 1, 3]])
+
+        self.assertEqual([True, False], mesh.has_area.tolist())
+        self.assertIs(mesh.has_area, mesh.has_area, "Asserting mask is kept")
+
+    def test_deduplicate(self):
+        """Test equal vertices are merged and faces point at shared ones"""
+        mesh = Mesh(
+            [[0, 0, 0], [1, 0, 0], [0, 1, 0], [1, 0, 0], [0, 1, 0], [1, 1, 0]],
+            [[0, 1, 2], [3, 5, 4]],
+        ).deduplicate()
+
+        self.assertEqual(4, mesh.vertex_count, "Asserting unique vertex count")
+        self.assertEqual([[0, 1, 2], [1, 3, 2]], mesh.faces.tolist(), "Asserting faces use shared vertices")
+        self.assertEqual([1, 1, 0], mesh.vertices[3].tolist(), "Asserting order of first appearance")
+
+    def test_from_triangles_shares_vertices(self):
+        """Test triangles sharing an edge share vertices in a mesh"""
+        triangles = [
+            Triangle(Vec3(0.0, 0.0, 0.0), Vec3(0.0, 1.0, 0.0), Vec3(1.0, 1.0, 0.0)),
+            Triangle(Vec3(0.0, 0.0, 0.0), Vec3(1.0, 1.0, 0.0), Vec3(1.0, 0.0, 0.0)),
+        ]
+        mesh = Mesh.from_triangles(triangles)
+
+        self.assertEqual(4, mesh.vertex_count, "Asserting unique vertex count")
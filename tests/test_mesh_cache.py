@@ -0,0 +1,96 @@
+import os
+import shutil
+import tempfile
+import unittest
+from unittest import mock
+
+import numpy as np
+
+from pipeline.helpers import mesh_cache
+from pipeline.helpers.model_reader import ModelReader
+
+
+class TestMeshCache(unittest.TestCase):
+    """
+    Unit tests for the binary mesh cache
+    """
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.source = os.path.join(self.directory, "ship.obj")
+        shutil.copy(r"models/ship.obj", self.source)
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def test_round_trip(self):
+        """Test cached mesh equals the parsed one and is memory-mapped"""
+        parsed = ModelReader.read_obj_model(self.source)
+        self.assertTrue(os.path.exists(mesh_cache.cache_path(self.source)), "Asserting cache was written")
+
+        cached = mesh_cache.load_mesh(self.source)
+
+        self.assertIsNotNone(cached, "Asserting cache is valid")
+        self.assertTrue(np.array_equal(parsed.vertices, cached.vertices), "Asserting vertices")
+        self.assertTrue(np.array_equal(parsed.faces, cached.faces), "Asserting faces")
+        self.assertFalse(cached.vertices.flags.owndata, "Asserting vertices are mapped, not copied")
+
+    def test_cache_dir(self):
+        """Test cache files kept in a separate directory"""
+        cache_dir = os.path.join(self.directory, "cache")
+        ModelReader.read_obj_model(self.source, cache_dir=cache_dir)
+
+        self.assertEqual(1, len(os.listdir(cache_dir)), "Asserting one cache file")
+        self.assertFalse(os.path.exists(mesh_cache.cache_path(self.source)), "Asserting nothing next to source")
+        self.assertIsNotNone(mesh_cache.load_mesh(self.source, cache_dir))
+
+    def test_changed_source(self):
+        """Test cache of a modified source is not used"""
+        ModelReader.read_obj_model(self.source)
+
+        with open(self.source, "a") as file:
+            file.write("v 1.0 2.0 3.0\n")
+
+        self.assertIsNone(mesh_cache.load_mesh(self.source), "Asserting stale cache is rejected")
+
+    def test_touched_source(self):
+        """Test cache of a source with new modification time but same content"""
+        ModelReader.read_obj_model(self.source)
+        status = os.stat(self.source)
+        os.utime(self.source, ns=(status.st_atime_ns, status.st_mtime_ns + 10 ** 9))
+
+        self.assertIsNotNone(mesh_cache.load_mesh(self.source), "Asserting cache is still valid")
+
+    def test_without_cache(self):
+        """Test reading without the cache leaves no files behind"""
+        ModelReader.read_obj_model(self.source, cache=False)
+
+        self.assertEqual(["ship.obj"], os.listdir(self.directory))
+
+    def test_levels_of_detail(self):
+        """Test levels of detail are cached with the mesh and not built again"""
+        source = os.path.join(self.directory, "teapot.obj")
+        shutil.copy(r"models/teapot.obj", source)
+
+        parsed = ModelReader.read_obj_model(source, lod_levels=3)
+
+        with mock.patch("pipeline.helpers.model_reader.build_lods") as build_lods:
+            cached = ModelReader.read_obj_model(source, lod_levels=3)
+
+        build_lods.assert_not_called()
+        self.assertEqual([len(lod) for lod in parsed.lods], [len(lod) for lod in cached.lods])
+
+        for parsed_lod, cached_lod in zip(parsed.lods, cached.lods):
+            self.assertTrue(np.array_equal(parsed_lod.vertices, cached_lod.vertices), "Asserting lod vertices")
+            self.assertTrue(np.array_equal(parsed_lod.faces, cached_lod.faces), "Asserting lod faces")
+            self.assertFalse(cached_lod.faces.flags.owndata, "Asserting lod faces are mapped, not copied")
+
+        self.assertEqual(1, len(mesh_cache.load_mesh(source, lod_levels=1).lods), "Asserting fewer levels")
+        self.assertEqual([], mesh_cache.load_mesh(source).lods, "Asserting no levels")
+        self.assertIsNone(mesh_cache.load_mesh(source, lod_levels=4), "Asserting missing levels need a rebuild")
+
+    def test_complete_chain(self):
+        """Test a chain which stopped early serves any number of levels"""
+        ModelReader.read_obj_model(self.source, lod_levels=3)
+
+        self.assertEqual([], mesh_cache.load_mesh(self.source, lod_levels=5).lods)
@@ -0,0 +1,105 @@
+import os
+import tempfile
+import unittest
+
+import numpy as np
+
+from pipeline.helpers import obj_parser
+from pipeline.helpers.growable_array import GrowableArray
+from pipeline.helpers.model_reader import ModelReader
+from pipeline.helpers.obj_parser import ObjParseError, ObjParser, iter_obj, read_obj
+
+
+SQUARE = """
+# Square made of a single quad
+v 0 0 0
+v 1 0 0
+v 1 1 0 1.0
+v 0 1 0
+vt 0 0
+vn 0 0 1
+g square
+f 1/1/1 2//1 3/1 -1
+"""
+
+
+class TestObjParser(unittest.TestCase):
+    """
+    Unit tests for the .obj parser
+    """
+
+    def _parse(self, text: str):
+        parser = ObjParser()
+        parser.feed(text.splitlines())
+
+        return parser.finish()
+
+    def test_polygon(self):
+        """Test quad with mixed corner syntax and a negative index is split into a fan"""
+        mesh = self._parse(SQUARE)
+
+        self.assertEqual((4, 3), mesh.vertices.shape, "Asserting vertices, w is dropped")
+        self.assertEqual([[0, 1, 2], [0, 2, 3]], mesh.faces.tolist(), "Asserting fan of triangles")
+
+    def test_negative_indices(self):
+        """Test negative indices count from the last vertex read so far"""
+        mesh = self._parse("v 0 0 0\nv 1 0 0\nv 0 1 0\nf -3 -2 -1\nv 0 0 1\nf -3 -2 -1\n")
+
+        self.assertEqual([[0, 1, 2], [1, 2, 3]], mesh.faces.tolist())
+
+    def test_bytes(self):
+        """Test lines read from a binary file"""
+        mesh = self._parse(SQUARE)
+        parser = ObjParser()
+        parser.feed(SQUARE.encode().splitlines())
+
+        self.assertTrue(np.array_equal(mesh.faces, parser.finish().faces))
+
+    def test_errors(self):
+        """Test malformed records"""
+        for text in ("v 1 2\n", "v 0 0 0\nf 1 2\n", "v 0 0 0\nf 1 a 1\n", "v 0 0 0\nf 0 1 1\n", "f 1 2 3\n"):
+            with self.assertRaises(ObjParseError, msg=text):
+                self._parse(text)
+
+    def test_partial_meshes(self):
+        """Test partial meshes while reading a file"""
+        handle, path = tempfile.mkstemp(suffix=".obj")
+        os.close(handle)
+        self.addCleanup(os.remove, path)
+
+        with open(path, "w") as file:
+            file.write("v 0 0 0\nv 1 0 0\nv 0 1 0\n" + "f 1 2 3\n" * 10000 + "v 0 0 1\n" + "f 2 3 4\n" * 10000)
+
+        read_size = obj_parser._READ_SIZE
+        obj_parser._READ_SIZE = 1000
+        self.addCleanup(setattr, obj_parser, "_READ_SIZE", read_size)
+
+        meshes = list(iter_obj(path, faces_per_mesh=5000))
+
+        self.assertGreater(len(meshes), 2, "Asserting partial meshes were yielded")
+        self.assertEqual(20000, len(meshes[-1]), "Asserting last mesh is complete")
+        for mesh in meshes:
+            self.assertTrue((mesh.faces < mesh.vertex_count).all(), "Asserting faces refer to read vertices")
+
+    def test_models(self):
+        """Test bundled models parse the same as before"""
+        mesh = ModelReader.read_obj_model(r"models/teapot.obj", cache=False)
+
+        self.assertEqual(6320, len(mesh), "Asserting triangle count")
+        self.assertTrue(np.array_equal(read_obj(r"models/teapot.obj").triangles(), mesh.triangles()))
+
+
+class TestGrowableArray(unittest.TestCase):
+    """
+    Unit tests for GrowableArray
+    """
+
+    def test_extend(self):
+        """Test appending rows past the initial capacity"""
+        array = GrowableArray((3,), np.intp, capacity=2)
+        array.extend([[0, 1, 2]])
+        array.extend(np.arange(30).reshape(10, 3))
+
+        self.assertEqual(11, len(array), "Asserting row count")
+        self.assertEqual([0, 1, 2], array.data[0].tolist(), "Asserting first row kept")
+        self.assertEqual([27, 28, 29], array.to_array()[-1].tolist(), "Asserting last row")
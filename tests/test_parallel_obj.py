@@ -0,0 +1,64 @@
+import os
+import tempfile
+import unittest
+
+import numpy as np
+
+from pipeline.helpers.obj_parser import read_obj
+from pipeline.helpers.parallel_obj import read_obj_parallel, split_file
+
+
+class TestParallelObj(unittest.TestCase):
+    """
+    Unit tests for parallel .obj loading
+    """
+
+    def _write(self, text: str) -> str:
+        handle, path = tempfile.mkstemp(suffix=".obj")
+        with os.fdopen(handle, "w") as file:
+            file.write(text)
+        self.addCleanup(os.remove, path)
+
+        return path
+
+    def _strip(self, count: int) -> str:
+        """ Strip of quads, faces use positive and negative indices """
+        lines = []
+        for index in range(count):
+            lines.append(f"v {index} 0 0\nv {index} 1 0\n")
+            if index:
+                lines.append(f"f {2 * index - 1}/1 {2 * index + 1}/1 -1 -3\n")
+
+        return "".join(lines)
+
+    def test_split_file(self):
+        """Test ranges cover the file and start at line starts"""
+        path = self._write(self._strip(100))
+        chunks = split_file(path, 7)
+
+        with open(path, "rb") as file:
+            data = file.read()
+
+        self.assertEqual(0, chunks[0][0], "Asserting first range starts at 0")
+        self.assertEqual(len(data), chunks[-1][1], "Asserting last range ends at the end")
+        for (_, end), (start, _) in zip(chunks, chunks[1:]):
+            self.assertEqual(end, start, "Asserting ranges are adjacent")
+            self.assertEqual(b"\n", data[start - 1:start], "Asserting range starts at a line start")
+
+    def test_matches_serial(self):
+        """Test parallel parse equals serial parse"""
+        path = self._write(self._strip(500))
+        serial = read_obj(path)
+        parallel = read_obj_parallel(path, workers=2)
+
+        self.assertEqual(998, len(parallel), "Asserting triangle count")
+        self.assertTrue(np.array_equal(serial.vertices, parallel.vertices), "Asserting vertices")
+        self.assertTrue(np.array_equal(serial.faces, parallel.faces), "Asserting faces")
+
+    def test_indented_vertices(self):
+        """Test files whose vertices can't be counted quickly are still parsed right"""
+        path = self._write(self._strip(200).replace("v ", "  v "))
+        serial = read_obj(path)
+        parallel = read_obj_parallel(path, workers=2)
+
+        self.assertTrue(np.array_equal(serial.faces, parallel.faces), "Asserting faces")
@@ -0,0 +1,66 @@
+import unittest
+
+import numpy as np
+
+from pipeline.rasterizer import Rasterizer
+
+
+class TestRasterizer(unittest.TestCase):
+    """
+    Unit tests for Rasterizer
+    """
+
+    def test_clear(self):
+        """Test framebuffer starts with background and infinite depth"""
+        rasterizer = Rasterizer(4, 3, background=(1, 2, 3))
+
+        self.assertEqual((3, 4, 3), rasterizer.color.shape, "Asserting shape of color buffer")
+        self.assertEqual([1, 2, 3], rasterizer.color[2, 3].tolist(), "Asserting background color")
+        self.assertTrue(np.isinf(rasterizer.depth).all(), "Asserting depth is cleared")
+
+    def test_draw_triangle(self):
+        """Test triangle covers pixels inside of it only"""
+        rasterizer = Rasterizer(10, 10)
+        triangle = np.array([[[0, 0, 0.5], [10, 0, 0.5], [0, 10, 0.5]]], dtype=np.float64)
+
+        drawn = rasterizer.draw_triangles(triangle, np.array([[255, 0, 0]]))
+
+        self.assertEqual(1, drawn, "Asserting triangle was drawn")
+        self.assertEqual([255, 0, 0], rasterizer.color[1, 1].tolist(), "Asserting pixel inside")
+        self.assertEqual([0, 0, 0], rasterizer.color[9, 9].tolist(), "Asserting pixel outside")
+        self.assertEqual(0.5, rasterizer.depth[1, 1], "Asserting depth of pixel inside")
+
+    def test_winding_order(self):
+        """Test triangles are drawn regardless of order of their corners"""
+        rasterizer = Rasterizer(10, 10)
+        triangle = np.array([[[0, 0, 0.5], [0, 10, 0.5], [10, 0, 0.5]]], dtype=np.float64)
+
+        rasterizer.draw_triangles(triangle, np.array([[255, 0, 0]]))
+
+        self.assertEqual([255, 0, 0], rasterizer.color[1, 1].tolist(), "Asserting pixel inside")
+
+    def test_depth_test(self):
+        """Test nearer triangle wins no matter the order of drawing"""
+        rasterizer = Rasterizer(10, 10)
+        triangles = np.array([
+            [[0, 0, 0.2], [10, 0, 0.2], [0, 10, 0.2]],
+            [[0, 0, 0.8], [10, 0, 0.8], [0, 10, 0.8]],
+        ], dtype=np.float64)
+
+        rasterizer.draw_triangles(triangles, np.array([[255, 0, 0], [0, 0, 255]]))
+
+        self.assertEqual([255, 0, 0], rasterizer.color[1, 1].tolist(), "Asserting nearer color")
+        self.assertEqual(0.2, rasterizer.depth[1, 1], "Asserting nearer depth")
+
+    def test_outside_of_screen(self):
+        """Test triangles outside of the framebuffer are skipped"""
+        rasterizer = Rasterizer(10, 10)
+        triangle = np.array([[[20, 20, 0.5], [30, 20, 0.5], [20, 30, 0.5]]], dtype=np.float64)
+
+        self.assertEqual(0, rasterizer.draw_triangles(triangle, np.array([[255, 0, 0]])))
+
+    def test_to_ppm(self):
+        """Test framebuffer encoded as binary PPM"""
+        rasterizer = Rasterizer(2, 1, background=(255, 0, 0))
+
+        self.assertEqual(b"P6 2 1 255\n\xff\x00\x00\xff\x00\x00", rasterizer.to_ppm())
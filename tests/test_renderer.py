@@ -0,0 +1,87 @@
+import unittest
+
+from math_3d.mat4x4 import Mat4x4
+from math_3d.vec3 import Vec3
+from pipeline.backends.headless import HeadlessBackend
+from pipeline.camera import Camera
+from renderer_fixtures import make_renderer
+
+
+class _CountingBackend(HeadlessBackend):
+    """ HeadlessBackend counting drawn frames """
+
+    def __init__(self, width: int, height: int):
+        super().__init__(width, height)
+        self.frames = 0
+
+    def draw_frame(self, window, triangles, angles_to_light, stats=None):
+        self.frames += 1
+        super().draw_frame(window, triangles, angles_to_light, stats)
+
+
+def _make_renderer():
+    return make_renderer(backend=_CountingBackend(40, 30))
+
+
+class TestRendererCaching(unittest.TestCase):
+    """
+    Unit tests for reusing matrices and frames while nothing changes
+    """
+
+    def test_camera_version(self):
+        """Test version changes only when the camera moved"""
+        camera = Camera(Vec3(0, 0, -10))
+        version = camera.version
+
+        self.assertEqual(version, camera.version, "Asserting still camera keeps its version")
+
+        camera.position.x += 1.0
+        self.assertNotEqual(version, camera.version, "Asserting moving in place changes version")
+
+        version = camera.version
+        camera.yaw = 0.5
+        self.assertNotEqual(version, camera.version, "Asserting turning changes version")
+
+    def test_still_frame_is_reused(self):
+        """Test nothing is built or drawn again while nothing changes"""
+        renderer = _make_renderer()
+        renderer.render_frame(None, 0.1)
+        renderer.render_frame(None, 0.1)
+
+        self.assertTrue(renderer.frame_reused, "Asserting frame was reused")
+        self.assertEqual(1, renderer.backend.frames, "Asserting frame was drawn once")
+
+        renderer.camera.move_direction = "LEFT"
+        renderer.render_frame(None, 0.1)
+
+        self.assertFalse(renderer.frame_reused, "Asserting moving camera builds a new frame")
+        self.assertEqual(2, renderer.backend.frames, "Asserting new frame was drawn")
+
+    def test_scene_changes(self):
+        """Test new world matrix or objects build a new frame"""
+        renderer = _make_renderer()
+        triangles, _ = renderer.build_frame(0.0)
+        count = len(triangles)
+
+        renderer.world_matrix = Mat4x4.translation_matrix(0.0, 0.0, 200.0)
+        triangles, _ = renderer.build_frame(0.0)
+
+        self.assertFalse(renderer.frame_reused, "Asserting new world matrix builds a new frame")
+        self.assertEqual(0, len(triangles), "Asserting object moved out of the view")
+
+        renderer.world_matrix = renderer._default_world_matrix()
+        renderer.set_objects(renderer.objects)
+        triangles, _ = renderer.build_frame(0.0)
+
+        self.assertFalse(renderer.frame_reused, "Asserting new objects build a new frame")
+        self.assertEqual(count, len(triangles), "Asserting object is back")
+
+    def test_invalidate(self):
+        """Test invalidate forces a new frame"""
+        renderer = _make_renderer()
+        renderer.render_frame(None, 0.0)
+        renderer.invalidate()
+        renderer.render_frame(None, 0.0)
+
+        self.assertFalse(renderer.frame_reused, "Asserting frame was built again")
+        self.assertEqual(2, renderer.backend.frames, "Asserting frame was drawn again")
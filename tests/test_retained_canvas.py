@@ -0,0 +1,108 @@
+import unittest
+
+import numpy as np
+
+from pipeline.backends.retained_canvas import RetainedCanvasBackend
+from pipeline.helpers.frame_stats import FrameStats
+
+
+class _FakeCanvas:
+    """ Canvas keeping items in a dict and running the Tcl commands the backend sends """
+
+    def __init__(self):
+        self.items = {}
+        self.raised = []
+        self.scripts = 0
+        self.tk = self
+
+    def __str__(self):
+        return ".canvas"
+
+    def _create(self, kind: str, coords, **options) -> int:
+        item = len(self.items) + 1
+        self.items[item] = dict(kind=kind, coords=[float(value) for value in coords], **options)
+
+        return item
+
+    def create_polygon(self, *coords, **options) -> int:
+        return self._create("polygon", coords, **options)
+
+    def create_text(self, x, y, **options) -> int:
+        return self._create("text", (x, y), **options)
+
+    def itemconfigure(self, item, **options):
+        self.items[item].update(options)
+
+    def tag_raise(self, tag):
+        self.raised.append(tag)
+
+    def eval(self, script: str):
+        self.scripts += 1
+
+        for command in script.splitlines():
+            path, action, item, *arguments = command.split()
+            item = self.items[int(item)]
+
+            if action == "coords":
+                item["coords"] = [float(value) for value in arguments]
+            else:
+                item[arguments[0][1:]] = arguments[1]
+
+    def polygons(self, state: str) -> [dict]:
+        return [item for item in self.items.values() if item["kind"] == "polygon" and item["state"] == state]
+
+
+def _triangles(depths: [float]) -> np.ndarray:
+    """ Triangles with given depths, x of the first corner tells them apart """
+    return np.array([[[index, 0.0, depth], [1.0, 1.0, depth], [0.0, 1.0, depth]]
+                     for index, depth in enumerate(depths)])
+
+
+class TestRetainedCanvasBackend(unittest.TestCase):
+    """
+    Unit tests for RetainedCanvasBackend
+    """
+
+    def test_items_follow_depth_order(self):
+        """Test farthest triangle goes to the lowest item, all in one script"""
+        window = _FakeCanvas()
+        backend = RetainedCanvasBackend()
+        stats = FrameStats()
+
+        backend.draw_frame(window, _triangles([0.2, 0.9, 0.5]), np.array([1.0, 0.5, 0.1]), stats)
+
+        shown = window.polygons("normal")
+        self.assertEqual(3, len(shown), "Asserting an item for every triangle")
+        self.assertEqual([1.0, 2.0, 0.0], [item["coords"][0] for item in shown], "Asserting back to front")
+        self.assertEqual(backend.shades.hex_color(0.5), shown[0]["fill"], "Asserting fill of farthest triangle")
+        self.assertEqual(1, window.scripts, "Asserting one round trip")
+        self.assertIn("update_items", stats.stage_times, "Asserting stage was timed")
+
+    def test_items_are_reused(self):
+        """Test smaller frames hide items instead of deleting them"""
+        window = _FakeCanvas()
+        backend = RetainedCanvasBackend()
+
+        backend.draw_frame(window, _triangles([0.2, 0.9, 0.5]), np.ones(3))
+        backend.draw_frame(window, _triangles([0.4]), np.ones(1))
+
+        self.assertEqual(3, len(window.items), "Asserting no new items")
+        self.assertEqual(1, len(window.polygons("normal")), "Asserting one item shown")
+        self.assertEqual(2, len(window.polygons("hidden")), "Asserting other items hidden")
+
+        backend.draw_frame(window, _triangles([0.4, 0.3]), np.ones(2))
+
+        self.assertEqual(2, len(window.polygons("normal")), "Asserting hidden item shown again")
+
+    def test_text_stays_on_top(self):
+        """Test text items are reused and raised above new polygons"""
+        window = _FakeCanvas()
+        backend = RetainedCanvasBackend()
+
+        backend.draw_text(window, 5, 5, "first")
+        backend.draw_text(window, 5, 5, "second")
+        backend.draw_frame(window, _triangles([0.5]), np.ones(1))
+
+        texts = [item for item in window.items.values() if item["kind"] == "text"]
+        self.assertEqual(["second"], [item["text"] for item in texts], "Asserting text item reused")
+        self.assertEqual([backend.text_tag], window.raised, "Asserting text raised above new polygons")
@@ -0,0 +1,168 @@
+import unittest
+
+import numpy as np
+
+from math_3d.mat4x4 import Mat4x4
+from pipeline.helpers.instances import Instances
+from pipeline.helpers.model_reader import ModelReader
+from pipeline.renderer import Renderer
+from pipeline.scene_graph import SceneGraph, SceneNode
+from renderer_fixtures import make_renderer, sorted_triangles
+
+
+def _make_renderer(**kwargs):
+    return make_renderer(width=80, height=60, instrument=True, **kwargs)
+
+
+class TestSceneGraph(unittest.TestCase):
+    """
+    Unit tests for SceneGraph
+    """
+
+    def test_world_matrix(self):
+        """Test world matrices compose transforms of the node and its ancestors"""
+        parent_transform = Mat4x4.translation_matrix(1.0, 2.0, 3.0)
+        child_transform = Mat4x4.y_rotation_matrix(0.5)
+
+        graph = SceneGraph(Mat4x4.z_rotation_matrix(0.25))
+        parent = graph.add(SceneNode(transform=parent_transform))
+        child = graph.add(SceneNode(transform=child_transform), parent)
+
+        expected = child_transform @ parent_transform @ graph.root.transform
+        np.testing.assert_allclose(expected.as_array(), child.world_matrix.as_array(), atol=1e-12)
+
+    def test_world_matrix_is_lazy(self):
+        """Test world matrices are composed when asked for and kept"""
+        graph = SceneGraph()
+        node = graph.add(SceneNode(transform=Mat4x4.translation_matrix(1.0, 0.0, 0.0)))
+
+        self.assertFalse(node.is_composed, "Asserting nothing is composed up front")
+
+        world = node.world_matrix
+
+        self.assertTrue(node.is_composed, "Asserting matrix is kept")
+        self.assertIs(world, node.world_matrix, "Asserting kept matrix is returned again")
+
+    def test_moving_a_node_keeps_other_matrices(self):
+        """Test moving a node of a big graph composes its subtree only"""
+        graph = SceneGraph()
+        groups = [graph.add(SceneNode(name=f"group {group}")) for group in range(100)]
+        leaves = [graph.add(SceneNode(), group) for group in groups for _ in range(99)]
+        self.assertEqual(10001, len(list(graph.nodes())), "Asserting graph has 10k nodes below the root")
+
+        before = [node.world_matrix for node in graph.nodes()]
+
+        moved = groups[42]
+        moved.transform = Mat4x4.translation_matrix(0.0, 5.0, 0.0)
+        subtree = set(moved.walk())
+
+        for node in graph.nodes():
+            self.assertEqual(node not in subtree, node.is_composed, "Asserting only the subtree was forgotten")
+
+        after = [node.world_matrix for node in graph.nodes()]
+        recomposed = [node for node, old, new in zip(graph.nodes(), before, after) if old is not new]
+
+        self.assertEqual(subtree, set(recomposed), "Asserting only the subtree was composed again")
+        self.assertEqual(5.0, leaves[42 * 99].world_matrix.as_array()[3, 1], "Asserting leaf moved with its group")
+        self.assertEqual([moved], graph.take_moved(), "Asserting moved node is recorded")
+        self.assertEqual([], graph.take_moved(), "Asserting moves are taken once")
+
+    def test_deep_chain(self):
+        """Test long chains of nodes are composed without recursion"""
+        graph = SceneGraph()
+        node = graph.root
+
+        for _ in range(5000):
+            node = graph.add(SceneNode(transform=Mat4x4.translation_matrix(0.0, 0.0, 1.0)), node)
+
+        self.assertAlmostEqual(5000.0, node.world_matrix.as_array()[3, 2])
+
+    def test_structure_changes(self):
+        """Test adding, moving and removing nodes"""
+        graph = SceneGraph()
+        first = graph.add(SceneNode(transform=Mat4x4.translation_matrix(1.0, 0.0, 0.0)))
+        second = graph.add(SceneNode(transform=Mat4x4.translation_matrix(0.0, 1.0, 0.0)))
+        child = graph.add(SceneNode(name="child"), first)
+        version = graph.structure_version
+
+        np.testing.assert_allclose([1.0, 0.0, 0.0], child.world_matrix.as_array()[3, :3])
+
+        second.add(child)
+
+        self.assertNotEqual(version, graph.structure_version, "Asserting reparenting changes the structure")
+        self.assertEqual([], first.children, "Asserting child left its old parent")
+        np.testing.assert_allclose([0.0, 1.0, 0.0], child.world_matrix.as_array()[3, :3])
+
+        with self.assertRaises(ValueError):
+            child.add(second)
+
+        second.remove(child)
+
+        self.assertIsNone(child.graph, "Asserting removed node left the graph")
+        self.assertIs(child, SceneGraph().add(child), "Asserting removed node can join another graph")
+        self.assertIsNone(graph.find("child"), "Asserting removed node isn't found")
+
+
+class TestRendererScene(unittest.TestCase):
+    """
+    Unit tests for drawing a SceneGraph with the Renderer
+    """
+
+    def setUp(self):
+        self.ship = ModelReader.read_obj_model(r"models/ship.obj", cache=False, lod_levels=0)
+
+    def test_nodes_are_placed_on_their_own(self):
+        """Test every node is drawn by its own world matrix"""
+        offset = Mat4x4.translation_matrix(1.5, -0.5, 2.0)
+
+        scene = SceneGraph(Renderer._default_world_matrix())
+        scene.add(SceneNode(self.ship, offset))
+        triangles, _ = _make_renderer(scene=scene).build_frame(0.0)
+
+        expected_renderer = _make_renderer(objects=[self.ship])
+        expected_renderer.world_matrix = offset @ Renderer._default_world_matrix()
+        expected, _ = expected_renderer.build_frame(0.0)
+
+        np.testing.assert_allclose(sorted_triangles(expected), sorted_triangles(triangles), atol=1e-6)
+
+    def test_moving_a_node(self):
+        """Test moving a node builds a new frame culling only that node"""
+        scene = SceneGraph(Renderer._default_world_matrix())
+        nodes = [
+            scene.add(SceneNode(self.ship)),
+            scene.add(SceneNode(Instances.from_translations(self.ship, [[-2.0, 0.0, 0.0], [2.0, 0.0, 0.0]]))),
+        ]
+        renderer = _make_renderer(scene=scene)
+        renderer.build_frame(0.0)
+        self.assertEqual(0, renderer.stats.objects_culled, "Asserting all entries are in view")
+
+        centers = renderer._world_centers.copy()
+        nodes[0].transform = Mat4x4.translation_matrix(0.0, 0.0, 200.0)
+        renderer.build_frame(0.0)
+
+        self.assertFalse(renderer.frame_reused, "Asserting moved node builds a new frame")
+        self.assertEqual(1, renderer.stats.objects_culled, "Asserting moved node is out of view")
+        np.testing.assert_array_equal(centers[1:], renderer._world_centers[1:])
+
+        nodes[1].transform = Mat4x4.translation_matrix(0.0, 0.0, 200.0)
+        renderer.build_frame(0.0)
+
+        self.assertEqual(3, renderer.stats.objects_culled, "Asserting instances moved with their node")
+
+    def test_added_node_is_drawn(self):
+        """Test nodes added after a frame are drawn by the next one"""
+        scene = SceneGraph(Renderer._default_world_matrix())
+        renderer = _make_renderer(scene=scene)
+        triangles, _ = renderer.build_frame(0.0)
+        self.assertEqual(0, len(triangles), "Asserting empty scene draws nothing")
+
+        scene.add(SceneNode(self.ship))
+        triangles, _ = renderer.build_frame(0.0)
+
+        self.assertFalse(renderer.frame_reused, "Asserting added node builds a new frame")
+        self.assertEqual([self.ship], renderer.objects, "Asserting node is drawn")
+        self.assertLess(0, len(triangles), "Asserting node is drawn")
+
+
+if __name__ == '__main__':
+    unittest.main()
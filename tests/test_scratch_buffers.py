@@ -0,0 +1,45 @@
+import unittest
+
+from pipeline.helpers.scratch_buffers import ScratchBuffers
+
+
+class TestScratchBuffers(unittest.TestCase):
+    """
+    Unit tests for ScratchBuffers
+    """
+
+    def test_get(self):
+        """Test getting a view of requested shape"""
+        buffers = ScratchBuffers()
+        buffer = buffers.get("points", 4, (3, 3))
+
+        self.assertEqual((4, 3, 3), buffer.shape, "Asserting shape of buffer")
+
+    def test_reuses_memory(self):
+        """Test smaller requests reuse the same memory"""
+        buffers = ScratchBuffers()
+        buffers.reserve("points", 10, (3,))
+
+        first = buffers.get("points", 10, (3,))
+        second = buffers.get("points", 5, (3,))
+
+        self.assertTrue(second.base is first.base, "Asserting memory was reused")
+
+    def test_grows(self):
+        """Test buffer grows when more rows are needed"""
+        buffers = ScratchBuffers()
+        buffers.get("points", 2, (3,))
+        buffer = buffers.get("points", 20, (3,))
+
+        self.assertEqual((20, 3), buffer.shape, "Asserting shape of grown buffer")
+        self.assertEqual(20 * 3 * 8, buffers.nbytes, "Asserting memory taken by buffers")
+
+    def test_grow_keeps_rows(self):
+        """Test growing a buffer keeps rows already filled"""
+        buffers = ScratchBuffers()
+        buffers.get("points", 2, (3,))[:] = [[1, 2, 3], [4, 5, 6]]
+
+        buffer = buffers.grow("points", 5, 2, (3,))
+
+        self.assertEqual((5, 3), buffer.shape, "Asserting shape of grown buffer")
+        self.assertEqual([[1, 2, 3], [4, 5, 6]], buffer[:2].tolist(), "Asserting rows were kept")
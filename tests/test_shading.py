@@ -0,0 +1,46 @@
+import unittest
+
+import numpy as np
+
+from pipeline.helpers.shading import ShadeCache, shade_of_triangle
+
+
+class TestShadeCache(unittest.TestCase):
+    """
+    Unit tests for ShadeCache
+    """
+
+    def test_matches_color_conversion(self):
+        """Test cached shades match shading through Color objects"""
+        cache = ShadeCache()
+        intensities = np.linspace(0.1, 1.0, 37)
+
+        expected_rgb = [shade_of_triangle(float(value)).to_rgb() for value in intensities]
+        expected_hex = [shade_of_triangle(float(value)).to_hex() for value in intensities]
+
+        self.assertEqual(expected_rgb, cache.rgb_colors(intensities).tolist(), "Asserting RGB colors")
+        self.assertEqual(expected_hex, cache.hex_colors(intensities), "Asserting hex strings")
+        self.assertEqual(expected_hex[5], cache.hex_color(float(intensities[5])), "Asserting single hex string")
+
+    def test_other_base_color(self):
+        """Test shades of a base color other than green"""
+        cache = ShadeCache()
+
+        self.assertEqual(shade_of_triangle(0.5, (255, 0, 0)).to_hex(), cache.hex_color(0.5, (255, 0, 0)))
+
+    def test_eviction(self):
+        """Test least recently used base colors are dropped"""
+        cache = ShadeCache(levels=4, max_colors=2)
+        cache.hex_color(1.0, (255, 0, 0))
+        cache.hex_color(1.0, (0, 255, 0))
+        cache.hex_color(1.0, (255, 0, 0))  # Red used more recently than green
+        cache.hex_color(1.0, (0, 0, 255))
+
+        self.assertEqual(2, len(cache), "Asserting size is bounded")
+        self.assertEqual([(255, 0, 0), (0, 0, 255)], list(cache._tables), "Asserting green was dropped")
+
+    def test_intensity_out_of_range(self):
+        """Test intensities outside of [0, 1] are clipped"""
+        cache = ShadeCache()
+
+        self.assertEqual([[0, 0, 0], [0, 255, 0]], cache.rgb_colors([-0.5, 2.0]).tolist())
@@ -0,0 +1,75 @@
+import sys
+import unittest
+
+import numpy as np
+
+from pipeline.rasterizer import Rasterizer
+
+if sys.version_info < (3, 8):
+    raise unittest.SkipTest("Shared memory of the tiled rasterizer needs Python 3.8")
+
+from pipeline.tiled_rasterizer import TiledRasterizer, bin_triangles
+
+
+def _random_triangles(count: int, size: int, seed: int = 0) -> (np.ndarray, np.ndarray):
+    """ Triangles partly off the screen, with random depth and colors """
+    generator = np.random.default_rng(seed)
+    triangles = generator.uniform(-10, size + 10, (count, 3, 3))
+    triangles[:, :, 2] = generator.uniform(0, 1, (count, 3))
+
+    return triangles, generator.integers(0, 256, (count, 3))
+
+
+class TestTiledRasterizer(unittest.TestCase):
+    """
+    Unit tests for TiledRasterizer
+    """
+
+    def test_bin_triangles(self):
+        """Test triangles are binned into every tile their box overlaps"""
+        triangles = np.array([
+            [[1, 1, 0], [5, 1, 0], [1, 5, 0]],  # First tile only
+            [[6, 1, 0], [10, 1, 0], [6, 3, 0]],  # Two tiles across
+            [[30, 30, 0], [40, 30, 0], [30, 40, 0]],  # Off the screen
+        ], dtype=np.float64)
+
+        tiles = bin_triangles(triangles, 12, 10, 8)
+
+        self.assertEqual([(0, 0, 8, 8), (8, 0, 12, 8)], [tile[:4] for tile in tiles], "Asserting tile bounds")
+        self.assertEqual([0, 1], tiles[0][4].tolist(), "Asserting triangles of first tile in order")
+        self.assertEqual([1], tiles[1][4].tolist(), "Asserting triangles of second tile")
+
+    def test_matches_rasterizer(self):
+        """Test tiles drawn by workers give the frame Rasterizer draws"""
+        triangles, colors = _random_triangles(200, 50)
+
+        serial = Rasterizer(50, 40)
+        drawn = serial.draw_triangles(triangles, colors)
+
+        with TiledRasterizer(50, 40, workers=2, tile_size=16) as tiled:
+            for _ in range(2):
+                tiled.clear()
+                self.assertEqual(drawn, tiled.draw_triangles(triangles, colors), "Asserting covered triangles")
+
+            self.assertTrue(np.array_equal(serial.color, tiled.color), "Asserting colors")
+            self.assertTrue(np.array_equal(serial.depth, tiled.depth), "Asserting depth")
+
+            # More triangles than shared memory was made for
+            more, more_colors = _random_triangles(500, 50, seed=1)
+            serial.clear()
+            tiled.clear()
+            serial.draw_triangles(more, more_colors)
+            tiled.draw_triangles(more, more_colors)
+
+            self.assertTrue(np.array_equal(serial.color, tiled.color), "Asserting colors after growing")
+
+    def test_nothing_on_screen(self):
+        """Test frame without visible triangles only has background"""
+        with TiledRasterizer(8, 8, workers=1, background=(1, 2, 3)) as tiled:
+            self.assertEqual(0, tiled.draw_triangles(np.empty((0, 3, 3)), np.empty((0, 3))))
+            self.assertEqual([1, 2, 3], tiled.color[7, 7].tolist(), "Asserting background color")
+            self.assertTrue(tiled.to_ppm().startswith(b"P6 8 8 255\n"), "Asserting PPM header")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -82,3 +82,35 @@ class TestVec3(unittest.TestCase):
         self.assertEqual(0.8, vec.x, "Asserting vec3.x")
         self.assertEqual(0.6, vec.y, "Asserting vec3.y")
         self.assertEqual(0, vec.z, "Asserting vec3.z")
+
+    def test_in_place(self):
+        """ Testing +=, -= and *= change the vector itself """
+        vec = Vec3(1, 2, 3)
+        same = vec
+
+        vec += Vec3(1, 1, 1)
+        vec -= Vec3(0, 1, 2)
+        vec *= 2
+
+        self.assertIs(same, vec, "Asserting no new vector")
+        self.assertEqual(Vec3(4, 4, 4), vec, "Asserting values")
+
+        vec *= Vec3(1, 0, 0)
+        self.assertEqual(4, vec, "Asserting *= with a vector is the dot-product")
+
+    def test_into(self):
+        """ Testing *_into methods write into the given vector """
+        vec_a = Vec3(2, 3, 4)
+        vec_b = Vec3(5, 6, 7)
+        out = Vec3(0, 0, 0)
+
+        self.assertIs(out, vec_a.add_into(vec_b, out), "Asserting out is returned")
+        self.assertEqual(Vec3(7, 9, 11), out, "Asserting add_into")
+        self.assertEqual(Vec3(-3, -3, -3), vec_a.sub_into(vec_b, out), "Asserting sub_into")
+        self.assertEqual(Vec3(4, 6, 8), vec_a.scale_into(2, out), "Asserting scale_into")
+        self.assertEqual(Vec3(-3, 6, -3), vec_a.cross_into(vec_b, vec_a), "Asserting cross_into of itself")
+
+    def test_slots(self):
+        """ Testing vectors have no per-instance dictionary """
+        with self.assertRaises(AttributeError):
+            Vec3(1, 2, 3).w = 1